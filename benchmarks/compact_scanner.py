@@ -0,0 +1,51 @@
+"""
+Compare the compact response scanner with the XML parser on a large
+QuoteListByDate2 payload.
+
+Usage:
+
+    python benchmarks/compact_scanner.py [number of quotes]
+"""
+import sys
+import timeit
+import xml.etree.ElementTree as ET
+
+from eoddata_client.compact_scanner import QUOTE_COMPACT_ATTRIBUTES, \
+    QUOTE_COMPACT_DATETIME, QUOTE_COMPACT_TEXT, scan_compact
+
+RESPONSE = '<?xml version="1.0" encoding="utf-8"?>' \
+           '<RESPONSE Source="Data Access Web Service" Message="Success" ' \
+           'xmlns="http://ws.eoddata.com/Data"><QUOTES2>{0}</QUOTES2>' \
+           '</RESPONSE>'
+
+QUOTE2 = '<QUOTE2 s="S{0}" d="2017-09-26T00:00:00" o="1.5" h="2.25" ' \
+         'l="0.5" c="1.75" v="{0}00" i="0" b="0" a="0" />'
+
+
+def main(count=200000):
+    content = RESPONSE.format(
+        ''.join(QUOTE2.format(i) for i in range(count))
+    ).encode('utf-8')
+    print('QuoteListByDate2 payload: {0} quotes, {1:.1f} MB'.format(
+        count, len(content) / 1e6
+    ))
+
+    def best(func):
+        return min(timeit.repeat(func, number=1, repeat=5))
+
+    timings = (
+        ('copy (memory read)', lambda: bytes(bytearray(content))),
+        ('utf-8 decode', lambda: content.decode('utf-8')),
+        ('scanner (typed)', lambda: scan_compact(
+            content, 'QUOTES2', QUOTE_COMPACT_ATTRIBUTES,
+            text=QUOTE_COMPACT_TEXT, datetimes=QUOTE_COMPACT_DATETIME
+        )),
+        ('ElementTree (raw)', lambda: [el.attrib
+                                       for el in ET.fromstring(content)[0]]),
+    )
+    for name, func in timings:
+        print('{0:20} {1:.3f} s'.format(name, best(func)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,355 @@
+"""
+Load test of concurrent client calls against a local stub web service.
+
+The stub serves QuoteGet and QuoteList over HTTP on localhost, issues
+tokens that expire after a configurable time and injects errors (HTTP
+500 and spurious 'Invalid Token' responses). Caller threads share one
+client (or have a client each) and call an endpoint in a loop. The
+report has throughput, latency percentiles, the number of logins and
+the error breakdown, so concurrency changes (token refresh, retry
+limits, connection reuse) can be measured before they ship.
+
+Usage:
+
+    python benchmarks/load_test.py --callers 50 --duration 10
+    python benchmarks/load_test.py --callers 200 --token-ttl 1 \
+        --invalid-token-rate 0.01 --error-rate 0.01 --session
+"""
+import argparse
+import datetime
+import random
+import socketserver
+import threading
+import time
+
+from collections import Counter, OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import requests
+
+from eoddata_client import EodDataHttpClient
+from eoddata_client.eoddata_client import MSG_INVALID_TOKEN, \
+    MSG_LOGIN_SUCCESS, MSG_SUCCESS
+
+RESPONSE = '<?xml version="1.0" encoding="utf-8"?>' \
+           '<RESPONSE Source="Data Access Web Service" Message="{message}" ' \
+           'xmlns="http://ws.eoddata.com/Data"{token}>{body}</RESPONSE>'
+
+QUOTE = '<QUOTE Symbol="{0}" Description="{0} Inc" Name="{0} Inc" ' \
+        'DateTime="2017-09-26T00:00:00" Open="73.67" High="73.81" ' \
+        'Low="72.99" Close="73.26" Volume="18019500" OpenInterest="0" ' \
+        'Previous="73.26" Change="0" Bid="0" Ask="0" ' \
+        'PreviousClose="73.26" NextOpen="0" ' \
+        'Modified="2017-09-26T16:00:00" />'
+
+PERCENTILES = (50, 90, 99)
+
+
+class _Server(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StubService(object):
+    """Local HTTP stand-in of the EodData web service.
+
+    Attributes:
+        logins (int): Number of logins.
+        requests (collections.Counter): Number of requests per endpoint.
+        responses (collections.Counter): Number of responses per kind
+            ('ok', 'expired token', 'invalid token', 'error').
+    """
+
+    def __init__(self, token_ttl=None, single_session=False, error_rate=0.0,
+                 invalid_token_rate=0.0, latency=0.0, quotes=100, seed=0):
+        """
+        Args:
+            token_ttl (float or None): Seconds a token is valid.
+            single_session (bool): Login invalidates previous tokens.
+            error_rate (float): Share of requests answered with HTTP 500.
+            invalid_token_rate (float): Share of requests answered with
+                'Invalid Token' although the token is valid.
+            latency (float): Seconds to wait before every response.
+            quotes (int): Number of quotes of QuoteList responses.
+            seed (int): Seed of error injection.
+        """
+        self.token_ttl = token_ttl
+        self.single_session = single_session
+        self.error_rate = error_rate
+        self.invalid_token_rate = invalid_token_rate
+        self.latency = latency
+        self.logins = 0
+        self.requests = Counter()
+        self.responses = Counter()
+        self._tokens = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._quote_list = RESPONSE.format(
+            message=MSG_SUCCESS, token='', body='<QUOTES>{0}</QUOTES>'.format(
+                ''.join(QUOTE.format('S{0}'.format(i)) for i in range(quotes))
+            )
+        ).encode('utf-8')
+        self._server = _Server(('127.0.0.1', 0), self._handler_class())
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return 'http://127.0.0.1:{0}/'.format(self._server.server_port)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def counters(self):
+        """Get consistent copies of the counters.
+
+        Returns:
+            tuple: Logins, requests and responses counters.
+        """
+        with self._lock:
+            return (self.logins, Counter(self.requests),
+                    Counter(self.responses))
+
+    def login(self):
+        with self._lock:
+            self.logins += 1
+            token = 'T{0}'.format(self.logins)
+            if self.single_session:
+                self._tokens.clear()
+            self._tokens[token] = time.monotonic()
+        return RESPONSE.format(message=MSG_LOGIN_SUCCESS,
+                               token=' Token="{0}"'.format(token),
+                               body='').encode('utf-8')
+
+    def respond(self, endpoint, params):
+        """Get (status code, body) of a request."""
+        token = params.get('Token', [''])[0]
+        with self._lock:
+            self.requests[endpoint] += 1
+            issued = self._tokens.get(token)
+            draw = self._random.random()
+        expired = issued is None or (
+            self.token_ttl is not None
+            and time.monotonic() - issued > self.token_ttl
+        )
+        if expired:
+            kind = 'expired token'
+        elif draw < self.error_rate:
+            kind = 'error'
+        elif draw < self.error_rate + self.invalid_token_rate:
+            kind = 'invalid token'
+        else:
+            kind = 'ok'
+        with self._lock:
+            self.responses[kind] += 1
+        if kind == 'error':
+            return 500, b'Internal Server Error'
+        if kind != 'ok':
+            return 200, RESPONSE.format(message=MSG_INVALID_TOKEN, token='',
+                                        body='').encode('utf-8')
+        if endpoint == 'QuoteList':
+            return 200, self._quote_list
+        if endpoint == 'QuoteGet':
+            return 200, RESPONSE.format(
+                message=MSG_SUCCESS, token='',
+                body=QUOTE.format(params['Symbol'][0])
+            ).encode('utf-8')
+        return 404, b'Not Found'
+
+    def _handler_class(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive, so that connection reuse can be measured
+            protocol_version = 'HTTP/1.1'
+
+            def _send(self, status, body):
+                if service.latency:
+                    time.sleep(service.latency)
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/xml; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                self._send(*service.respond(url.path.rsplit('/', 1)[-1],
+                                            parse_qs(url.query)))
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                self.rfile.read(length)
+                self._send(200, service.login())
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def percentile_report(latencies):
+    """Get latency percentiles in milliseconds."""
+    if not latencies:
+        return {}
+    values = np.array(latencies) * 1000
+    report = OrderedDict(('p{0}'.format(p), float(np.percentile(values, p)))
+                         for p in PERCENTILES)
+    report['max'] = float(values.max())
+    return report
+
+
+def run_load(service, callers=50, duration=10.0, endpoint='quote_detail',
+             shared_client=True, session=False, max_login_retries=3):
+    """Call an endpoint from concurrent threads for a while.
+
+    Args:
+        service (StubService): Running stub service.
+        callers (int): Number of caller threads.
+        duration (float): Seconds to run.
+        endpoint (str): 'quote_detail' or 'quote_list'.
+        shared_client (bool): Callers share one client, otherwise every
+            caller has its own client.
+        session (bool): Clients send requests with a `requests.Session`
+            (connection reuse) instead of a connection per request.
+        max_login_retries (int): Retry limit of the clients.
+
+    Returns:
+        dict: Report.
+    """
+    def make_client():
+        transport = requests.Session() if session else None
+        if transport is not None:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=callers)
+            transport.mount('http://', adapter)
+        return EodDataHttpClient('user', 'password',
+                                 base_url=service.base_url,
+                                 max_login_retries=max_login_retries,
+                                 transport=transport)
+
+    def call(client, i):
+        if endpoint == 'quote_list':
+            return client.quote_list('nasdaq')
+        return client.quote_detail('nasdaq', 'S{0}'.format(i % 100))
+
+    shared = make_client() if shared_client else None
+    latencies = []
+    errors = Counter()
+    lock = threading.Lock()
+    barrier = threading.Barrier(callers + 1)
+    # the service may have served earlier runs
+    logins_before, requests_before, responses_before = service.counters()
+
+    def caller():
+        client = shared or make_client()
+        own_latencies = []
+        own_errors = Counter()
+        barrier.wait()
+        i = 0
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            try:
+                call(client, i)
+            except Exception as e:
+                own_errors[type(e).__name__] += 1
+            own_latencies.append(time.perf_counter() - started)
+            i += 1
+        with lock:
+            latencies.extend(own_latencies)
+            errors.update(own_errors)
+
+    threads = [threading.Thread(target=caller) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    stop_at = time.perf_counter() + duration
+    started = time.perf_counter()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    calls = len(latencies)
+    logins, requests_made, responses = service.counters()
+    return {
+        'callers': callers,
+        'calls': calls,
+        'failed calls': sum(errors.values()),
+        'throughput': calls / elapsed,
+        'latency ms': percentile_report(latencies),
+        'logins': logins - logins_before,
+        'errors': dict(errors),
+        'requests': dict(requests_made - requests_before),
+        'responses': dict(responses - responses_before),
+    }
+
+
+def print_report(report):
+    print('{0} callers: {1} calls ({2} failed), {3:.1f} calls/s'.format(
+        report['callers'], report['calls'], report['failed calls'],
+        report['throughput']
+    ))
+    print('latency ms: ' + ', '.join(
+        '{0} {1:.1f}'.format(name, value)
+        for name, value in report['latency ms'].items()
+    ))
+    print('logins: {0}'.format(report['logins']))
+    print('errors: {0}'.format(report['errors'] or 'none'))
+    print('service requests: {0}'.format(report['requests']))
+    print('service responses: {0}'.format(report['responses']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--callers', type=int, default=50)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--endpoint', choices=('quote_detail', 'quote_list'),
+                        default='quote_detail')
+    parser.add_argument('--client-per-caller', action='store_true',
+                        help='every caller has its own client')
+    parser.add_argument('--session', action='store_true',
+                        help='reuse connections with requests.Session')
+    parser.add_argument('--max-login-retries', type=int, default=3)
+    parser.add_argument('--token-ttl', type=float, default=None,
+                        help='seconds a token is valid')
+    parser.add_argument('--single-session', action='store_true',
+                        help='login invalidates previous tokens')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='share of HTTP 500 responses')
+    parser.add_argument('--invalid-token-rate', type=float, default=0.0,
+                        help="share of spurious 'Invalid Token' responses")
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds of service latency')
+    parser.add_argument('--quotes', type=int, default=100,
+                        help='number of quotes of QuoteList responses')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    service = StubService(
+        token_ttl=args.token_ttl, single_session=args.single_session,
+        error_rate=args.error_rate,
+        invalid_token_rate=args.invalid_token_rate, latency=args.latency,
+        quotes=args.quotes, seed=args.seed
+    ).start()
+    print('{0:%Y-%m-%d %H:%M:%S} stub service at {1}'.format(
+        datetime.datetime.now(), service.base_url
+    ))
+    try:
+        print_report(run_load(
+            service, callers=args.callers, duration=args.duration,
+            endpoint=args.endpoint,
+            shared_client=not args.client_per_caller, session=args.session,
+            max_login_retries=args.max_login_retries
+        ))
+    finally:
+        service.stop()
+
+
+if __name__ == '__main__':
+    main()
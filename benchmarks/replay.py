@@ -0,0 +1,48 @@
+"""
+Parsing throughput of recorded responses.
+
+Parses every response of a cassette (see `eoddata_client.cassettes`)
+with the XML backends and reports throughput per endpoint, so parser
+changes are measured offline on real payloads.
+
+Usage:
+
+    python benchmarks/replay.py cassette.json.gz [repeats]
+"""
+import sys
+import time
+
+from collections import defaultdict
+
+from eoddata_client.cassettes import Cassette
+from eoddata_client.xml_parsing import XML_BACKENDS, XmlBackendError, \
+    get_xml_backend
+
+
+def main(path, repeats=5):
+    cassette = Cassette.load(path)
+    payloads = defaultdict(list)
+    for interaction in cassette.interactions:
+        payloads[interaction['endpoint']].append(
+            interaction['content'].encode('latin-1')
+        )
+    for name in sorted(XML_BACKENDS):
+        try:
+            backend = get_xml_backend(name)
+        except XmlBackendError as e:
+            print('{0}: {1}'.format(name, e))
+            continue
+        for endpoint, contents in sorted(payloads.items()):
+            size = sum(len(content) for content in contents)
+            started = time.perf_counter()
+            for _ in range(repeats):
+                for content in contents:
+                    backend.fromstring(content)
+            elapsed = (time.perf_counter() - started) / repeats
+            print('{0:7} {1:32} {2:4} responses {3:8.2f} MB '
+                  '{4:8.1f} MB/s'.format(name, endpoint, len(contents),
+                                         size / 1e6, size / 1e6 / elapsed))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1], *[int(arg) for arg in sys.argv[2:3]])
@@ -0,0 +1,70 @@
+"""
+Compare peak memory of parsing a large SymbolHistory response from
+decoded text and from raw bytes.
+
+Usage:
+
+    python benchmarks/response_memory.py [number of quotes]
+"""
+import datetime
+import sys
+import time
+import tracemalloc
+
+import requests
+
+from eoddata_client.xml_parsing import get_xml_backend
+
+RESPONSE = '<?xml version="1.0" encoding="utf-8"?>' \
+           '<RESPONSE Source="Data Access Web Service" Message="Success" ' \
+           'xmlns="http://ws.eoddata.com/Data"><QUOTES>{0}</QUOTES>' \
+           '</RESPONSE>'
+
+QUOTE = '<QUOTE Symbol="MSFT" Description="Microsoft Corp" ' \
+        'Name="Microsoft Corp" DateTime="{0:%Y-%m-%dT%H:%M:%S}" ' \
+        'Open="73.67" High="73.81" Low="72.99" Close="73.26" ' \
+        'Volume="18019500" OpenInterest="0" Previous="73.26" Change="0" ' \
+        'Bid="0" Ask="0" PreviousClose="73.26" NextOpen="0" ' \
+        'Modified="2017-09-26T16:00:00" />'
+
+
+def symbol_history_response(count):
+    """Get response like the one of requests without charset header."""
+    start = datetime.datetime(1990, 1, 1)
+    body = RESPONSE.format(''.join(
+        QUOTE.format(start + datetime.timedelta(minutes=i))
+        for i in range(count)
+    ))
+    response = requests.models.Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = 'text/xml'
+    response._content = body.encode('utf-8')
+    return response
+
+
+def measure(parse, count):
+    response = symbol_history_response(count)
+    tracemalloc.start()
+    started = time.perf_counter()
+    root = parse(response)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del root
+    return len(response.content), peak, elapsed
+
+
+def main(count=100000):
+    backend = get_xml_backend('stdlib')
+    cases = (
+        ('response.text', lambda r: backend.fromstring(r.text)),
+        ('response.content', lambda r: backend.fromstring(r.content)),
+    )
+    for name, parse in cases:
+        size, peak, elapsed = measure(parse, count)
+        print('{0:18} body {1:.1f} MB, peak {2:.1f} MB above body, '
+              '{3:.2f} s'.format(name, size / 1e6, peak / 1e6, elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,63 @@
+"""
+Compare XML parser backends on a large QuoteList payload.
+
+Usage:
+
+    python benchmarks/xml_backends.py [number of quotes]
+"""
+import sys
+import timeit
+
+from eoddata_client.business_entities import EodDataQuoteExtended
+from eoddata_client.xml_parsing import XML_BACKENDS, XmlBackendError
+
+RESPONSE = '<?xml version="1.0" encoding="utf-8"?>' \
+           '<RESPONSE Source="Data Access Web Service" Message="Success" ' \
+           'xmlns="http://ws.eoddata.com/Data"><QUOTES>{0}</QUOTES>' \
+           '</RESPONSE>'
+
+QUOTE = '<QUOTE Symbol="S{0}" Description="S{0} Inc" Name="S{0} Inc" ' \
+        'DateTime="2017-09-26T00:00:00" Open="1.5" High="2.25" Low="0.5" ' \
+        'Close="1.75" Volume="{0}00" OpenInterest="0" Previous="1.5" ' \
+        'Change="0.25" Bid="0" Ask="0" PreviousClose="1.5" NextOpen="0" ' \
+        'Modified="2017-09-26T16:00:00" />'
+
+
+def payload(count):
+    return RESPONSE.format(''.join(QUOTE.format(i) for i in range(count)))
+
+
+def benchmark(backend, text, repeat=5):
+    """Get best parse and parse + entity build times in seconds."""
+    def parse():
+        return backend.fromstring(text)
+
+    def build():
+        quotes_xml = list(parse()[0])
+        string_pool = {}
+        return [EodDataQuoteExtended.from_xml(quote_xml, string_pool)
+                for quote_xml in quotes_xml]
+
+    return (min(timeit.repeat(parse, number=1, repeat=repeat)),
+            min(timeit.repeat(build, number=1, repeat=repeat)))
+
+
+def main(count=50000):
+    text = payload(count)
+    print('QuoteList payload: {0} quotes, {1:.1f} MB'.format(
+        count, len(text) / 1e6
+    ))
+    for name, backend_class in sorted(XML_BACKENDS.items()):
+        try:
+            backend = backend_class()
+        except XmlBackendError as e:
+            print('{0:8} skipped: {1}'.format(name, e))
+            continue
+        parse_time, build_time = benchmark(backend, text)
+        print('{0:8} parse {1:.3f} s, parse + entities {2:.3f} s'.format(
+            name, parse_time, build_time
+        ))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
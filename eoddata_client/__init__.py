@@ -7,8 +7,19 @@ from .business_entities import (
     EodDataQuoteExtended,
     EodDataQuoteCompact,
     EodDataExchange,
+    EodDataSplit,
     EodDataSymbol,
-    EodDataSymbolCompact
+    EodDataSymbolCompact,
+    EodDataFundamental,
+    EodDataTechnical
 )
 
+from .cassettes import RecordingTransport, ReplayTransport
+from .conditional import ConditionalFetcher
+from .polling import QuotePoller
+from .quote_cache import QuoteCache
+from .snapshot import MarketSnapshot
+from .symbol_index import SymbolIndex
+from .token_store import FileTokenStore, MemoryTokenStore
+
 __version__ = '0.3.3'
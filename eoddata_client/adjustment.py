@@ -0,0 +1,137 @@
+"""
+Split adjustment of stored quotes.
+"""
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+VOLUME_COLUMNS = ('Volume',)
+
+
+def split_factors(datetimes, split_datetimes, factors):
+    """Get cumulative split factor of every quote.
+
+    Quote is adjusted by all splits that happened after it.
+
+    Args:
+        datetimes (numpy.ndarray): Quote datetimes (datetime64).
+        split_datetimes (numpy.ndarray): Split datetimes (datetime64).
+        factors (numpy.ndarray): New shares per one old share of every split.
+
+    Returns:
+        numpy.ndarray: Factor of every quote, prices are divided
+            and volumes are multiplied by it.
+    """
+    split_datetimes = np.asarray(split_datetimes, dtype='datetime64[ns]')
+    factors = np.asarray(factors, dtype=float)
+    order = np.argsort(split_datetimes, kind='mergesort')
+    split_datetimes = split_datetimes[order]
+    factors = factors[order]
+    # cumulative[i] is the product of factors of splits i, i + 1, ...
+    cumulative = np.append(np.cumprod(factors[::-1])[::-1], 1.0)
+    positions = np.searchsorted(split_datetimes,
+                                np.asarray(datetimes, dtype='datetime64[ns]'),
+                                side='right')
+    return cumulative[positions]
+
+
+def adjust_arrays(datetimes, prices, volumes, split_datetimes, factors):
+    """Adjust quote arrays for splits in place.
+
+    Args:
+        datetimes (numpy.ndarray): Quote datetimes (datetime64).
+        prices (numpy.ndarray): Float prices, one row per quote (2-D) or
+            one price per quote (1-D).
+        volumes (numpy.ndarray or None): Volumes, one per quote.
+        split_datetimes (numpy.ndarray): Split datetimes.
+        factors (numpy.ndarray): New shares per one old share of every split.
+
+    Returns:
+        numpy.ndarray: Factor of every quote.
+    """
+    quote_factors = split_factors(datetimes, split_datetimes, factors)
+    if prices.ndim == 2:
+        np.divide(prices, quote_factors[:, None], out=prices)
+    else:
+        np.divide(prices, quote_factors, out=prices)
+    if volumes is not None:
+        if np.issubdtype(volumes.dtype, np.integer):
+            volumes[:] = np.rint(volumes * quote_factors)
+        else:
+            np.multiply(volumes, quote_factors, out=volumes)
+    return quote_factors
+
+
+def adjust_for_splits(df, splits, symbol=None):
+    """Adjust quotes for splits in place.
+
+    Prices of quotes before a split are divided and volumes are multiplied
+    by the split factor, so history does not have to be downloaded again
+    after a split.
+
+    Args:
+        df (pandas.DataFrame): Quotes of a single symbol, or of several
+            symbols with `Symbol` column, with datetime index.
+        splits (list of EodDataSplit or pandas.DataFrame): Splits,
+            data frame is expected in 'data-frame' output format.
+        symbol (str or None): Symbol of quotes without `Symbol` column,
+            only its splits are applied (for example splits of an entire
+            exchange). Required if the splits are of several symbols.
+
+    Returns:
+        pandas.DataFrame: The same data frame.
+
+    Raises:
+        ValueError: If quotes have no `Symbol` column, `symbol` is not
+            given and the splits are of several symbols.
+    """
+    if isinstance(splits, pd.DataFrame):
+        split_datetimes = splits.index.values
+        factors = splits['Factor'].values
+        split_symbols = splits['Symbol'].values
+    else:
+        split_datetimes = [split.split_datetime for split in splits]
+        factors = [split.factor for split in splits]
+        split_symbols = [split.symbol for split in splits]
+    split_datetimes = np.asarray(split_datetimes, dtype='datetime64[ns]')
+    factors = np.asarray(factors, dtype=float)
+    split_symbols = np.asarray(split_symbols, dtype=object)
+    # splits with invalid ratios (and of other symbols) are ignored
+    valid = ~np.isnan(factors)
+    if 'Symbol' not in df.columns:
+        if symbol is not None:
+            valid &= split_symbols == symbol.upper()
+        elif len(set(split_symbols)) > 1:
+            raise ValueError('Splits of several symbols, specify symbol '
+                             'of the quotes.')
+    if not valid.all():
+        split_datetimes = split_datetimes[valid]
+        factors = factors[valid]
+        split_symbols = split_symbols[valid]
+    if not len(factors) or not len(df):
+        return df
+
+    datetimes = df.index.values
+    quote_factors = np.ones(len(df))
+    if 'Symbol' in df.columns:
+        symbols = df['Symbol'].astype(object).values
+        for symbol in np.unique(split_symbols):
+            rows = symbols == symbol
+            selected = split_symbols == symbol
+            quote_factors[rows] = split_factors(datetimes[rows],
+                                                split_datetimes[selected],
+                                                factors[selected])
+    else:
+        quote_factors = split_factors(datetimes, split_datetimes, factors)
+
+    for column in PRICE_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].values / quote_factors
+    for column in VOLUME_COLUMNS:
+        if column in df.columns:
+            volumes = df[column].values * quote_factors
+            if np.issubdtype(df[column].dtype, np.integer):
+                volumes = np.rint(volumes).astype(df[column].dtype)
+            df[column] = volumes
+    return df
@@ -1,11 +1,52 @@
 import logging
+import re
 
 import pandas as pd
 
-from eoddata_client.utils import string_to_datetime
+from eoddata_client.utils import intern_string, string_to_datetime
 
 logger = logging.getLogger(__name__)
 
+# repeated string columns of quote data frames (symbols of histories)
+CATEGORICAL_COLUMNS = ('Symbol',)
+
+# data frame column of validation problems of flagged quotes
+PROBLEMS_COLUMN = 'Problems'
+
+
+def categorize_columns(df, columns):
+    """Convert string columns of a data frame to `category` dtype.
+
+    Args:
+        df (pandas.DataFrame): Data frame.
+        columns (iterable of str): Columns to convert, missing columns
+            are ignored.
+
+    Returns:
+        pandas.DataFrame
+    """
+    for column in columns:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df
+
+
+def add_problems_column(df, problems):
+    """Add validation problems of flagged quotes to a data frame.
+
+    Args:
+        df (pandas.DataFrame): Quotes.
+        problems (list): Tuple of problems of every row, or None if
+            the row was not flagged.
+
+    Returns:
+        pandas.DataFrame: Data frame with `Problems` column (comma
+            separated problems, empty if none) if any row was flagged.
+    """
+    if any(row is not None for row in problems):
+        df[PROBLEMS_COLUMN] = [', '.join(row or ()) for row in problems]
+    return df
+
 
 class EodDataExchange(object):
     """EodData Exchange.
@@ -141,8 +182,12 @@ class EodDataQuoteCompact(object):
         open_interest (int): Open interest.
         before (float): 
         after (float):
+        problems (tuple of str or None): Validation problems of the quote
+            in 'flag' validation mode, None if quotes are not flagged.
     """
 
+    problems = None
+
     def __init__(self, symbol, quote_datetime,
                  open, high, low, close,
                  volume, open_interest, before,
@@ -160,16 +205,21 @@ class EodDataQuoteCompact(object):
         self.after = after
 
     @classmethod
-    def from_xml(cls, xml_quote):
+    def from_xml(cls, xml_quote, string_pool=None):
         """Get instance from xml.
 
+        Args:
+            xml_quote: Quote XML element.
+            string_pool (dict or None): Strings shared between quotes
+                of the same response.
+
         Returns:
             EodDataQuoteCompact instance or None.
         """
         quote_dict = xml_quote.attrib
         try:
             return cls(
-                symbol=quote_dict['s'],
+                symbol=intern_string(quote_dict['s'], string_pool),
                 quote_datetime=string_to_datetime(quote_dict['d']),
                 open=float(quote_dict['o']),
                 high=float(quote_dict['h']),
@@ -209,8 +259,9 @@ class EodDataQuoteCompact(object):
             index.append(d[index_column])
             del d[index_column]
             data.append(d)
-        return pd.DataFrame(data=data, index=index,
-                            columns=columns)
+        df = pd.DataFrame(data=data, index=index, columns=columns)
+        add_problems_column(df, [quote.problems for quote in quote_list])
+        return categorize_columns(df, CATEGORICAL_COLUMNS)
 
     @classmethod
     def format(cls, quote_list, input_format='entity-list', output_format=None,
@@ -256,9 +307,13 @@ class EodDataQuoteExtended(object):
         modified (datetime): Time of the last update for this security.
         name (str): Full name of a traded asset.
         description (str): Description.
+        problems (tuple of str or None): Validation problems of the quote
+            in 'flag' validation mode, None if quotes are not flagged.
         df_columns (tuple of str): Data frame columns (static attribute).
     """
 
+    problems = None
+
     df_columns = ('Datetime', 'Symbol', 'Open', 'High', 'Low', 'Close',
                   'Volume')
 
@@ -286,16 +341,21 @@ class EodDataQuoteExtended(object):
         self.description = description
 
     @classmethod
-    def from_xml(cls, xml_quote):
+    def from_xml(cls, xml_quote, string_pool=None):
         """Get EodDataQuoteExtended object from xml element.
 
+        Args:
+            xml_quote: Quote XML element.
+            string_pool (dict or None): Strings shared between quotes
+                of the same response.
+
         Returns:
             EodDataQuoteExtended instance or None.
         """
         quote_dict = xml_quote.attrib
         try:
             return cls(
-                symbol=quote_dict['Symbol'],
+                symbol=intern_string(quote_dict['Symbol'], string_pool),
                 quote_datetime=string_to_datetime(quote_dict['DateTime']),
                 open=float(quote_dict['Open']),
                 high=float(quote_dict['High']),
@@ -310,8 +370,9 @@ class EodDataQuoteExtended(object):
                 previous_close=float(quote_dict['PreviousClose']),
                 next_open=float(quote_dict['NextOpen']),
                 modified=string_to_datetime(quote_dict['Modified']),
-                name=quote_dict['Name'],
-                description=quote_dict['Description']
+                name=intern_string(quote_dict['Name'], string_pool),
+                description=intern_string(quote_dict['Description'],
+                                          string_pool)
             )
         except KeyError:
             logger.exception('Missing attribute in XML element.')
@@ -341,8 +402,9 @@ class EodDataQuoteExtended(object):
             index.append(d[index_column])
             del d[index_column]
             data.append(d)
-        return pd.DataFrame(data=data, index=index,
-                            columns=columns)
+        df = pd.DataFrame(data=data, index=index, columns=columns)
+        add_problems_column(df, [quote.problems for quote in quote_list])
+        return categorize_columns(df, CATEGORICAL_COLUMNS)
 
     @classmethod
     def format(cls, quote_list, input_format='entity-list', output_format=None,
@@ -373,6 +435,101 @@ class EodDataQuoteExtended(object):
         return '{0} | {1}'.format(self.symbol, str(self.quote_datetime))
 
 
+class EodDataSplit(object):
+    """EodData stock split.
+
+    Attributes:
+        exchange_code (str): Exchange code.
+        symbol (str): Symbol.
+        split_datetime (datetime): Split date.
+        ratio (str): Split ratio, new shares to old shares (e.g. `2-1`).
+    """
+
+    def __init__(self, exchange_code, symbol, split_datetime, ratio):
+        self.exchange_code = exchange_code
+        self.symbol = symbol
+        self.split_datetime = split_datetime
+        self.ratio = ratio
+
+    @property
+    def factor(self):
+        """float: Number of new shares per one old share, NaN if the ratio
+        is invalid."""
+        try:
+            new_shares, old_shares = re.split(r'[-:/]', self.ratio)
+            return float(new_shares) / float(old_shares)
+        except (ValueError, TypeError, ZeroDivisionError):
+            logger.warning('Invalid split ratio %r of %s.', self.ratio,
+                           self.symbol)
+            return float('nan')
+
+    @classmethod
+    def from_xml(cls, xml_split):
+        """Get EodDataSplit object from xml element.
+
+        Returns:
+            EodDataSplit instance or None.
+        """
+        split_dict = xml_split.attrib
+        try:
+            return cls(
+                exchange_code=split_dict['Exchange'],
+                symbol=split_dict['Symbol'],
+                split_datetime=string_to_datetime(split_dict['DateTime']),
+                ratio=split_dict['Ratio']
+            )
+        except KeyError:
+            logger.exception('Missing attribute in XML element.')
+        except:
+            logger.exception('Unexpected error.')
+
+    def to_dict(self):
+        return {
+            'Datetime': self.split_datetime,
+            'Exchange': self.exchange_code,
+            'Symbol': self.symbol,
+            'Ratio': self.ratio,
+            'Factor': self.factor
+        }
+
+    @classmethod
+    def list_to_df(cls, split_list, index_column='Datetime'):
+        index = []
+        data = []
+        columns = ['Datetime', 'Exchange', 'Symbol', 'Ratio', 'Factor']
+        columns.remove(index_column)
+        for split in split_list:
+            d = split.to_dict()
+            index.append(d[index_column])
+            del d[index_column]
+            data.append(d)
+        return pd.DataFrame(data=data, index=index,
+                            columns=columns)
+
+    @classmethod
+    def format(cls, split_list, input_format='entity-list', output_format=None,
+               df_index='Datetime'):
+        if output_format is None:
+            return split_list
+        elif input_format == output_format:
+            return split_list
+        if input_format == 'entity-list' and output_format == 'data-frame':
+            return cls.list_to_df(split_list, index_column=df_index)
+        else:
+            raise NotImplementedError
+
+    def __repr__(self):
+        return 'EodDataSplit(exchange_code={0}, symbol={1}, ' \
+               'split_datetime={2}, ratio={3})'.format(
+                    self.exchange_code, self.symbol, self.split_datetime,
+                    self.ratio
+                )
+
+    def __str__(self):
+        return '{0} | {1} | {2}'.format(self.symbol, str(self.split_datetime),
+                                        self.ratio)
+
+
 class EodDataSymbol(object):
     """EodData symbol.
 
@@ -515,3 +672,180 @@ class EodDataSymbolCompact(object):
 
     def __str__(self):
         return '{0} | {1}'.format(self.code, self.name)
+
+
+# kinds of attributes of columnar entities
+TEXT = 'text'
+NUMBER = 'number'
+DATETIME = 'datetime'
+
+
+class EodDataColumnarEntity(object):
+    """Entity of an exchange wide list that is parsed into columns
+    (fundamentals, technicals).
+
+    `ATTRIBUTES` lists (XML attribute, entity attribute, kind) of known
+    attributes, other attributes of a response are kept only in data
+    frames and columns output formats.
+    """
+
+    ATTRIBUTES = ()
+
+    def __init__(self, **values):
+        for _, name, _ in self.ATTRIBUTES:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def numeric_columns(cls):
+        """frozenset of str: Numeric XML attributes."""
+        return frozenset(xml_name for xml_name, _, kind in cls.ATTRIBUTES
+                         if kind == NUMBER)
+
+    @classmethod
+    def datetime_columns(cls):
+        """frozenset of str: Datetime XML attributes."""
+        return frozenset(xml_name for xml_name, _, kind in cls.ATTRIBUTES
+                         if kind == DATETIME)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Get entities from typed column arrays (see
+        `eoddata_client.columnar.parse_columns`).
+
+        Returns:
+            list
+        """
+        if not columns:
+            return []
+        count = len(next(iter(columns.values())))
+        values = {}
+        for xml_name, name, kind in cls.ATTRIBUTES:
+            column = columns.get(xml_name)
+            if column is None:
+                continue
+            if kind == DATETIME:
+                column = [None if pd.isnull(value) else value
+                          for value in pd.DatetimeIndex(column)
+                          .to_pydatetime()]
+            else:
+                column = column.tolist()
+            values[name] = column
+        return [cls(**{name: column[i] for name, column in values.items()})
+                for i in range(count)]
+
+    def to_dict(self):
+        return {xml_name: getattr(self, name)
+                for xml_name, name, _ in self.ATTRIBUTES}
+
+    @classmethod
+    def list_to_df(cls, entity_list, index_column='Symbol'):
+        columns = [xml_name for xml_name, _, _ in cls.ATTRIBUTES]
+        df = pd.DataFrame([entity.to_dict() for entity in entity_list],
+                          columns=columns)
+        return df.set_index(index_column)
+
+    @classmethod
+    def format(cls, entity_list, input_format='entity-list',
+               output_format=None, df_index='Symbol'):
+        if output_format is None:
+            return entity_list
+        elif input_format == output_format:
+            return entity_list
+        if input_format == 'entity-list' and output_format == 'data-frame':
+            return cls.list_to_df(entity_list, index_column=df_index)
+        else:
+            raise NotImplementedError
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, ', '.join(
+            '{0}={1}'.format(name, getattr(self, name))
+            for _, name, _ in self.ATTRIBUTES
+        ))
+
+    def __str__(self):
+        return '{0} | {1}'.format(self.symbol, str(self.datetime))
+
+
+class EodDataFundamental(EodDataColumnarEntity):
+    """EodData fundamental data of a symbol.
+
+    Attributes:
+        symbol (str), name (str), description (str),
+        datetime (datetime or None), industry (str), sector (str),
+        shares, market_cap, pe, eps, nta, dividend_yield, dividend
+        (float), dividend_date (datetime or None), dps,
+        imputation_credits, ebitda, peg, price_to_sales, price_to_book,
+        yield_ (float): Attributes of FundamentalList, missing numbers
+        are NaN.
+    """
+
+    ATTRIBUTES = (
+        ('Symbol', 'symbol', TEXT),
+        ('Name', 'name', TEXT),
+        ('Description', 'description', TEXT),
+        ('DateTime', 'datetime', DATETIME),
+        ('Industry', 'industry', TEXT),
+        ('Sector', 'sector', TEXT),
+        ('Shares', 'shares', NUMBER),
+        ('MarketCap', 'market_cap', NUMBER),
+        ('PE', 'pe', NUMBER),
+        ('EPS', 'eps', NUMBER),
+        ('NTA', 'nta', NUMBER),
+        ('DivYield', 'dividend_yield', NUMBER),
+        ('Dividend', 'dividend', NUMBER),
+        ('DividendDate', 'dividend_date', DATETIME),
+        ('DPS', 'dps', NUMBER),
+        ('ImputationCredits', 'imputation_credits', NUMBER),
+        ('EBITDA', 'ebitda', NUMBER),
+        ('PEG', 'peg', NUMBER),
+        ('PtS', 'price_to_sales', NUMBER),
+        ('PtB', 'price_to_book', NUMBER),
+        ('Yield', 'yield_', NUMBER),
+    )
+
+
+class EodDataTechnical(EodDataColumnarEntity):
+    """EodData technical indicators of a symbol.
+
+    Attributes:
+        symbol (str), name (str), description (str),
+        datetime (datetime or None): Symbol and date.
+        previous, change, ma1, ma2, ma5, ma20, ma50, ma100, ma200,
+        ma_percent, ma_return, volume_change, three_month_change,
+        six_month_change, week_high, week_low, week_change,
+        avg_week_change, avg_week_volume, week_volume, month_high,
+        month_low, month_change, avg_month_change, avg_month_volume,
+        month_volume, year_high, year_low, year_change, avg_year_change,
+        avg_year_volume, ytd_change, rsi14, sto9, wpr14, mtm14, roc14,
+        ptc, sar, volatility, liquidity (float): Attributes of
+        TechnicalList, missing numbers are NaN.
+    """
+
+    ATTRIBUTES = (
+        ('Symbol', 'symbol', TEXT),
+        ('Name', 'name', TEXT),
+        ('Description', 'description', TEXT),
+        ('DateTime', 'datetime', DATETIME),
+    ) + tuple((xml_name, name, NUMBER) for xml_name, name in (
+        ('Previous', 'previous'), ('Change', 'change'), ('MA1', 'ma1'),
+        ('MA2', 'ma2'), ('MA5', 'ma5'), ('MA20', 'ma20'), ('MA50', 'ma50'),
+        ('MA100', 'ma100'), ('MA200', 'ma200'), ('MAPercent', 'ma_percent'),
+        ('MAReturn', 'ma_return'), ('VolumeChange', 'volume_change'),
+        ('ThreeMonthChange', 'three_month_change'),
+        ('SixMonthChange', 'six_month_change'), ('WeekHigh', 'week_high'),
+        ('WeekLow', 'week_low'), ('WeekChange', 'week_change'),
+        ('AvgWeekChange', 'avg_week_change'),
+        ('AvgWeekVolume', 'avg_week_volume'), ('WeekVolume', 'week_volume'),
+        ('MonthHigh', 'month_high'), ('MonthLow', 'month_low'),
+        ('MonthChange', 'month_change'),
+        ('AvgMonthChange', 'avg_month_change'),
+        ('AvgMonthVolume', 'avg_month_volume'),
+        ('MonthVolume', 'month_volume'), ('YearHigh', 'year_high'),
+        ('YearLow', 'year_low'), ('YearChange', 'year_change'),
+        ('AvgYearChange', 'avg_year_change'),
+        ('AvgYearVolume', 'avg_year_volume'), ('YTDChange', 'ytd_change'),
+        ('RSI14', 'rsi14'), ('STO9', 'sto9'), ('WPR14', 'wpr14'),
+        ('MTM14', 'mtm14'), ('ROC14', 'roc14'), ('PTC', 'ptc'),
+        ('SAR', 'sar'), ('Volatility', 'volatility'),
+        ('Liquidity', 'liquidity'),
+    ))
@@ -0,0 +1,236 @@
+"""
+Record and replay of EodData web service responses.
+
+`RecordingTransport` sends requests to the web service and records the
+responses to a gzip compressed cassette file, with login credentials and
+tokens scrubbed. `ReplayTransport` serves the recorded responses without
+network, at full speed or with the recorded latency, so tests and
+parsing benchmarks run offline on realistic payloads.
+
+Example:
+
+    with RecordingTransport('nasdaq.json.gz') as transport:
+        client = EodDataHttpClient(username, password, transport=transport)
+        client.quote_list('nasdaq')
+
+    client = EodDataHttpClient('user', 'password',
+                               transport=ReplayTransport('nasdaq.json.gz'))
+    client.quote_list('nasdaq')
+"""
+import gzip
+import json
+import re
+import threading
+import time
+
+import requests
+
+CASSETTE_VERSION = 1
+
+SCRUBBED = 'SCRUBBED'
+
+# request parameters and response attributes with secrets
+SECRET_PARAMETERS = ('Token', 'Username', 'Password')
+TOKEN_ATTRIBUTE = re.compile(br'\bToken="[^"]*"')
+
+
+class Error(Exception):
+    """Base error for this module."""
+
+
+class CassetteError(Error):
+    """Cassette can not be read or has no response for a request."""
+
+
+def _endpoint(url):
+    return url.rstrip('/').rsplit('/', 1)[-1]
+
+
+def _scrub(parameters):
+    return {key: SCRUBBED if key in SECRET_PARAMETERS else str(value)
+            for key, value in (parameters or {}).items()}
+
+
+def _key(method, endpoint, parameters):
+    return (method, endpoint) + tuple(sorted(
+        (key, str(value)) for key, value in (parameters or {}).items()
+        if key not in SECRET_PARAMETERS
+    ))
+
+
+class RecordedResponse(object):
+    """Response served from a cassette.
+
+    Attributes:
+        status_code (int): HTTP status code.
+        content (bytes): Body.
+        elapsed (float): Recorded latency in seconds.
+    """
+
+    def __init__(self, status_code, content, elapsed=0.0):
+        self.status_code = status_code
+        self.content = content
+        self.elapsed = elapsed
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+
+class Cassette(object):
+    """Recorded interactions.
+
+    Attributes:
+        interactions (list of dict): Recorded requests and responses.
+        metadata (dict): Arbitrary data saved with the cassette (for
+            example the date used by recorded tests).
+    """
+
+    def __init__(self, interactions=None, metadata=None):
+        self.interactions = interactions or []
+        self.metadata = metadata or {}
+
+    def add(self, method, url, parameters, response, elapsed):
+        """Record an interaction, secrets are scrubbed."""
+        self.interactions.append({
+            'method': method,
+            'endpoint': _endpoint(url),
+            'parameters': _scrub(parameters),
+            'status_code': response.status_code,
+            'elapsed': elapsed,
+            # latin-1 maps bytes to code points one to one
+            'content': TOKEN_ATTRIBUTE.sub(
+                'Token="{0}"'.format(SCRUBBED).encode('ascii'),
+                response.content
+            ).decode('latin-1'),
+        })
+
+    def save(self, path):
+        """Write cassette to a gzip compressed JSON file."""
+        data = {
+            'version': CASSETTE_VERSION,
+            'metadata': self.metadata,
+            'interactions': self.interactions,
+        }
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path):
+        """Read cassette written by `save`.
+
+        Returns:
+            Cassette
+
+        Raises:
+            CassetteError
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != CASSETTE_VERSION:
+            raise CassetteError('Unsupported cassette version: {0}'.format(
+                data.get('version')
+            ))
+        return cls(data['interactions'], data.get('metadata'))
+
+
+class RecordingTransport(object):
+    """Transport that sends requests with `requests` and records them.
+
+    The cassette is written by `save` or at the end of a `with` block.
+    """
+
+    def __init__(self, path, metadata=None, transport=requests):
+        """
+        Args:
+            path (str): Cassette file path.
+            metadata (dict or None): Data saved with the cassette.
+            transport: Object with `get` and `post` functions
+                (`requests` by default).
+        """
+        self.path = path
+        self.cassette = Cassette(metadata=metadata)
+        self._transport = transport
+        self._lock = threading.Lock()
+
+    def _record(self, method, url, parameters, send):
+        started = time.perf_counter()
+        response = send()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.cassette.add(method, url, parameters, response, elapsed)
+        return response
+
+    def get(self, url, params=None, **kwargs):
+        return self._record('GET', url, params, lambda: self._transport.get(
+            url, params=params, **kwargs
+        ))
+
+    def post(self, url, data=None, **kwargs):
+        return self._record('POST', url, data, lambda: self._transport.post(
+            url, data=data, **kwargs
+        ))
+
+    def save(self):
+        """Write the cassette."""
+        with self._lock:
+            self.cassette.save(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.save()
+
+
+class ReplayTransport(object):
+    """Transport that serves recorded responses.
+
+    Requests are matched by method, endpoint and parameters (token and
+    credentials are ignored). Responses of the same request are served
+    in recorded order, the last one is repeated.
+    """
+
+    def __init__(self, cassette, latency=False):
+        """
+        Args:
+            cassette (Cassette or str): Cassette or its file path.
+            latency (bool): Wait for the recorded latency of every
+                response, otherwise responses are served at full speed.
+        """
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        self.cassette = cassette
+        self.latency = latency
+        self._responses = {}
+        self._served = {}
+        self._lock = threading.Lock()
+        for interaction in cassette.interactions:
+            key = _key(interaction['method'], interaction['endpoint'],
+                       interaction['parameters'])
+            self._responses.setdefault(key, []).append(RecordedResponse(
+                interaction['status_code'],
+                interaction['content'].encode('latin-1'),
+                interaction['elapsed']
+            ))
+
+    def _serve(self, method, url, parameters):
+        key = _key(method, _endpoint(url), parameters)
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise CassetteError('No recorded response for {0} {1} '
+                                    '{2}'.format(method, _endpoint(url),
+                                                 _scrub(parameters)))
+            position = self._served.get(key, 0)
+            self._served[key] = position + 1
+        response = responses[min(position, len(responses) - 1)]
+        if self.latency:
+            time.sleep(response.elapsed)
+        return response
+
+    def get(self, url, params=None, **kwargs):
+        return self._serve('GET', url, params)
+
+    def post(self, url, data=None, **kwargs):
+        return self._serve('POST', url, data)
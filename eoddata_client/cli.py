@@ -0,0 +1,483 @@
+"""
+Command line bulk downloader.
+
+Examples:
+
+    eoddata-client history nasdaq msft aapl --start 1990-01-01 -o data
+    eoddata-client history nasdaq --all-symbols --workers 8 --format parquet
+    eoddata-client quotes nasdaq nyse --start 2017-09-01 --end 2017-09-30
+    eoddata-client quotes nasdaq nyse --start 2017-09-29 --state sync.json
+    eoddata-client symbols nasdaq nyse
+    eoddata-client export nasdaq --start 2000-01-01 --end 2017-09-30
+
+Sharded backfill, every shard can run on a different host:
+
+    eoddata-client plan -m backfill.json history nasdaq --all-symbols
+    eoddata-client -o shard0 run backfill.json --shard 0 --shards 2
+    eoddata-client -o shard1 run backfill.json --shard 1 --shards 2
+    eoddata-client -o merged merge backfill.json shard0 shard1
+
+Credentials are taken from `EOD_DATA_LOGIN` and `EOD_DATA_PASSWORD`
+environment variables unless given as options.
+"""
+import argparse
+import datetime
+import logging
+import os
+import sys
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from eoddata_client.conditional import ConditionalFetcher, SyncStateError
+from eoddata_client.eoddata_client import (
+    EodDataHttpClient, Error as ClientError, InvalidCredentialsError,
+    NoDataAvailableError
+)
+from eoddata_client.export import export_quotes_by_date
+from eoddata_client.manifest import (
+    Manifest, ManifestError, merge_shards, plan_history, plan_quotes,
+    write_shard_status
+)
+
+logger = logging.getLogger(__name__)
+
+EXIT_OK = 0
+EXIT_PARTIAL_FAILURE = 1
+EXIT_USAGE = 2
+EXIT_LOGIN_FAILED = 3
+EXIT_INTERRUPTED = 130
+
+OUTPUT_FORMATS = ('csv', 'parquet')
+
+
+class WorkUnit(object):
+    """Single download: one request and one output file.
+
+    Attributes:
+        name (str): Output file name without extension.
+        fetch: Function without arguments that returns a data frame,
+            or None if the output is up to date.
+        synced: Function without arguments called after the output
+            is written, or None.
+    """
+
+    def __init__(self, name, fetch, synced=None):
+        self.name = name
+        self.fetch = fetch
+        self.synced = synced
+
+
+class Progress(object):
+    """Thread safe download progress with throughput and ETA."""
+
+    def __init__(self, total, stream=None, interval=1.0):
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.rows = 0
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self._started = time.monotonic()
+        self._reported = 0
+        self._lock = threading.Lock()
+
+    def update(self, rows=0, failed=False):
+        with self._lock:
+            self.done += 1
+            self.rows += rows
+            if failed:
+                self.failed += 1
+            now = time.monotonic()
+            if now - self._reported >= self.interval \
+                    or self.done == self.total:
+                self._reported = now
+                self.report(now)
+
+    def report(self, now=None):
+        elapsed = max((now or time.monotonic()) - self._started, 1e-9)
+        rate = self.done / elapsed
+        remaining = (self.total - self.done) / rate if rate else 0
+        self.stream.write(
+            '\r{0}/{1} done, {2} failed | {3:.1f} units/s, {4:.0f} rows/s | '
+            'ETA {5}'.format(self.done, self.total, self.failed, rate,
+                             self.rows / elapsed,
+                             datetime.timedelta(seconds=int(remaining)))
+        )
+        if self.done == self.total:
+            self.stream.write('\n')
+        self.stream.flush()
+
+
+def parse_date(value):
+    try:
+        return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            'invalid date {0!r}, expected YYYY-MM-DD'.format(value)
+        )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='eoddata-client',
+        description='Bulk download market data from EodData web service.'
+    )
+    parser.add_argument('--username', default=os.environ.get('EOD_DATA_LOGIN'),
+                        help='EodData username (EOD_DATA_LOGIN)')
+    parser.add_argument('--password',
+                        default=os.environ.get('EOD_DATA_PASSWORD'),
+                        help='EodData password (EOD_DATA_PASSWORD)')
+    parser.add_argument('-o', '--output', default='.',
+                        help='output directory (default: current directory)')
+    parser.add_argument('-f', '--format', choices=OUTPUT_FORMATS,
+                        default='csv', help='output file format')
+    parser.add_argument('-w', '--workers', type=int, default=4,
+                        help='number of parallel downloads')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='do not show progress')
+    subparsers = parser.add_subparsers(dest='command')
+
+    history = subparsers.add_parser('history', help='symbol history')
+    add_history_arguments(history)
+
+    quotes = subparsers.add_parser('quotes',
+                                   help='quotes of entire exchanges by date')
+    add_quotes_arguments(quotes)
+    quotes.add_argument('--state',
+                        help='sync state file, exchanges that have not '
+                             'changed since their quotes were synced are '
+                             'not downloaded again')
+
+    symbols = subparsers.add_parser('symbols', help='symbol lists')
+    symbols.add_argument('exchanges', nargs='+')
+
+    export = subparsers.add_parser('export', help='stream quotes of entire '
+                                                  'exchanges into one file '
+                                                  'per exchange')
+    add_quotes_arguments(export)
+    export.add_argument('--chunk-rows', type=int, default=50000,
+                        help='rows per written chunk')
+    export.add_argument('--prefetch', type=int, default=2,
+                        help='maximum number of downloaded days waiting '
+                             'for writing (0 to download while writing)')
+
+    plan = subparsers.add_parser('plan', help='write sharded download '
+                                              'manifest')
+    plan.add_argument('-m', '--manifest', required=True,
+                      help='manifest file to write')
+    kinds = plan.add_subparsers(dest='kind')
+    add_history_arguments(kinds.add_parser('history'))
+    add_quotes_arguments(kinds.add_parser('quotes'))
+
+    run = subparsers.add_parser('run', help='download one shard '
+                                            'of a manifest')
+    run.add_argument('manifest')
+    run.add_argument('--shard', type=int, required=True,
+                     help='shard index, from 0 to shards - 1')
+    run.add_argument('--shards', type=int, required=True,
+                     help='number of shards')
+
+    merge = subparsers.add_parser('merge', help='combine shard outputs')
+    merge.add_argument('manifest')
+    merge.add_argument('directories', nargs='+',
+                       help='shard output directories')
+    return parser
+
+
+def add_history_arguments(parser):
+    parser.add_argument('exchange')
+    parser.add_argument('symbols', nargs='*')
+    parser.add_argument('--all-symbols', action='store_true',
+                        help='download all symbols of the exchange')
+    parser.add_argument('--start', type=parse_date,
+                        default=datetime.date(1990, 1, 1))
+    parser.add_argument('--end', type=parse_date, help='end date')
+    parser.add_argument('--period', help='period code (default: d)')
+
+
+def add_quotes_arguments(parser):
+    parser.add_argument('exchanges', nargs='+')
+    parser.add_argument('--start', type=parse_date, required=True)
+    parser.add_argument('--end', type=parse_date)
+    parser.add_argument('--period',
+                        help='period code (default: end of day quotes)')
+
+
+def build_manifest(client, args):
+    """Get manifest for parsed `history` or `quotes` arguments.
+
+    Returns:
+        Manifest
+    """
+    if args.command == 'history' or getattr(args, 'kind', None) == 'history':
+        symbols = None if args.all_symbols else args.symbols
+        return plan_history(client, [args.exchange], args.start,
+                            end_date=args.end, period=args.period,
+                            symbols=symbols)
+    return plan_quotes(args.exchanges, args.start, args.end or args.start,
+                       period=args.period)
+
+
+def manifest_work_units(client, manifest, items=None):
+    """Get work units of manifest items.
+
+    Returns:
+        list of WorkUnit
+    """
+    if items is None:
+        items = manifest.items
+    return [WorkUnit(item.name, _partial(item.fetch, client,
+                                         manifest.start_date,
+                                         manifest.end_date))
+            for item in items]
+
+
+def conditional_work_units(client, manifest, state_path):
+    """Get work units of quotes manifest items that download only quotes
+    of exchanges changed since the quotes were synced.
+
+    Returns:
+        list of WorkUnit
+    """
+    fetcher = ConditionalFetcher(client, state_path)
+    units = []
+    for item in manifest.items:
+        date = parse_date(item.key)
+        units.append(WorkUnit(
+            item.name,
+            _partial(fetcher.quote_list_by_date, item.exchange, date,
+                     period=item.period),
+            synced=_partial(fetcher.mark_synced, item.exchange, date,
+                            item.period)
+        ))
+    return units
+
+
+def build_work_units(client, args):
+    """Get work units for parsed command line arguments.
+
+    Returns:
+        list of WorkUnit
+    """
+    if args.command == 'quotes' and args.state:
+        return conditional_work_units(client, build_manifest(client, args),
+                                      args.state)
+    if args.command in ('history', 'quotes'):
+        return manifest_work_units(client, build_manifest(client, args))
+    units = []
+    if args.command == 'symbols':
+        for exchange in args.exchanges:
+            exchange = exchange.upper()
+            units.append(WorkUnit(
+                '{0}_symbols'.format(exchange),
+                _partial(client.symbol_list, exchange,
+                         output_format='data-frame')
+            ))
+    return units
+
+
+def _partial(func, *args, **kwargs):
+    return lambda: func(*args, **kwargs)
+
+
+def write_df(df, path, output_format):
+    """Write data frame to a file."""
+    if output_format == 'parquet':
+        df.to_parquet(path)
+    else:
+        df.to_csv(path)
+
+
+def run_unit(unit, output, output_format):
+    """Download a work unit and write it to the output directory.
+
+    Returns:
+        int: Number of written rows.
+    """
+    try:
+        df = unit.fetch()
+    except NoDataAvailableError:
+        return 0
+    if df is None:
+        # output of the previous run is up to date
+        return 0
+    path = os.path.join(output, '{0}.{1}'.format(unit.name, output_format))
+    write_df(df, path, output_format)
+    if unit.synced is not None:
+        unit.synced()
+    return len(df)
+
+
+def download(units, output, output_format='csv', workers=4, progress=None):
+    """Download work units with parallel workers.
+
+    On KeyboardInterrupt pending units are cancelled and the interrupt
+    is raised without waiting for running ones.
+
+    Returns:
+        list of (WorkUnit, Exception): Failed units.
+    """
+    failures = []
+    executor = ThreadPoolExecutor(max_workers=max(workers, 1))
+    futures = {executor.submit(run_unit, unit, output, output_format): unit
+               for unit in units}
+    try:
+        for future in as_completed(futures):
+            unit = futures[future]
+            try:
+                rows = future.result()
+            except Exception as e:
+                logger.debug('Could not download %s.', unit.name,
+                             exc_info=True)
+                failures.append((unit, e))
+                if progress:
+                    progress.update(failed=True)
+            else:
+                if progress:
+                    progress.update(rows=rows)
+    except KeyboardInterrupt:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+        raise
+    executor.shutdown()
+    return failures
+
+
+def main(argv=None, client=None):
+    """Command line entry point.
+
+    Returns:
+        int: Exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_usage(sys.stderr)
+        return EXIT_USAGE
+    if args.command == 'plan' and args.kind is None:
+        parser.error('specify history or quotes')
+    if 'history' in (args.command, getattr(args, 'kind', None)) \
+            and not (args.symbols or args.all_symbols):
+        parser.error('specify symbols or --all-symbols')
+    if args.format == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            sys.stderr.write('Parquet output requires pyarrow.\n')
+            return EXIT_USAGE
+    if args.command == 'merge':
+        return merge(args)
+
+    if client is None:
+        if not args.username or not args.password:
+            sys.stderr.write('EodData credentials are not set.\n')
+            return EXIT_USAGE
+        client = EodDataHttpClient(args.username, args.password)
+
+    # errors before the download are not partial failures
+    try:
+        client.login()
+        if args.command == 'plan':
+            manifest = build_manifest(client, args)
+            manifest.save(args.manifest)
+            return EXIT_OK
+        if args.command == 'run':
+            manifest = Manifest.load(args.manifest)
+            items = manifest.shard(args.shard, args.shards)
+            units = manifest_work_units(client, manifest, items)
+        elif args.command != 'export':
+            units = build_work_units(client, args)
+    except (ManifestError, SyncStateError) as e:
+        sys.stderr.write('{0}\n'.format(e))
+        return EXIT_USAGE
+    except InvalidCredentialsError as e:
+        sys.stderr.write('Login failed: {0}\n'.format(e))
+        return EXIT_LOGIN_FAILED
+    except ClientError as e:
+        sys.stderr.write('Could not plan downloads: {0!r}\n'.format(e))
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        sys.stderr.write('\nInterrupted.\n')
+        return EXIT_INTERRUPTED
+
+    try:
+        if args.command == 'export':
+            return export(client, args)
+        os.makedirs(args.output, exist_ok=True)
+        progress = None
+        if not args.quiet and units:
+            progress = Progress(len(units))
+        failures = download(units, args.output, args.format, args.workers,
+                            progress)
+        if args.command == 'run':
+            failed = [unit.name for unit, _ in failures]
+            write_shard_status(args.output, args.shard, args.shards,
+                               [unit.name for unit in units
+                                if unit.name not in failed], failed)
+    except InvalidCredentialsError as e:
+        sys.stderr.write('Login failed: {0}\n'.format(e))
+        return EXIT_LOGIN_FAILED
+    except ClientError as e:
+        sys.stderr.write('Request failed: {0!r}\n'.format(e))
+        return EXIT_PARTIAL_FAILURE
+    except KeyboardInterrupt:
+        sys.stderr.write('\nInterrupted.\n')
+        return EXIT_INTERRUPTED
+
+    for unit, error in failures:
+        sys.stderr.write('Failed: {0} ({1!r})\n'.format(unit.name, error))
+    return EXIT_PARTIAL_FAILURE if failures else EXIT_OK
+
+
+def export(client, args):
+    """Stream quotes of every exchange into one file per exchange.
+
+    Returns:
+        int: Exit status.
+    """
+    os.makedirs(args.output, exist_ok=True)
+    end_date = args.end or args.start
+    for exchange in args.exchanges:
+        exchange = exchange.upper()
+        name = '{0}_{1:%Y%m%d}_{2:%Y%m%d}.{3}'.format(exchange, args.start,
+                                                     end_date, args.format)
+        path = os.path.join(args.output, name)
+        stats = export_quotes_by_date(client, exchange, args.start, end_date,
+                                      path, output_format=args.format,
+                                      chunk_rows=args.chunk_rows,
+                                      prefetch=args.prefetch)
+        if not args.quiet:
+            sys.stderr.write('{0}: {1} rows from {2} days written to {3}\n'
+                             .format(exchange, stats.rows, stats.responses,
+                                     path))
+            if stats.skipped:
+                sys.stderr.write('{0}: no data for {1} days: {2}\n'.format(
+                    exchange, len(stats.skipped),
+                    ', '.join(str(date) for date in stats.skipped)
+                ))
+    return EXIT_OK
+
+
+def merge(args):
+    """Combine outputs of manifest shards.
+
+    Returns:
+        int: Exit status.
+    """
+    try:
+        manifest = Manifest.load(args.manifest)
+    except ManifestError as e:
+        sys.stderr.write('{0}\n'.format(e))
+        return EXIT_USAGE
+    missing = merge_shards(manifest, args.directories, args.output,
+                           args.format)
+    for item in missing:
+        sys.stderr.write('Missing: {0}\n'.format(item.name))
+    return EXIT_PARTIAL_FAILURE if missing else EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Columnar parsing of EodData list responses.
+
+Exchange wide lists (fundamentals, technicals) have many numeric
+attributes. Instead of building an entity per element, attributes are
+collected into one array per column and converted to numbers or dates
+with a single vectorized call per column.
+"""
+import numpy as np
+import pandas as pd
+
+from eoddata_client.utils import strings_to_datetimes
+
+DATETIME_COLUMNS = frozenset([
+    'DateTime', 'Modified', 'DividendDate', 'd'
+])
+
+
+def parse_columns(elements, numeric_columns=frozenset(),
+                  datetime_columns=DATETIME_COLUMNS):
+    """Collect attributes of XML elements into typed column arrays.
+
+    Numbers that can not be parsed become NaN, dates become NaT. Other
+    attributes (including unknown ones) are kept as strings.
+
+    Args:
+        elements (iterable): XML elements.
+        numeric_columns (set of str): Attributes to parse as numbers.
+        datetime_columns (set of str): Attributes to parse as datetimes.
+
+    Returns:
+        dict: Attribute name to numpy array, in order of first appearance.
+    """
+    attributes = [element.attrib for element in elements]
+    names = []
+    seen = set()
+    for attrib in attributes:
+        for name in attrib:
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+
+    columns = {}
+    for name in names:
+        values = [attrib.get(name) for attrib in attributes]
+        if name in numeric_columns:
+            columns[name] = pd.to_numeric(np.array(values, dtype=object),
+                                          errors='coerce')
+        elif name in datetime_columns:
+            columns[name] = strings_to_datetimes(values).values
+        else:
+            columns[name] = np.array(values, dtype=object)
+    return columns
+
+
+def columns_to_df(columns, index_column=None):
+    """Get data frame from column arrays.
+
+    Args:
+        columns (dict): Column name to array.
+        index_column (str or None): Column to use as index.
+
+    Returns:
+        pandas.DataFrame
+    """
+    df = pd.DataFrame(columns)
+    if index_column is not None and index_column in df.columns:
+        df = df.set_index(index_column)
+    return df
+
+
+def format_columns(columns, output_format='data-frame', index_column=None):
+    """Format column arrays.
+
+    Args:
+        columns (dict): Column name to array.
+        output_format (str): 'data-frame' or 'columns'.
+        index_column (str or None): Data frame index column.
+
+    Returns:
+        pandas.DataFrame or dict
+    """
+    if output_format == 'columns':
+        return columns
+    elif output_format == 'data-frame':
+        return columns_to_df(columns, index_column=index_column)
+    else:
+        raise NotImplementedError
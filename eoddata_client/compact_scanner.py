@@ -0,0 +1,233 @@
+"""
+Scanner of compact (QUOTES2 and SYMBOLS2) responses.
+
+Compact responses are flat lists of elements with the same single letter
+attributes, for example:
+
+    <QUOTE2 s="MSFT" d="2017-09-26T00:00:00" o="73.67" h="73.81" ... />
+
+Instead of building an element tree, attribute values are read straight
+from the response with one regular expression per response and converted
+once into typed column arrays. Anything unexpected (other message than
+success, unknown attributes, comments, numeric character references,
+other encodings) raises `ScanError` and the response is parsed by
+the XML parser.
+"""
+import re
+
+from xml.sax.saxutils import unescape
+
+import numpy as np
+import pandas as pd
+
+from eoddata_client.business_entities import (
+    CATEGORICAL_COLUMNS, EodDataQuoteCompact, EodDataSymbolCompact,
+    add_problems_column, categorize_columns
+)
+from eoddata_client.utils import strings_to_datetimes
+
+QUOTE_COMPACT_ATTRIBUTES = ('s', 'd', 'o', 'h', 'l', 'c', 'v', 'i', 'b', 'a')
+SYMBOL_COMPACT_ATTRIBUTES = ('c', 'n')
+
+# attributes of text type, other quote attributes are numeric
+QUOTE_COMPACT_TEXT = ('s',)
+QUOTE_COMPACT_DATETIME = ('d',)
+
+# data frame column of compact quote attribute
+QUOTE_COMPACT_COLUMNS = (
+    ('d', 'Datetime'), ('s', 'Symbol'), ('o', 'Open'), ('h', 'High'),
+    ('l', 'Low'), ('c', 'Close'), ('v', 'Volume'),
+)
+
+XML_DECLARATION = re.compile(r'<\?xml[^>]*?encoding="([^"]*)"')
+RESPONSE_MESSAGE = re.compile(r'<RESPONSE\b[^>]*?\sMessage="([^"]*)"')
+ELEMENT = re.compile(r'<(\w+)((?:\s+\w+="[^"<]*")*)\s*/>')
+ATTRIBUTE_NAME = re.compile(r'(\w+)="')
+ATTRIBUTE_VALUE = re.compile(r'(?<==")[^"]*(?=")')
+
+
+class Error(Exception):
+    """Base error for this module."""
+
+
+class ScanError(Error):
+    """Response is not in the expected form."""
+
+
+def _decode(content):
+    if isinstance(content, str):
+        return content
+    declaration = XML_DECLARATION.match(content[:100].decode('ascii',
+                                                             'replace'))
+    if declaration and declaration.group(1).lower() not in ('utf-8',
+                                                            'utf8'):
+        raise ScanError('Unexpected encoding: {0}'.format(
+            declaration.group(1)
+        ))
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise ScanError(str(e))
+
+
+def _to_float(values):
+    try:
+        return np.array(values, dtype=float)
+    except ValueError:
+        return pd.to_numeric(np.array(values, dtype=object),
+                             errors='coerce').astype(float)
+
+
+def scan_compact(content, container, attributes, text=None, datetimes=()):
+    """Read attributes of compact elements into column arrays.
+
+    Args:
+        content (bytes or str): Response XML document.
+        container (str): Container element, `QUOTES2` or `SYMBOLS2`.
+        attributes (tuple of str): Expected attributes of every element.
+        text (tuple of str or None): Text attributes, all attributes
+            (except datetimes) are text if None, others are numeric.
+        datetimes (tuple of str): ISO 8601 datetime attributes.
+
+    Returns:
+        dict: Attribute name to list of str (text), float numpy.ndarray
+            (numeric, NaN if not numeric) or pandas.DatetimeIndex
+            (datetimes, NaT if invalid).
+
+    Raises:
+        ScanError
+    """
+    document = _decode(content)
+    message = RESPONSE_MESSAGE.search(document, 0, 1000)
+    if message is None or message.group(1) != 'Success':
+        raise ScanError('Not a successful response.')
+
+    opening = re.compile(r'<{0}\s*(/?)>'.format(container))\
+        .search(document, message.end())
+    if opening is None:
+        raise ScanError('Missing {0} element.'.format(container))
+    columns = {name: [] for name in attributes}
+    if opening.group(1):
+        return _typed(columns, text, datetimes)
+    start = opening.end()
+    end = document.find('</{0}>'.format(container), start)
+    if end < 0:
+        raise ScanError('Unclosed {0} element.'.format(container))
+    if '&#' in document[start:end]:
+        raise ScanError('Character references.')
+
+    first = ELEMENT.search(document, start, end)
+    if first is None:
+        if document[start:end].strip():
+            raise ScanError('Unexpected content.')
+        return _typed(columns, text, datetimes)
+    order = tuple(ATTRIBUTE_NAME.findall(first.group(2)))
+    if sorted(order) != sorted(attributes):
+        raise ScanError('Unexpected attributes: {0}'.format(order))
+
+    # the first element is the template of every element: same attribute
+    # order and same separators, values may differ
+    template = ATTRIBUTE_VALUE.split(first.group(0))
+    row = re.compile('([^"<]*)'.join(re.escape(part) for part in template))
+    rows = row.findall(document, start, end)
+    if len(rows) != document.count('<', start, end):
+        raise ScanError('Elements of unexpected form.')
+
+    for name, column in zip(order, zip(*rows)):
+        columns[name] = column
+    return _typed(columns, text, datetimes)
+
+
+def _typed(columns, text, datetimes):
+    for name, column in columns.items():
+        if name in datetimes:
+            columns[name] = pd.DatetimeIndex(
+                strings_to_datetimes(column).values.astype('datetime64[us]')
+            )
+        elif text is None or name in text:
+            columns[name] = [unescape(value, {'&quot;': '"', '&apos;': "'"})
+                             if '&' in value else value for value in column]
+        else:
+            columns[name] = _to_float(column)
+    return columns
+
+
+def select_rows(columns, keep):
+    """Get rows of column lists selected by a mask.
+
+    Args:
+        columns (dict): Attribute name to list of values.
+        keep (numpy.ndarray): Boolean mask.
+
+    Returns:
+        dict
+    """
+    if keep.all():
+        return columns
+    rows = np.flatnonzero(keep)
+    return {name: column[rows] if hasattr(column, 'dtype')
+            else [column[i] for i in rows]
+            for name, column in columns.items()}
+
+
+def compact_quotes(columns, output_format='entity-list', df_index='Symbol',
+                   problems=None):
+    """Convert scanned compact quotes to output format.
+
+    Args:
+        columns (dict): Attribute name to list of values (valid rows).
+        output_format (str): 'entity-list' or 'data-frame'.
+        df_index (str): Data frame index column.
+        problems (list or None): Validation problems (tuple of str) of
+            every row to flag, see `EodDataQuoteCompact.problems`.
+
+    Returns:
+        list of EodDataQuoteCompact or pandas.DataFrame
+    """
+    if output_format == 'data-frame':
+        data = {}
+        for name, column in QUOTE_COMPACT_COLUMNS:
+            if name == 'v':
+                data[column] = columns[name].astype('int64')
+            else:
+                data[column] = columns[name]
+        df = pd.DataFrame(data).set_index(df_index)
+        df.index.name = None
+        if problems is not None:
+            add_problems_column(df, problems)
+        return categorize_columns(df, CATEGORICAL_COLUMNS)
+
+    string_pool = {}
+    quotes = []
+    values = [columns[name] for name in QUOTE_COMPACT_ATTRIBUTES]
+    values[1] = values[1].to_pydatetime()
+    # python floats and ints instead of numpy scalars
+    values[2:] = [column.tolist() for column in values[2:]]
+    for s, d, o, h, l, c, v, i, b, a in zip(*values):
+        quotes.append(EodDataQuoteCompact(
+            symbol=string_pool.setdefault(s, s), quote_datetime=d,
+            open=o, high=h, low=l, close=c, volume=int(v),
+            open_interest=int(i), before=b, after=a
+        ))
+    if problems is not None:
+        for quote, row_problems in zip(quotes, problems):
+            quote.problems = row_problems
+    return EodDataQuoteCompact.format(quotes, output_format=output_format)
+
+
+def compact_symbols(columns, output_format='entity-list'):
+    """Convert scanned compact symbols to output format.
+
+    Args:
+        columns (dict): Attribute name to list of values.
+        output_format (str): 'entity-list' or 'data-frame'.
+
+    Returns:
+        list of EodDataSymbolCompact or pandas.DataFrame
+    """
+    if output_format == 'data-frame':
+        return pd.DataFrame({'Name': columns['n']}, index=columns['c'],
+                            columns=['Name'])
+    symbols = [EodDataSymbolCompact(code=code, name=name)
+               for code, name in zip(columns['c'], columns['n'])]
+    return EodDataSymbolCompact.format(symbols, output_format=output_format)
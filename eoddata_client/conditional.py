@@ -0,0 +1,261 @@
+"""
+Conditional download of exchange quotes.
+
+EodData publishes new quotes of an exchange together with a new last
+trade time and new advances and declines counts. The state of the
+exchange and the date of the quotes are recorded when its quotes are
+synced. While the state is the same, downloads of that date and of
+later dates (holidays, data not published yet) are skipped if the
+synced quotes were the latest ones of the exchange.
+
+    fetcher = ConditionalFetcher(client, 'sync_state.json')
+    df = fetcher.quote_list_by_date('nasdaq', date)
+    if df is not None:
+        df.to_csv('nasdaq.csv')
+        fetcher.mark_synced('nasdaq', date)
+"""
+import datetime
+import json
+import os
+import threading
+
+from collections import namedtuple
+
+from eoddata_client.utils import string_to_datetime
+
+
+class Error(Exception):
+    """Base error for this module."""
+
+
+class SyncStateError(Error):
+    """Sync state file can not be read."""
+
+
+class ExchangeState(namedtuple('ExchangeState',
+                               'last_trade_time advances declines')):
+    """State of exchange data.
+
+    Attributes:
+        last_trade_time (datetime.datetime): Datetime of the last trade.
+        advances (int): Advances count.
+        declines (int): Declines count.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_exchange(cls, exchange):
+        """Get state of an exchange.
+
+        Args:
+            exchange (EodDataExchange): Exchange.
+
+        Returns:
+            ExchangeState
+        """
+        return cls(exchange.last_trade_time, exchange.advances,
+                   exchange.declines)
+
+    def to_dict(self):
+        return {
+            'last_trade_time': self.last_trade_time.isoformat(),
+            'advances': self.advances,
+            'declines': self.declines,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(string_to_datetime(data['last_trade_time']),
+                   data['advances'], data['declines'])
+
+
+class SyncRecord(namedtuple('SyncRecord', 'date state')):
+    """Last synced quotes of an exchange.
+
+    Attributes:
+        date (datetime.date): Date of the quotes.
+        state (ExchangeState): State of the exchange when they were synced.
+    """
+    __slots__ = ()
+
+    def to_dict(self):
+        data = self.state.to_dict()
+        data['date'] = self.date.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        date = datetime.datetime.strptime(data['date'], '%Y-%m-%d').date()
+        return cls(date, ExchangeState.from_dict(data))
+
+
+class SyncState(object):
+    """Last synced quotes of exchanges, saved to a JSON file."""
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): State file path, created on the first save.
+
+        Raises:
+            SyncStateError
+        """
+        self.path = path
+        self._states = {}
+        self._lock = threading.Lock()
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            self._states = {key: SyncRecord.from_dict(value)
+                            for key, value in data.items()}
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError) as e:
+            raise SyncStateError('Invalid sync state {0}: {1}'.format(path,
+                                                                      e))
+
+    def get(self, key):
+        """Get recorded sync.
+
+        Returns:
+            SyncRecord or None
+        """
+        return self._states.get(key)
+
+    def set(self, key, record):
+        """Record sync and save the file."""
+        with self._lock:
+            self._states[key] = record
+            data = {key: value.to_dict()
+                    for key, value in self._states.items()}
+            temp_path = '{0}.{1}.tmp'.format(self.path, os.getpid())
+            with open(temp_path, 'w') as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+
+def sync_key(exchange_code, period=None):
+    """Get sync state key of quotes of an exchange."""
+    key = exchange_code.upper()
+    if period:
+        key += '/{0}'.format(period)
+    return key
+
+
+class ConditionalFetcher(object):
+    """Downloads quotes of an exchange only if the exchange state changed
+    since the quotes were synced.
+
+    Current exchange states are requested once with `exchange_list`
+    (call `refresh` to request them again), so that the state recorded
+    by `mark_synced` is the one seen before the download.
+
+    Attributes:
+        client (EodDataHttpClient): EodData client.
+        state (SyncState): Recorded states.
+        skipped (int): Number of skipped downloads.
+    """
+
+    def __init__(self, client, state):
+        """
+        Args:
+            client (EodDataHttpClient): EodData client.
+            state (SyncState or str): Recorded states or state file path.
+        """
+        self.client = client
+        if not isinstance(state, SyncState):
+            state = SyncState(state)
+        self.state = state
+        self.skipped = 0
+        self._exchanges = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Request current exchange states again."""
+        with self._lock:
+            self._exchanges = None
+
+    def exchange_state(self, exchange_code):
+        """Get current state of an exchange.
+
+        Returns:
+            ExchangeState or None: None if the exchange is unknown.
+        """
+        with self._lock:
+            if self._exchanges is None:
+                self._exchanges = {
+                    exchange.code.upper():
+                        ExchangeState.from_exchange(exchange)
+                    for exchange in self.client.exchange_list()
+                }
+            return self._exchanges.get(exchange_code.upper())
+
+    def is_synced(self, exchange_code, date, period=None):
+        """Check if quotes of a date are up to date.
+
+        They are if the exchange has not changed since the last sync and
+        the date is the synced one, or a later one while the synced
+        quotes are the latest quotes of the exchange.
+
+        Returns:
+            bool
+        """
+        recorded = self.state.get(sync_key(exchange_code, period))
+        if recorded is None \
+                or recorded.state != self.exchange_state(exchange_code):
+            return False
+        date = _to_date(date)
+        return date == recorded.date or (
+            date > recorded.date
+            and recorded.date >= recorded.state.last_trade_time.date()
+        )
+
+    def mark_synced(self, exchange_code, date, period=None):
+        """Record the exchange state of successfully synced quotes.
+
+        A later synced date is kept while the exchange has not changed.
+        """
+        current = self.exchange_state(exchange_code)
+        if current is None:
+            return
+        key = sync_key(exchange_code, period)
+        date = _to_date(date)
+        with self._lock:
+            recorded = self.state.get(key)
+            if recorded is not None and recorded.state == current \
+                    and recorded.date > date:
+                return
+            self.state.set(key, SyncRecord(date, current))
+
+    def quote_list_by_date(self, exchange_code, date,
+                           output_format='data-frame', period=None,
+                           load=None):
+        """Get quotes of an exchange for a date unless they were synced
+        and the exchange has not changed since then.
+
+        Args:
+            exchange_code (str): Exchange code.
+            date (datetime.date): Date.
+            output_format (str): Output format.
+            period (str or None): Period code, end of day quotes if None.
+            load: Function without arguments that returns stored quotes.
+
+        Returns:
+            Quotes, result of `load` or None if quotes are not changed.
+        """
+        if self.is_synced(exchange_code, date, period):
+            with self._lock:
+                self.skipped += 1
+            return None if load is None else load()
+        if period:
+            return self.client.quote_list_by_date_period(
+                exchange_code, date, period, output_format=output_format
+            )
+        return self.client.quote_list_by_date(exchange_code, date,
+                                              output_format=output_format)
+
+
+def _to_date(date):
+    if isinstance(date, datetime.datetime):
+        return date.date()
+    return date
@@ -2,16 +2,34 @@
 EodData HTTP Client.
 """
 import logging
-import xml.etree.ElementTree as ET
+import threading
 
+import numpy as np
 import requests
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
 from eoddata_client.business_entities import (
-    EodDataExchange, EodDataQuoteCompact, EodDataQuoteExtended,
-    EodDataSymbol, EodDataSymbolCompact
+    EodDataExchange, EodDataFundamental, EodDataQuoteCompact,
+    EodDataQuoteExtended, EodDataSplit, EodDataSymbol, EodDataSymbolCompact,
+    EodDataTechnical
 )
+from eoddata_client.columnar import format_columns, parse_columns
+from eoddata_client.compact_scanner import (
+    QUOTE_COMPACT_ATTRIBUTES, QUOTE_COMPACT_DATETIME, QUOTE_COMPACT_TEXT,
+    SYMBOL_COMPACT_ATTRIBUTES, ScanError, compact_quotes, compact_symbols,
+    scan_compact, select_rows
+)
+from eoddata_client.profiling import EndpointProfiler, profiled
+from eoddata_client.utils import split_symbols
+from eoddata_client.validation import (
+    QUOTE_COMPACT_SCHEMA, QUOTE_EXTENDED_SCHEMA, VALIDATION_FLAG,
+    VALIDATION_KEEP, ValidationReport, validate_columns, validate_quotes
+)
+from eoddata_client.warmup import ReferencePrefetcher, prefetched
+from eoddata_client.xml_parsing import get_xml_backend
 
 
 PERIODS = (
@@ -26,6 +44,9 @@ PERIODS = (
     ('m', 'Month'),
 )
 
+# maximum length of url encoded `Symbols` parameter of QuoteList2 request
+MAX_SYMBOLS_PARAM_LENGTH = 1500
+
 MSG_SUCCESS = 'Success'
 MSG_LOGIN_SUCCESS = 'Login Successful'
 MSG_INVALID_CREDENTIALS = 'Invalid Username or Password'
@@ -100,8 +121,8 @@ class EodDataHttpClient(object):
         - QuoteListByDate2 - quote_list_by_date_compact;
         - QuoteListByDatePeriod - quote_list_by_date_period;
         - QuoteListByDatePeriod2 - quote_list_by_date_period_compact;
-        - SplitListByExchange;
-        - SplitListBySymbol;
+        - SplitListByExchange - split_list_by_exchange;
+        - SplitListBySymbol - split_list_by_symbol;
         - SymbolChangesByExchange;
         - SymbolChart;
         - SymbolGet;
@@ -110,7 +131,7 @@ class EodDataHttpClient(object):
         - SymbolHistoryPeriodByDateRange - symbol_history_period;
         - SymbolList - symbol_list;
         - SymbolList2 - symbol_list_compact;
-        - TechnicalList;
+        - TechnicalList - technical_list;
         - Top10Gains;
         - Top10Losses;
         - UpdateDataFormat;
@@ -119,7 +140,10 @@ class EodDataHttpClient(object):
 
     def __init__(self, username, password,
                  base_url='http://ws.eoddata.com/data.asmx/',
-                 max_login_retries=3, logger=None):
+                 max_login_retries=3, logger=None,
+                 validation_mode=VALIDATION_KEEP, profile_dir=None,
+                 token_store=None, login_on_init=False, warm_up=None,
+                 xml_backend=None, transport=None):
         """
         Args:
             username (str): Account username. 
@@ -129,13 +153,61 @@ class EodDataHttpClient(object):
             max_login_retries (int): Maximum login retries, increase if there 
                 are several clients working in parallel.
             logger (logging.Logger): Client logger.
+            validation_mode (str): 'keep' - drop only quotes that can not
+                be parsed and keep suspicious ones (high below low,
+                negative volume, duplicate datetime), 'flag' - keep them
+                too and set their problems to `problems` attribute of
+                quotes (`Problems` column of data frames), 'drop' - drop
+                quotes with any problem.
+            profile_dir (str or None): If set, every endpoint call is
+                profiled and its profile is written to this directory.
+                Can also be set with `EODDATA_CLIENT_PROFILE_DIR`
+                environment variable.
+            token_store (TokenStore or None): Store to share login token
+                with other clients and processes, for example
+                `FileTokenStore`.
+            login_on_init (bool): Get a token (from the store or by login)
+                at construction. Otherwise it is done before the first
+                request, requests are never sent without a token.
+            warm_up (bool, list of str or None): Login and prefetch
+                exchange and country lists on background threads at
+                construction, and symbol lists of exchanges if a list of
+                exchange codes is given. Endpoint calls made meanwhile
+                wait for the prefetched results.
+            xml_backend (str or None): XML parser backend, 'stdlib',
+                'lxml' or 'auto', see `eoddata_client.xml_parsing`.
+            transport: Object with `get(url, params)` and
+                `post(url, data)` functions that return responses,
+                `requests` by default. See `eoddata_client.cassettes`
+                for recording and replaying transports.
         """
         self._token = ''
         self._username = username
         self._password = password
         self._max_login_retries = max_login_retries
         self._base_url = base_url
+        self._transport = requests if transport is None else transport
+        self._validation_mode = validation_mode
+        self._local = threading.local()
+        self.xml_backend = get_xml_backend(xml_backend)
+        self._login_lock = threading.RLock()
+        self._token_store = token_store
+        self._token_key = '{0}@{1}'.format(username, base_url)
+        if token_store is not None:
+            self._token = token_store.get(self._token_key) or ''
         self.logger = logger or logging.getLogger('eoddata_client')
+        if profile_dir:
+            self.profiler = EndpointProfiler(profile_dir)
+        else:
+            self.profiler = EndpointProfiler.from_environment()
+        self.prefetcher = None
+        if warm_up:
+            symbol_exchanges = () if warm_up is True else warm_up
+            self.prefetcher = ReferencePrefetcher(
+                self, symbol_exchanges=symbol_exchanges
+            ).start()
+        elif login_on_init:
+            self.ensure_token()
 
     def retry_limit(func):
         """Decorator to have control over retry count.
@@ -146,17 +218,21 @@ class EodDataHttpClient(object):
         Raises:
             ReloginDepthReachedError
         """
-        func.recursion_depth = 0
+        # retry depth is tracked per thread, so that concurrent calls of the
+        # same endpoint do not count against each other's retries
+        state = threading.local()
 
         @wraps(func)
         def wrapper(*args, **kwargs):
             self = args[0]
-            if func.recursion_depth > self._max_login_retries:
+            depth = getattr(state, 'depth', 0)
+            if depth > self._max_login_retries:
                 raise ReloginDepthReachedError
-            func.recursion_depth += 1
-            result = func(*args, **kwargs)
-            func.recursion_depth = 0
-            return result
+            state.depth = depth + 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                state.depth = depth
         return wrapper
 
     def get_params(self, additional=None):
@@ -168,7 +244,12 @@ class EodDataHttpClient(object):
         Returns:
             Dictionary with parameters for a request.
         """
-        parameters = {'Token': self._token}
+        if not self._token:
+            self.ensure_token()
+        token = self._token
+        # remember token sent by this thread to detect refreshes by others
+        self._local.sent_token = token
+        parameters = {'Token': token}
         if additional:
             parameters.update(additional)
         return parameters
@@ -184,9 +265,158 @@ class EodDataHttpClient(object):
         """
         self.logger.info('Retry to execute function %s with a new token.',
                          func.__name__)
-        self.login()
+        self.refresh_token(getattr(self._local, 'sent_token', ''))
         return func(*args, **kwargs)
 
+    def ensure_token(self):
+        """Get a token from the token store or by login if there is none."""
+        if not self._token:
+            self.refresh_token('')
+
+    def refresh_token(self, rejected_token):
+        """Replace a rejected token.
+
+        Refreshes are serialized: if another thread or process (sharing
+        the token store) has already got a different token, it is used
+        instead of logging in again.
+
+        Args:
+            rejected_token (str): Token rejected by the web service.
+        """
+        store = self._token_store
+        with self._login_lock:
+            if self._token and self._token != rejected_token:
+                return
+            if store is None:
+                self.login()
+                return
+            with store.lock(self._token_key):
+                stored = store.get(self._token_key)
+                if stored and stored != rejected_token:
+                    self.logger.debug('Using token refreshed by other client.')
+                    self._token = stored
+                    return
+                self.login()
+
+    @property
+    def last_validation_report(self):
+        """ValidationReport or None: Report of the last quote list parsed
+        by the current thread."""
+        return getattr(self._local, 'validation_report', None)
+
+    @property
+    def last_missing_symbols(self):
+        """list of str: Symbols without quotes in the last
+        `quote_list_specific` response of the current thread."""
+        return getattr(self._local, 'missing_symbols', [])
+
+    def parse_quotes(self, quotes_xml, quote_class):
+        """Validate and parse quote elements of a response.
+
+        Quotes are validated all at once, problems are logged as a single
+        warning per response and are available in `last_validation_report`.
+
+        Args:
+            quotes_xml: XML element with quote elements.
+            quote_class: EodDataQuoteExtended or EodDataQuoteCompact.
+
+        Returns:
+            list of quotes.
+        """
+        quote_elements = list(quotes_xml)
+        schema = QUOTE_COMPACT_SCHEMA if quote_class is EodDataQuoteCompact \
+            else QUOTE_EXTENDED_SCHEMA
+        keep, report = validate_quotes(quote_elements, schema,
+                                       mode=self._validation_mode)
+        quotes = []
+        string_pool = {}
+        for i in np.flatnonzero(keep):
+            quote = quote_class.from_xml(quote_elements[i], string_pool)
+            if quote:
+                quotes.append(quote)
+            else:
+                keep[i] = False
+        if len(quotes) != report.total - report.dropped:
+            report.select(keep)
+        self._report_validation(report)
+        if self._validation_mode == VALIDATION_FLAG:
+            for quote, problems in zip(quotes,
+                                       report.row_problems(len(quotes))):
+                quote.problems = problems
+        return quotes
+
+    def _report_validation(self, report):
+        self._local.validation_report = report
+        if not report.ok:
+            self.logger.warning('Invalid quotes in response: %s',
+                                report.summary())
+
+    def scan_compact_response(self, response, container, attributes,
+                              text=None, datetimes=()):
+        """Read compact elements of a response into column arrays.
+
+        Args:
+            response (requests.Response): Response of EodData web service.
+            container (str): Container element, `QUOTES2` or `SYMBOLS2`.
+            attributes (tuple of str): Attributes of the elements.
+            text (tuple of str or None): Text attributes, see
+                `compact_scanner.scan_compact`.
+            datetimes (tuple of str): Datetime attributes.
+
+        Returns:
+            dict or None: Attribute name to column, None if the response
+                must be processed by the XML parser (errors, invalid
+                token, unexpected content).
+        """
+        if response.status_code != 200:
+            return None
+        try:
+            return scan_compact(response.content, container, attributes,
+                                text=text, datetimes=datetimes)
+        except ScanError as e:
+            self.logger.debug('Compact response is parsed by XML parser: %s',
+                              e)
+            return None
+
+    def scanned_quotes(self, columns, output_format, df_index='Symbol'):
+        """Validate scanned compact quotes and convert to output format.
+
+        Returns:
+            list or pandas.DataFrame: EodData compact quotes.
+        """
+        total = len(columns[QUOTE_COMPACT_ATTRIBUTES[0]])
+        keep, report = validate_columns(columns, total, QUOTE_COMPACT_SCHEMA,
+                                        mode=self._validation_mode)
+        self._report_validation(report)
+        problems = None
+        if self._validation_mode == VALIDATION_FLAG:
+            problems = report.row_problems(int(keep.sum()))
+        return compact_quotes(select_rows(columns, keep),
+                              output_format=output_format, df_index=df_index,
+                              problems=problems)
+
+    def parse_xml(self, response):
+        """Parse XML document of a response.
+
+        The parser gets the raw body, so the encoding is taken from the XML
+        declaration and the body is not decoded into a string first. The
+        document is parsed once, the root element parsed by
+        `process_response` is reused by the endpoint.
+
+        Args:
+            response (requests.Response): Response of EodData web service.
+
+        Returns:
+            Root element.
+        """
+        parsed = getattr(self._local, 'parsed', None)
+        if parsed is not None and parsed[0] is response:
+            self._local.parsed = None
+            return parsed[1]
+        root = self.xml_backend.fromstring(response.content)
+        self._local.parsed = (response, root)
+        return root
+
     def process_response(self, response):
         """Process response from EodData web service. All responses from 
             EodData web service have common format. This method is kind of 
@@ -204,12 +434,14 @@ class EodDataHttpClient(object):
             NoDataAvailableError
         """
         if response.status_code == 200:
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
+            if root.attrib.get('Message') == MSG_SUCCESS:
+                return True
+            # the document is reused by the endpoint only on success
+            self._local.parsed = None
             message = root.attrib['Message']
 
-            if message == MSG_SUCCESS:
-                return True
-            elif message == MSG_LOGIN_SUCCESS:
+            if message == MSG_LOGIN_SUCCESS:
                 self._token = root.attrib['Token']
                 return True
             elif message == MSG_INVALID_CREDENTIALS:
@@ -227,6 +459,7 @@ class EodDataHttpClient(object):
         elif response.status_code == 500:
             raise EodDataInternalServerError
 
+    @profiled
     def login(self):
         """Login to EODData Financial Information Web Service. 
             Used for Web Authentication.
@@ -238,9 +471,14 @@ class EodDataHttpClient(object):
             'Username': self._username,
             'Password': self._password
         }
-        response = requests.post(self._base_url + 'Login', data=data)
-        return self.process_response(response)
-
+        response = self._transport.post(self._base_url + 'Login', data=data)
+        success = self.process_response(response)
+        if success and self._token_store is not None:
+            self._token_store.set(self._token_key, self._token)
+        return success
+
+    @prefetched()
+    @profiled
     @retry_limit
     def country_list(self):
         """Returns a list of available countries.
@@ -251,10 +489,10 @@ class EodDataHttpClient(object):
             [('AF', 'Afghanistan'), ('AL', 'Albania'), ('DZ', 'Algeria'),
              ('AS', 'American Samoa'), ('AD', 'Andorra'), ('AO', 'Angola')] 
         """
-        response = requests.get(self._base_url + 'CountryList',
-                                params=self.get_params())
+        response = self._transport.get(self._base_url + 'CountryList',
+                                       params=self.get_params())
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             countries_element = root[0]
             countries = []
             for country in countries_element:
@@ -265,6 +503,7 @@ class EodDataHttpClient(object):
         else:
             return self.retry(self.country_list)
 
+    @profiled
     @retry_limit
     def data_client_latest_version(self):
         """Returns the latest version information of Data Client.
@@ -273,20 +512,24 @@ class EodDataHttpClient(object):
             String with the latest version of data client in format 
                 "MAJOR.MINOR.PATCH.HOTFIX".
         """
-        response = requests.get(self._base_url + 'DataClientLatestVersion',
-                                params=self.get_params())
+        response = self._transport.get(
+            self._base_url + 'DataClientLatestVersion',
+            params=self.get_params()
+        )
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             version = root[0].text
             return version
         else:
             return self.retry(self.data_client_latest_version)
 
+    @profiled
     @retry_limit
     def data_formats(self):
         """Returns the list of data formats."""
         raise NotImplementedError
 
+    @profiled
     @retry_limit
     def exchange_detail(self, exchange_code):
         """Get detailed information about an exchange.
@@ -295,15 +538,17 @@ class EodDataHttpClient(object):
             EodDataExchange or None
         """
         additional = {'Exchange': exchange_code.upper()}
-        response = requests.get(self._base_url + 'ExchangeGet',
-                                params=self.get_params(additional))
+        response = self._transport.get(self._base_url + 'ExchangeGet',
+                                       params=self.get_params(additional))
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             exchange_element = root[0]
             return EodDataExchange.from_xml(exchange_element)
         else:
             return self.retry(self.exchange_detail, exchange_code)
 
+    @prefetched(EodDataExchange.format)
+    @profiled
     @retry_limit
     def exchange_list(self, output_format='entity-list'):
         """Get all available exchanges.
@@ -311,10 +556,10 @@ class EodDataHttpClient(object):
         Returns:
             list or pandas.DataFrame: EodData exchanges.
         """
-        response = requests.get(self._base_url + 'ExchangeList',
-                                params=self.get_params())
+        response = self._transport.get(self._base_url + 'ExchangeList',
+                                       params=self.get_params())
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             exchanges_xml = list(root[0])
             exchanges = []
             for exchange_xml in exchanges_xml:
@@ -325,6 +570,7 @@ class EodDataHttpClient(object):
         else:
             return self.retry(self.exchange_list, output_format=output_format)
 
+    @profiled
     @retry_limit
     def exchange_months(self):
         """
@@ -333,26 +579,60 @@ class EodDataHttpClient(object):
         # TODO: add this endpoint
         raise NotImplementedError
 
+    @profiled
     @retry_limit
-    def fundamental_list(self):
-        """
-        Returns a complete list of fundamental data for an entire exchange.
+    def fundamental_list(self, exchange_code, output_format='entity-list'):
+        """Get a complete list of fundamental data for an entire exchange.
+
+        Attributes are parsed directly into typed columns, without
+        building an entity per symbol.
+
+        Args:
+            exchange_code (str): Exchange code.
+            output_format (str): 'entity-list', 'data-frame' or
+                'columns' (dict of numpy arrays).
+
+        Returns:
+            list of EodDataFundamental, pandas.DataFrame or dict:
+                Fundamentals, data frame is indexed by symbol.
         """
-        # TODO: add this endpoint
-        raise NotImplementedError
+        additional = {
+            'Exchange': exchange_code.upper()
+        }
+        response = self._transport.get(self._base_url + 'FundamentalList',
+                                       params=self.get_params(additional))
+        if self.process_response(response):
+            root = self.parse_xml(response)
+            fundamentals_xml = [el for el in list(root)
+                                if el.tag.endswith('FUNDAMENTALS')][0]
+            columns = parse_columns(
+                fundamentals_xml,
+                numeric_columns=EodDataFundamental.numeric_columns(),
+                datetime_columns=EodDataFundamental.datetime_columns()
+            )
+            if output_format == 'entity-list':
+                return EodDataFundamental.from_columns(columns)
+            return format_columns(columns, output_format=output_format,
+                                  index_column='Symbol')
+        else:
+            return self.retry(self.fundamental_list, exchange_code,
+                              output_format=output_format)
 
+    @profiled
     @retry_limit
     def news_list(self, exchange_code):
         """Returns a list of News articles for an entire exchange."""
         # TODO: add this endpoint
         raise NotImplementedError
 
+    @profiled
     @retry_limit
     def news_list_by_symbol(self, exchange_code):
         """Returns a list of News articles for a given Exchange and Symbol."""
         # TODO: add this endpoint
         raise NotImplementedError
 
+    @profiled
     @retry_limit
     def quote_detail(self, exchange_code, symbol):
         """Get an end of day quote for a specific symbol.
@@ -364,15 +644,16 @@ class EodDataHttpClient(object):
             'Exchange': exchange_code.upper(),
             'Symbol': symbol.upper()
         }
-        response = requests.get(self._base_url + 'QuoteGet',
-                                params=self.get_params(additional))
+        response = self._transport.get(self._base_url + 'QuoteGet',
+                                       params=self.get_params(additional))
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             quote_xml = [el for el in list(root) if el.tag.endswith('QUOTE')][0]
             return EodDataQuoteExtended.from_xml(quote_xml)
         else:
             return self.retry(self.quote_detail, exchange_code, symbol)
 
+    @profiled
     @retry_limit
     def quote_list(self, exchange_code, output_format='entity-list'):
         """Get a complete list of end of day quotes for an entire exchange.
@@ -386,56 +667,109 @@ class EodDataHttpClient(object):
         additional = {
             'Exchange': exchange_code.upper()
         }
-        response = requests.get(self._base_url + 'QuoteList',
-                                params=self.get_params(additional))
+        response = self._transport.get(self._base_url + 'QuoteList',
+                                       params=self.get_params(additional))
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             quotes_xml = [el for el in list(root)
                           if el.tag.endswith('QUOTES')][0]
-            quotes = []
-            for quote_xml in list(quotes_xml):
-                quote = EodDataQuoteExtended.from_xml(quote_xml)
-                if quote:
-                    quotes.append(quote)
+            quotes = self.parse_quotes(quotes_xml, EodDataQuoteExtended)
             return EodDataQuoteExtended\
                 .format(quotes, output_format=output_format, df_index='Symbol')
         else:
             return self.retry(self.quote_list, exchange_code,
                               output_format=output_format)
 
-    @retry_limit
+    @profiled
     def quote_list_specific(self, exchange_code, symbol_list,
-                            output_format='entity-list'):
+                            output_format='entity-list', max_workers=4):
         """Get end of day quotes for specific symbols.
+
+        Long symbol lists are split into batches that fit into a request
+        url, batches are requested concurrently. Validation reports of
+        the batches are merged into `last_validation_report`, symbols
+        without quotes are logged and available in
+        `last_missing_symbols`.
         
         Args:
             exchange_code (str): Exchange code.
             symbol_list (list of str): Symbol list.
+            max_workers (int): Maximum number of concurrent requests.
             
         Returns:
-            list or pandas.DataFrame: EodData extended quotes.
+            list or pandas.DataFrame: EodData extended quotes in order
+                of the symbol list.
+        """
+        symbols = list(OrderedDict.fromkeys(symbol.upper()
+                                            for symbol in symbol_list))
+        batches = split_symbols(symbols, MAX_SYMBOLS_PARAM_LENGTH)
+
+        if len(batches) > 1 and max_workers > 1:
+            workers = min(max_workers, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda batch: self._quote_list_specific(exchange_code,
+                                                            batch),
+                    batches
+                ))
+        else:
+            results = [self._quote_list_specific(exchange_code, batch)
+                       for batch in batches]
+
+        quotes_by_symbol = {}
+        for batch_quotes, _ in results:
+            for quote in batch_quotes:
+                quotes_by_symbol.setdefault(quote.symbol.upper(), quote)
+        quotes = []
+        missing_symbols = []
+        for symbol in symbols:
+            if symbol in quotes_by_symbol:
+                quotes.append(quotes_by_symbol[symbol])
+            else:
+                missing_symbols.append(symbol)
+        # map rows of batch reports to positions in the result
+        positions = {id(quote): i for i, quote in enumerate(quotes)}
+        self._local.validation_report = ValidationReport.merge([
+            (report, [positions.get(id(quote), -1) for quote in batch_quotes])
+            for batch_quotes, report in results
+        ])
+        if missing_symbols:
+            self.logger.warning('No quotes for %d symbol(s) on %s: %s',
+                                len(missing_symbols), exchange_code,
+                                ', '.join(missing_symbols))
+        self._local.missing_symbols = missing_symbols
+        return EodDataQuoteExtended\
+            .format(quotes, output_format=output_format, df_index='Symbol')
+
+    @retry_limit
+    def _quote_list_specific(self, exchange_code, symbol_list):
+        """Get end of day quotes for a batch of symbols (single request).
+
+        Args:
+            exchange_code (str): Exchange code.
+            symbol_list (list of str): Symbol list.
+
+        Returns:
+            tuple of list and ValidationReport: EodData extended quotes
+                and their validation report.
         """
         additional = {
             'Exchange': exchange_code.upper(),
             'Symbols': ','.join(symbol_list)
         }
-        response = requests.get(self._base_url + 'QuoteList2',
-                                params=self.get_params(additional))
+        response = self._transport.get(self._base_url + 'QuoteList2',
+                                       params=self.get_params(additional))
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             quotes_xml = [el for el in list(root)
                           if el.tag.endswith('QUOTES')][0]
-            quotes = []
-            for quote_xml in list(quotes_xml):
-                quote = EodDataQuoteExtended.from_xml(quote_xml)
-                if quote:
-                    quotes.append(quote)
-            return EodDataQuoteExtended\
-                .format(quotes, output_format=output_format, df_index='Symbol')
+            quotes = self.parse_quotes(quotes_xml, EodDataQuoteExtended)
+            return quotes, self.last_validation_report
         else:
-            return self.retry(self.quote_list_specific, exchange_code,
-                              symbol_list, output_format=output_format)
+            return self.retry(self._quote_list_specific, exchange_code,
+                              symbol_list)
 
+    @profiled
     @retry_limit
     def quote_list_by_date(self, exchange_code, date,
                            output_format='entity-list'):
@@ -453,25 +787,22 @@ class EodDataHttpClient(object):
             'Exchange': exchange_code.upper(),
             'QuoteDate': date.strftime('%Y%m%d'),
         }
-        response = requests.get(
+        response = self._transport.get(
             self._base_url + 'QuoteListByDate',
             params=self.get_params(additional)
         )
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             quotes_xml = [el for el in list(root)
                           if el.tag.endswith('QUOTES')][0]
-            quotes = []
-            for quote_xml in list(quotes_xml):
-                quote = EodDataQuoteExtended.from_xml(quote_xml)
-                if quote:
-                    quotes.append(quote)
+            quotes = self.parse_quotes(quotes_xml, EodDataQuoteExtended)
             return EodDataQuoteExtended\
                 .format(quotes, output_format=output_format, df_index='Symbol')
         else:
             return self.retry(self.quote_list_by_date, exchange_code, date,
                               output_format=output_format)
 
+    @profiled
     @retry_limit
     def quote_list_by_date_compact(self, exchange_code, date,
                                    output_format='entity-list'):
@@ -485,25 +816,28 @@ class EodDataHttpClient(object):
             'Exchange': exchange_code.upper(),
             'QuoteDate': date.strftime('%Y%m%d'),
         }
-        response = requests.get(
+        response = self._transport.get(
             self._base_url + 'QuoteListByDate2',
             params=self.get_params(additional)
         )
+        columns = self.scan_compact_response(
+            response, 'QUOTES2', QUOTE_COMPACT_ATTRIBUTES,
+            text=QUOTE_COMPACT_TEXT, datetimes=QUOTE_COMPACT_DATETIME
+        )
+        if columns is not None:
+            return self.scanned_quotes(columns, output_format)
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             quotes_xml = [el for el in list(root)
                           if el.tag.endswith('QUOTES2')][0]
-            quotes = []
-            for quote_xml in list(quotes_xml):
-                quote = EodDataQuoteCompact.from_xml(quote_xml)
-                if quote:
-                    quotes.append(quote)
+            quotes = self.parse_quotes(quotes_xml, EodDataQuoteCompact)
             return EodDataQuoteCompact\
                 .format(quotes, output_format=output_format, df_index='Symbol')
         else:
             return self.retry(self.quote_list_by_date_compact,
                               exchange_code, date, output_format=output_format)
 
+    @profiled
     @retry_limit
     def quote_list_by_date_period(self, exchange_code, date, period,
                                   output_format='entity-list'):
@@ -518,25 +852,22 @@ class EodDataHttpClient(object):
             'QuoteDate': date.strftime('%Y%m%d'),
             'Period': period
         }
-        response = requests.get(
+        response = self._transport.get(
             self._base_url + 'QuoteListByDatePeriod',
             params=self.get_params(additional)
         )
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             quotes_xml = [el for el in list(root)
                           if el.tag.endswith('QUOTES')][0]
-            quotes = []
-            for quote_xml in list(quotes_xml):
-                quote = EodDataQuoteExtended.from_xml(quote_xml)
-                if quote:
-                    quotes.append(quote)
+            quotes = self.parse_quotes(quotes_xml, EodDataQuoteExtended)
             return EodDataQuoteExtended\
                 .format(quotes, output_format=output_format, df_index='Symbol')
         else:
             return self.retry(self.quote_list_by_date_period, exchange_code,
                               date, period, output_format=output_format)
 
+    @profiled
     @retry_limit
     def quote_list_by_date_period_compact(self, exchange_code, date, period,
                                           output_format='entity-list'):
@@ -556,25 +887,96 @@ class EodDataHttpClient(object):
             'QuoteDate': date.strftime('%Y%m%d'),
             'Period': period
         }
-        response = requests.get(
+        response = self._transport.get(
             self._base_url + 'QuoteListByDatePeriod2',
             params=self.get_params(additional)
         )
+        columns = self.scan_compact_response(
+            response, 'QUOTES2', QUOTE_COMPACT_ATTRIBUTES,
+            text=QUOTE_COMPACT_TEXT, datetimes=QUOTE_COMPACT_DATETIME
+        )
+        if columns is not None:
+            return self.scanned_quotes(columns, output_format)
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             quotes_xml = [el for el in list(root)
                           if el.tag.endswith('QUOTES2')][0]
-            quotes = []
-            for quote_xml in list(quotes_xml):
-                quote = EodDataQuoteCompact.from_xml(quote_xml)
-                if quote:
-                    quotes.append(quote)
+            quotes = self.parse_quotes(quotes_xml, EodDataQuoteCompact)
             return EodDataQuoteCompact\
                 .format(quotes, output_format=output_format, df_index='Symbol')
         else:
             return self.retry(self.quote_list_by_date_period_compact,
                               exchange_code, date, period, output_format)
 
+    @profiled
+    @retry_limit
+    def split_list_by_exchange(self, exchange_code,
+                               output_format='entity-list'):
+        """Get a list of splits of an entire exchange.
+
+        Args:
+            exchange_code (str): Exchange code.
+
+        Returns:
+            list or pandas.DataFrame: EodData splits.
+        """
+        additional = {
+            'Exchange': exchange_code.upper()
+        }
+        response = self._transport.get(
+            self._base_url + 'SplitListByExchange',
+            params=self.get_params(additional)
+        )
+        if self.process_response(response):
+            root = self.parse_xml(response)
+            splits_xml = [el for el in list(root)
+                          if el.tag.endswith('SPLITS')][0]
+            splits = []
+            for split_xml in list(splits_xml):
+                split = EodDataSplit.from_xml(split_xml)
+                if split:
+                    splits.append(split)
+            return EodDataSplit.format(splits, output_format=output_format)
+        else:
+            return self.retry(self.split_list_by_exchange, exchange_code,
+                              output_format=output_format)
+
+    @profiled
+    @retry_limit
+    def split_list_by_symbol(self, exchange_code, symbol,
+                             output_format='entity-list'):
+        """Get a list of splits of a specified symbol.
+
+        Args:
+            exchange_code (str): Exchange code.
+            symbol (str): Symbol.
+
+        Returns:
+            list or pandas.DataFrame: EodData splits.
+        """
+        additional = {
+            'Exchange': exchange_code.upper(),
+            'Symbol': symbol.upper()
+        }
+        response = self._transport.get(
+            self._base_url + 'SplitListBySymbol',
+            params=self.get_params(additional)
+        )
+        if self.process_response(response):
+            root = self.parse_xml(response)
+            splits_xml = [el for el in list(root)
+                          if el.tag.endswith('SPLITS')][0]
+            splits = []
+            for split_xml in list(splits_xml):
+                split = EodDataSplit.from_xml(split_xml)
+                if split:
+                    splits.append(split)
+            return EodDataSplit.format(splits, output_format=output_format)
+        else:
+            return self.retry(self.split_list_by_symbol, exchange_code,
+                              symbol, output_format=output_format)
+
+    @profiled
     @retry_limit
     def symbol_history(self, exchange_code, symbol, start_date,
                        output_format='entity-list'):
@@ -594,25 +996,22 @@ class EodDataHttpClient(object):
             'StartDate': start_date.strftime('%Y%m%d'),
             'Symbol': symbol.upper()
         }
-        response = requests.get(
+        response = self._transport.get(
             self._base_url + 'SymbolHistory',
             params=self.get_params(additional)
         )
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             quotes_xml = [el for el in list(root)
                           if el.tag.endswith('QUOTES')][0]
-            quotes = []
-            for quote_xml in list(quotes_xml):
-                quote = EodDataQuoteExtended.from_xml(quote_xml)
-                if quote:
-                    quotes.append(quote)
+            quotes = self.parse_quotes(quotes_xml, EodDataQuoteExtended)
             return EodDataQuoteExtended.format(quotes,
                                                output_format=output_format)
         else:
             return self.retry(self.symbol_history, exchange_code, symbol,
                               start_date, output_format=output_format)
 
+    @profiled
     @retry_limit
     def symbol_history_period(self, exchange_code, symbol, date, period,
                               output_format='entity-list'):
@@ -634,25 +1033,22 @@ class EodDataHttpClient(object):
             'Symbol': symbol.upper(),
             'Period': period
         }
-        response = requests.get(
+        response = self._transport.get(
             self._base_url + 'SymbolHistoryPeriod',
             params=self.get_params(additional)
         )
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             quotes_xml = [el for el in list(root)
                           if el.tag.endswith('QUOTES')][0]
-            quotes = []
-            for quote_xml in list(quotes_xml):
-                quote = EodDataQuoteExtended.from_xml(quote_xml)
-                if quote:
-                    quotes.append(quote)
+            quotes = self.parse_quotes(quotes_xml, EodDataQuoteExtended)
             return EodDataQuoteExtended\
                 .format(quotes, output_format=output_format)
         else:
             return self.retry(self.symbol_history_period, exchange_code, symbol,
                               date, period, output_format=output_format)
 
+    @profiled
     @retry_limit
     def symbol_history_period_by_range(self, exchange_code, symbol, start_date,
                                        end_date, period,
@@ -677,19 +1073,15 @@ class EodDataHttpClient(object):
             'Symbol': symbol.upper(),
             'Period': period
         }
-        response = requests.get(
+        response = self._transport.get(
             self._base_url + 'SymbolHistoryPeriodByDateRange',
             params=self.get_params(additional)
         )
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             quotes_xml = [el for el in list(root)
                           if el.tag.endswith('QUOTES')][0]
-            quotes = []
-            for quote_xml in list(quotes_xml):
-                quote = EodDataQuoteExtended.from_xml(quote_xml)
-                if quote:
-                    quotes.append(quote)
+            quotes = self.parse_quotes(quotes_xml, EodDataQuoteExtended)
             return EodDataQuoteExtended.format(quotes,
                                                output_format=output_format)
         else:
@@ -697,6 +1089,8 @@ class EodDataHttpClient(object):
                               exchange_code, symbol, start_date, end_date,
                               period, output_format=output_format)
 
+    @prefetched(EodDataSymbol.format)
+    @profiled
     @retry_limit
     def symbol_list(self, exchange_code, output_format='entity-list'):
         """Get a list of symbols of a specified exchange.
@@ -710,12 +1104,12 @@ class EodDataHttpClient(object):
         additional = {
             'Exchange': exchange_code.upper()
         }    
-        response = requests.get(
+        response = self._transport.get(
             self._base_url + 'SymbolList',
             params=self.get_params(additional)
         )
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             symbols_xml = [el for el in list(root)
                            if el.tag.endswith('SYMBOLS')][0]
             symbols = []
@@ -728,6 +1122,8 @@ class EodDataHttpClient(object):
             return self.retry(self.symbol_list, exchange_code,
                               output_format=output_format)
 
+    @profiled
+    @retry_limit
     def symbol_list_compact(self, exchange_code, output_format='entity-list'):
         """Get a list of symbols (compact format) of a specified exchange.
 
@@ -740,12 +1136,16 @@ class EodDataHttpClient(object):
         additional = {
             'Exchange': exchange_code.upper()
         }
-        response = requests.get(
+        response = self._transport.get(
             self._base_url + 'SymbolList2',
             params=self.get_params(additional)
         )
+        columns = self.scan_compact_response(response, 'SYMBOLS2',
+                                             SYMBOL_COMPACT_ATTRIBUTES)
+        if columns is not None:
+            return compact_symbols(columns, output_format=output_format)
         if self.process_response(response):
-            root = ET.fromstring(response.text)
+            root = self.parse_xml(response)
             symbols_xml = [el for el in list(root)
                            if el.tag.endswith('SYMBOLS2')][0]
             symbols = []
@@ -756,5 +1156,44 @@ class EodDataHttpClient(object):
             return EodDataSymbolCompact\
                 .format(symbols, output_format=output_format)
         else:
-            return self.retry(self.symbol_list, exchange_code,
+            return self.retry(self.symbol_list_compact, exchange_code,
+                              output_format=output_format)
+
+    @profiled
+    @retry_limit
+    def technical_list(self, exchange_code, output_format='entity-list'):
+        """Get a complete list of technical data for an entire exchange.
+
+        Attributes are parsed directly into typed columns, without
+        building an entity per symbol.
+
+        Args:
+            exchange_code (str): Exchange code.
+            output_format (str): 'entity-list', 'data-frame' or
+                'columns' (dict of numpy arrays).
+
+        Returns:
+            list of EodDataTechnical, pandas.DataFrame or dict:
+                Technicals, data frame is indexed by symbol.
+        """
+        additional = {
+            'Exchange': exchange_code.upper()
+        }
+        response = self._transport.get(self._base_url + 'TechnicalList',
+                                       params=self.get_params(additional))
+        if self.process_response(response):
+            root = self.parse_xml(response)
+            technicals_xml = [el for el in list(root)
+                              if el.tag.endswith('TECHNICALS')][0]
+            columns = parse_columns(
+                technicals_xml,
+                numeric_columns=EodDataTechnical.numeric_columns(),
+                datetime_columns=EodDataTechnical.datetime_columns()
+            )
+            if output_format == 'entity-list':
+                return EodDataTechnical.from_columns(columns)
+            return format_columns(columns, output_format=output_format,
+                                  index_column='Symbol')
+        else:
+            return self.retry(self.technical_list, exchange_code,
                               output_format=output_format)
@@ -0,0 +1,227 @@
+"""
+Bounded memory export of quotes to CSV or Parquet files.
+
+Quotes are written in chunks as responses arrive, so memory use depends
+on the chunk size and the number of prefetched responses, not on the
+length of the exported date range.
+"""
+import csv
+import logging
+import queue
+import threading
+
+from eoddata_client.eoddata_client import NoDataAvailableError
+from eoddata_client.trading_calendar import trading_days
+
+logger = logging.getLogger(__name__)
+
+EXPORT_COLUMNS = ('Datetime', 'Symbol', 'Open', 'High', 'Low', 'Close',
+                  'Volume', 'OpenInterest')
+
+
+def quote_row(quote):
+    """Get export row of a quote.
+
+    Args:
+        quote (EodDataQuoteExtended): Quote.
+
+    Returns:
+        tuple: Values in order of `EXPORT_COLUMNS`.
+    """
+    return (quote.quote_datetime, quote.symbol, quote.open, quote.high,
+            quote.low, quote.close, quote.volume, quote.open_interest)
+
+
+class CsvChunkWriter(object):
+    """Writes rows to a CSV file in chunks."""
+
+    def __init__(self, path, columns=EXPORT_COLUMNS):
+        self._file = open(path, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetChunkWriter(object):
+    """Writes rows to a Parquet file, one row group per chunk.
+
+    Requires pyarrow.
+    """
+
+    def __init__(self, path, columns=EXPORT_COLUMNS):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._columns = columns
+        types = {
+            'Datetime': pa.timestamp('ms'),
+            'Symbol': pa.string(),
+            'Volume': pa.int64(),
+            'OpenInterest': pa.int64(),
+        }
+        self._schema = pa.schema([(column, types.get(column, pa.float64()))
+                                  for column in columns])
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, rows):
+        arrays = [self._pa.array(values, type=field.type)
+                  for values, field in zip(zip(*rows), self._schema)]
+        self._writer.write_table(
+            self._pa.Table.from_arrays(arrays, schema=self._schema)
+        )
+
+    def close(self):
+        self._writer.close()
+
+
+WRITERS = {
+    'csv': CsvChunkWriter,
+    'parquet': ParquetChunkWriter,
+}
+
+
+class ExportStats(object):
+    """Export result.
+
+    Attributes:
+        responses (int): Number of exported responses.
+        rows (int): Number of exported rows.
+        skipped (list): Request arguments without data.
+    """
+
+    def __init__(self):
+        self.responses = 0
+        self.rows = 0
+        self.skipped = []
+
+
+_DONE = object()
+
+
+def export_quotes(fetch, requests, path, output_format='csv',
+                  chunk_rows=50000, prefetch=2):
+    """Stream quotes of several requests into a file.
+
+    Responses are downloaded on a background thread while previous ones
+    are written, at most `prefetch` downloaded responses wait for writing.
+    Rows are written whenever `chunk_rows` rows are buffered.
+
+    Args:
+        fetch: Function that gets a list of quotes for a request argument.
+        requests (iterable): Request arguments, for example dates.
+        path (str): Output file path.
+        output_format (str): 'csv' or 'parquet'.
+        chunk_rows (int): Rows per written chunk (Parquet row group).
+        prefetch (int): Maximum number of downloaded responses waiting
+            for writing, 0 to download and write sequentially.
+
+    Returns:
+        ExportStats
+    """
+    stats = ExportStats()
+    writer = WRITERS[output_format](path)
+    buffer = []
+    try:
+        for argument, quotes in _responses(fetch, requests, prefetch):
+            if quotes is None:
+                stats.skipped.append(argument)
+                continue
+            stats.responses += 1
+            for quote in quotes:
+                buffer.append(quote_row(quote))
+                if len(buffer) >= chunk_rows:
+                    writer.write(buffer)
+                    stats.rows += len(buffer)
+                    buffer = []
+        if buffer:
+            writer.write(buffer)
+            stats.rows += len(buffer)
+    finally:
+        writer.close()
+    return stats
+
+
+def _fetch_or_skip(fetch, argument):
+    try:
+        return fetch(argument)
+    except NoDataAvailableError:
+        return None
+
+
+def _responses(fetch, requests, prefetch):
+    """Yield (request argument, quotes or None) pairs in request order."""
+    if prefetch <= 0:
+        for argument in requests:
+            yield argument, _fetch_or_skip(fetch, argument)
+        return
+
+    responses = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for argument in requests:
+                if stop.is_set():
+                    return
+                responses.put((argument, _fetch_or_skip(fetch, argument)))
+        except Exception as e:
+            responses.put(e)
+        responses.put(_DONE)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = responses.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # unblock producer waiting on a full queue
+        while producer.is_alive():
+            try:
+                responses.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def export_quotes_by_date(client, exchange_code, start_date, end_date, path,
+                          output_format='csv', chunk_rows=50000, prefetch=2):
+    """Export end of day quotes of an entire exchange for every trading
+    day of a date range.
+
+    Days are taken from the exchange calendar, see
+    `trading_calendar.trading_days`. Days without data (unscheduled
+    closures) are skipped.
+
+    Args:
+        client (EodDataHttpClient): EodData client.
+        exchange_code (str): Exchange code.
+        start_date (datetime.date): First date.
+        end_date (datetime.date): Last date.
+        path (str): Output file path.
+        output_format (str): 'csv' or 'parquet'.
+        chunk_rows (int): Rows per written chunk (Parquet row group).
+        prefetch (int): Maximum number of downloaded responses waiting
+            for writing.
+
+    Returns:
+        ExportStats
+    """
+    dates = (day.date() for day in trading_days(start_date, end_date,
+                                                exchange_code))
+    return export_quotes(
+        lambda date: client.quote_list_by_date(exchange_code, date),
+        dates, path, output_format=output_format, chunk_rows=chunk_rows,
+        prefetch=prefetch
+    )
@@ -0,0 +1,309 @@
+"""
+Download manifests split into deterministic shards.
+
+A manifest lists work items of a backfill. Every node runs one shard of
+the manifest independently, shard membership of an item depends only
+on the item itself, so no coordination between nodes is needed. Outputs
+of all shards are combined by `merge_shards`.
+"""
+import datetime
+import glob
+import json
+import os
+import zlib
+
+from collections import namedtuple
+
+import pandas as pd
+
+from eoddata_client.trading_calendar import trading_days
+
+MANIFEST_VERSION = 1
+
+KIND_HISTORY = 'history'
+KIND_QUOTES = 'quotes'
+
+
+class Error(Exception):
+    """Base error for this module."""
+
+
+class ManifestError(Error):
+    """Manifest can not be read or is inconsistent."""
+
+
+class WorkItem(namedtuple('WorkItem', 'kind exchange key period')):
+    """Single download of a manifest.
+
+    Attributes:
+        kind (str): 'history' (key is a symbol) or 'quotes'
+            (key is a date in YYYY-MM-DD format).
+        exchange (str): Exchange code.
+        key (str): Symbol or date.
+        period (str or None): Period code, None for end of day data.
+    """
+    __slots__ = ()
+
+    @property
+    def name(self):
+        """str: Unique name of the item, used as output file name."""
+        key = self.key.replace('-', '') if self.kind == KIND_QUOTES \
+            else self.key
+        name = '{0}_{1}'.format(self.exchange, key)
+        if self.period:
+            name += '_{0}'.format(self.period)
+        return name
+
+    def shard(self, shard_count):
+        """Get shard index of the item.
+
+        Args:
+            shard_count (int): Number of shards.
+
+        Returns:
+            int
+        """
+        return zlib.crc32(self.name.encode('utf-8')) % shard_count
+
+    def fetch(self, client, start_date=None, end_date=None):
+        """Download the item.
+
+        Args:
+            client (EodDataHttpClient): EodData client.
+            start_date (datetime.date or None): History start date.
+            end_date (datetime.date or None): History end date, today
+                if None.
+
+        Returns:
+            pandas.DataFrame
+        """
+        if self.kind == KIND_QUOTES:
+            date = parse_date(self.key)
+            if self.period:
+                return client.quote_list_by_date_period(
+                    self.exchange, date, self.period,
+                    output_format='data-frame'
+                )
+            return client.quote_list_by_date(self.exchange, date,
+                                             output_format='data-frame')
+        period = self.period or 'd'
+        if end_date is None and period != 'd':
+            # SymbolHistoryPeriod returns bars of a single day only
+            end_date = datetime.date.today()
+        if end_date is not None:
+            return client.symbol_history_period_by_range(
+                self.exchange, self.key, start_date, end_date, period,
+                output_format='data-frame'
+            )
+        return client.symbol_history(self.exchange, self.key, start_date,
+                                     output_format='data-frame')
+
+
+def parse_date(value):
+    return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+
+
+class Manifest(object):
+    """List of work items of a backfill.
+
+    Attributes:
+        items (list of WorkItem): Work items.
+        start_date (datetime.date or None): History start date.
+        end_date (datetime.date or None): History end date.
+    """
+
+    def __init__(self, items, start_date=None, end_date=None):
+        self.items = list(items)
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def __len__(self):
+        return len(self.items)
+
+    def shard(self, shard_index, shard_count):
+        """Get items of a shard.
+
+        Args:
+            shard_index (int): Shard index, from 0 to shard_count - 1.
+            shard_count (int): Number of shards.
+
+        Returns:
+            list of WorkItem
+        """
+        if not 0 <= shard_index < shard_count:
+            raise ManifestError('Invalid shard {0} of {1}.'.format(
+                shard_index, shard_count
+            ))
+        return [item for item in self.items
+                if item.shard(shard_count) == shard_index]
+
+    def to_dict(self):
+        return {
+            'version': MANIFEST_VERSION,
+            'start_date': self.start_date and self.start_date.isoformat(),
+            'end_date': self.end_date and self.end_date.isoformat(),
+            'items': [list(item) for item in self.items],
+        }
+
+    @classmethod
+    def from_dict(cls, manifest_dict):
+        if manifest_dict.get('version') != MANIFEST_VERSION:
+            raise ManifestError('Unsupported manifest version: {0}'.format(
+                manifest_dict.get('version')
+            ))
+        start_date = manifest_dict.get('start_date')
+        end_date = manifest_dict.get('end_date')
+        return cls(
+            items=[WorkItem(*item) for item in manifest_dict['items']],
+            start_date=start_date and parse_date(start_date),
+            end_date=end_date and parse_date(end_date)
+        )
+
+    def save(self, path):
+        """Write manifest to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+    @classmethod
+    def load(cls, path):
+        """Read manifest from a JSON file.
+
+        Raises:
+            ManifestError: If the file can not be read or is invalid.
+        """
+        try:
+            with open(path) as f:
+                return cls.from_dict(json.load(f))
+        except OSError as e:
+            raise ManifestError('Could not read manifest {0}: {1}'.format(
+                path, e.strerror or e
+            ))
+        except (ValueError, KeyError, TypeError) as e:
+            raise ManifestError('Invalid manifest {0}: {1}'.format(path, e))
+
+
+def plan_history(client, exchange_codes, start_date, end_date=None,
+                 period=None, symbols=None):
+    """Plan download of symbol histories.
+
+    Args:
+        client (EodDataHttpClient): EodData client, used to get symbol lists.
+        exchange_codes (list of str): Exchange codes.
+        start_date (datetime.date): History start date.
+        end_date (datetime.date or None): History end date.
+        period (str or None): Period code, end of day data if None.
+        symbols (list of str or None): Symbols, all symbols of every
+            exchange if None.
+
+    Returns:
+        Manifest
+    """
+    items = []
+    for exchange in exchange_codes:
+        exchange = exchange.upper()
+        if symbols is None:
+            codes = [symbol.code for symbol in client.symbol_list(exchange)]
+        else:
+            codes = [symbol.upper() for symbol in symbols]
+        for code in codes:
+            items.append(WorkItem(KIND_HISTORY, exchange, code, period))
+    return Manifest(items, start_date=start_date, end_date=end_date)
+
+
+def plan_quotes(exchange_codes, start_date, end_date, period=None):
+    """Plan download of quotes of entire exchanges for every trading day
+    of a date range (see `trading_calendar.trading_days`).
+
+    Args:
+        exchange_codes (list of str): Exchange codes.
+        start_date (datetime.date): First date.
+        end_date (datetime.date): Last date.
+        period (str or None): Period code, end of day data if None.
+
+    Returns:
+        Manifest
+    """
+    items = []
+    for exchange in exchange_codes:
+        exchange = exchange.upper()
+        for day in trading_days(start_date, end_date, exchange):
+            items.append(WorkItem(KIND_QUOTES, exchange,
+                                  day.date().isoformat(), period))
+    return Manifest(items)
+
+
+def shard_status_path(directory, shard_index, shard_count):
+    return os.path.join(directory, 'shard-{0:04d}-of-{1:04d}.json'.format(
+        shard_index, shard_count
+    ))
+
+
+def write_shard_status(directory, shard_index, shard_count, done, failed):
+    """Record which items of a shard were downloaded.
+
+    Args:
+        directory (str): Shard output directory.
+        shard_index (int): Shard index.
+        shard_count (int): Number of shards.
+        done (list of str): Names of downloaded items.
+        failed (list of str): Names of failed items.
+    """
+    status = {'shard': shard_index, 'shards': shard_count,
+              'done': sorted(done), 'failed': sorted(failed)}
+    path = shard_status_path(directory, shard_index, shard_count)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(status, f, indent=1)
+    os.replace(path + '.tmp', path)
+
+
+def read_frame(path):
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, index_col=0)
+
+
+def merge_shards(manifest, directories, output, output_format='csv'):
+    """Combine outputs of all shards into one file per exchange.
+
+    Rows of every item get `Key` column with the item's symbol or date,
+    items are combined in manifest order.
+
+    Args:
+        manifest (Manifest): Manifest.
+        directories (list of str): Shard output directories.
+        output (str): Output directory.
+        output_format (str): 'csv' or 'parquet'.
+
+    Returns:
+        list of WorkItem: Items without output in any of the shards.
+    """
+    files = {}
+    done = set()
+    for directory in directories:
+        for status_path in glob.glob(os.path.join(directory, 'shard-*.json')):
+            with open(status_path) as f:
+                done.update(json.load(f)['done'])
+        for path in glob.glob(os.path.join(directory, '*.*')):
+            name, extension = os.path.splitext(os.path.basename(path))
+            if extension in ('.csv', '.parquet'):
+                files[name] = path
+
+    frames = {}
+    missing = []
+    for item in manifest.items:
+        if item.name in files:
+            df = read_frame(files[item.name])
+            df.insert(0, 'Key', item.key)
+            frames.setdefault(item.exchange, []).append(df)
+        elif item.name not in done:
+            missing.append(item)
+
+    os.makedirs(output, exist_ok=True)
+    for exchange, exchange_frames in frames.items():
+        path = os.path.join(output, '{0}.{1}'.format(exchange, output_format))
+        df = pd.concat(exchange_frames)
+        if output_format == 'parquet':
+            df.to_parquet(path)
+        else:
+            df.to_csv(path)
+    return missing
@@ -0,0 +1,166 @@
+"""
+Aligned multi-symbol panels (dates x symbols).
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from eoddata_client.eoddata_client import NoDataAvailableError
+
+FILL_FORWARD = 'ffill'
+
+
+def _nanoseconds(dates):
+    """Get datetimes as int64 nanoseconds (any pandas datetime unit)."""
+    return pd.DatetimeIndex(dates).values.astype('datetime64[ns]').view('i8')
+
+
+def _panel_rows(frames, field, symbols):
+    """Get date (int64 nanoseconds), symbol position and value of every row.
+
+    Returns:
+        tuple of numpy.ndarray and pandas.Index: Row dates, row symbol
+            positions (-1 if symbol is not in the panel), row values
+            and panel symbols.
+    """
+    if isinstance(frames, pd.DataFrame):
+        codes, uniques = pd.factorize(frames['Symbol'].astype(object))
+        if symbols is None:
+            symbols = pd.Index(uniques)
+        else:
+            symbols = pd.Index(symbols)
+        positions = np.append(symbols.get_indexer(uniques), -1)[codes]
+        dates = _nanoseconds(frames.index)
+        values = frames[field].to_numpy(dtype=float)
+        return dates, positions, values, symbols
+
+    symbols = pd.Index(list(frames) if symbols is None else symbols)
+    selected = [(symbols.get_loc(symbol), df)
+                for symbol, df in frames.items()
+                if symbol in symbols and len(df)]
+    if not selected:
+        return np.empty(0, dtype='int64'), np.empty(0, dtype=int), \
+            np.empty(0), symbols
+    dates = np.concatenate([_nanoseconds(df.index) for _, df in selected])
+    positions = np.repeat([position for position, _ in selected],
+                          [len(df) for _, df in selected])
+    values = np.concatenate([df[field].to_numpy(dtype=float)
+                             for _, df in selected])
+    return dates, positions, values, symbols
+
+
+def build_panel(frames, field='Close', symbols=None, dates=None,
+                start_date=None, end_date=None, fill=None,
+                output_format='data-frame'):
+    """Build aligned (dates x symbols) panel of a quote field.
+
+    Values are placed into a 2-D array with a single vectorized
+    assignment, without joining data frames one by one.
+
+    Args:
+        frames (dict or pandas.DataFrame): Symbol to quote data frame
+            (datetime index), or a data frame with `Symbol` column.
+        field (str): Quote column, for example `Close` or `Volume`.
+        symbols (list of str or None): Panel columns, all symbols
+            in order of appearance if None.
+        dates (iterable or None): Panel rows (for example business days),
+            union of quote dates if None.
+        start_date (datetime.date or None): First date.
+        end_date (datetime.date or None): Last date.
+        fill (None, 'ffill' or scalar): Value of missing days: NaN if None,
+            last known value if 'ffill', or a scalar (for example 0 for
+            volume).
+        output_format (str): 'data-frame' or 'array' to get tuple of
+            dates, symbols and 2-D numpy array.
+
+    Returns:
+        pandas.DataFrame or tuple
+    """
+    row_dates, row_symbols, values, symbols = _panel_rows(frames, field,
+                                                          symbols)
+    if dates is None:
+        dates = np.unique(row_dates)
+    else:
+        dates = _nanoseconds(dates)
+    dates = pd.DatetimeIndex(dates.view('datetime64[ns]'))
+    if start_date is not None:
+        dates = dates[dates >= pd.Timestamp(start_date)]
+    if end_date is not None:
+        dates = dates[dates <= pd.Timestamp(end_date)]
+
+    # dates are sorted, so rows are located by binary search
+    date_values = _nanoseconds(dates)
+    row_positions = np.searchsorted(date_values, row_dates)
+    found = row_positions < len(date_values)
+    found[found] = date_values[row_positions[found]] == row_dates[found]
+    selected = found & (row_symbols >= 0)
+
+    panel = np.full((len(dates), len(symbols)), np.nan)
+    panel[row_positions[selected], row_symbols[selected]] = values[selected]
+
+    if fill == FILL_FORWARD:
+        panel = forward_fill(panel)
+    elif fill is not None:
+        panel[np.isnan(panel)] = fill
+
+    if output_format == 'array':
+        return dates, symbols, panel
+    return pd.DataFrame(panel, index=dates, columns=symbols)
+
+
+def forward_fill(panel):
+    """Fill NaN values of every column with the last known value.
+
+    Args:
+        panel (numpy.ndarray): 2-D array.
+
+    Returns:
+        numpy.ndarray
+    """
+    rows = np.where(np.isnan(panel), 0, np.arange(len(panel))[:, None])
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    return panel[rows, np.arange(panel.shape[1])]
+
+
+def fetch_panel(client, exchange_code, symbols, start_date, end_date,
+                field='Close', dates=None, fill=None, max_workers=8,
+                output_format='data-frame'):
+    """Fetch daily history of several symbols concurrently and build
+    an aligned panel.
+
+    Symbols without data in the date range get empty (or filled)
+    columns.
+
+    Args:
+        client (EodDataHttpClient): EodData client.
+        exchange_code (str): Exchange code.
+        symbols (list of str): Symbols.
+        start_date (datetime.date): First date.
+        end_date (datetime.date): Last date.
+        field (str): Quote column.
+        dates (iterable or None): Panel rows, union of quote dates if None.
+        fill (None, 'ffill' or scalar): Value of missing days.
+        max_workers (int): Maximum number of concurrent requests.
+        output_format (str): 'data-frame' or 'array'.
+
+    Returns:
+        pandas.DataFrame or tuple, see `build_panel`.
+    """
+    symbols = [symbol.upper() for symbol in symbols]
+
+    def fetch(symbol):
+        try:
+            return client.symbol_history_period_by_range(
+                exchange_code, symbol, start_date, end_date, 'd',
+                output_format='data-frame'
+            )
+        except NoDataAvailableError:
+            return pd.DataFrame()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers,
+                                                   len(symbols)))) as pool:
+        frames = dict(zip(symbols, pool.map(fetch, symbols)))
+    return build_panel(frames, field=field, symbols=symbols, dates=dates,
+                       start_date=start_date, end_date=end_date, fill=fill,
+                       output_format=output_format)
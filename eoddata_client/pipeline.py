@@ -0,0 +1,238 @@
+"""
+Asyncio pipeline of concurrent stages with backpressure.
+
+Items flow through stages (for example fetch -> transform -> write)
+connected by bounded queues. Every stage runs several workers, blocking
+functions (client endpoints, file writers) run on a thread pool and
+coroutine functions run on the event loop. A full queue suspends the
+workers of the previous stage, so a slow writer throttles fetching and
+at most `queue_size + workers` results per stage are held in memory.
+The first error cancels the pipeline and is raised by `run`.
+
+Example:
+
+    pipeline = Pipeline(queue_size=2)
+    pipeline.add_stage('fetch', fetch_history, workers=4)
+    pipeline.add_stage('write', write_csv, workers=1)
+    loop.run_until_complete(pipeline.run(symbols))
+"""
+import asyncio
+import functools
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from eoddata_client.eoddata_client import NoDataAvailableError
+
+# marks the end of the items of a queue
+_DONE = object()
+
+
+class Error(Exception):
+    """Base error for this module."""
+
+
+class PipelineError(Error):
+    """Pipeline is not configured properly."""
+
+
+class Stage(namedtuple('Stage', 'name func workers')):
+    """Pipeline stage.
+
+    Attributes:
+        name (str): Stage name.
+        func (callable): Function or coroutine function of an item,
+            returns the item of the next stage (None drops the item).
+        workers (int): Number of concurrent workers.
+    """
+    __slots__ = ()
+
+
+class Pipeline(object):
+    """Pipeline of concurrent stages connected by bounded queues.
+
+    Attributes:
+        stages (list of Stage): Stages in order.
+        queue_size (int): Maximum number of items waiting for a stage.
+    """
+
+    def __init__(self, queue_size=2):
+        self.stages = []
+        self.queue_size = queue_size
+
+    def add_stage(self, name, func, workers=1):
+        """Append a stage.
+
+        Args:
+            name (str): Stage name.
+            func (callable): Function or coroutine function of an item.
+                Blocking functions run on a thread pool.
+            workers (int): Number of concurrent workers.
+
+        Returns:
+            Pipeline: self
+        """
+        if workers < 1:
+            raise PipelineError('Stage needs at least one worker.')
+        self.stages.append(Stage(name, func, workers))
+        return self
+
+    async def _feed(self, items, queue, workers):
+        for item in items:
+            await queue.put(item)
+        for _ in range(workers):
+            await queue.put(_DONE)
+
+    async def _work(self, index, call, source, target, target_workers,
+                    finished, results):
+        while True:
+            item = await source.get()
+            if item is _DONE:
+                break
+            result = await call(item)
+            if result is None:
+                continue
+            if target is None:
+                results.append(result)
+            else:
+                await target.put(result)
+        finished[index] -= 1
+        if finished[index] == 0 and target is not None:
+            # the last worker of a stage ends the next stage
+            for _ in range(target_workers):
+                await target.put(_DONE)
+
+    async def run(self, items, executor=None):
+        """Run items through the stages.
+
+        Args:
+            items (iterable): Items of the first stage.
+            executor (concurrent.futures.Executor or None): Executor of
+                blocking stage functions, a thread pool with a thread per
+                blocking worker if None.
+
+        Returns:
+            list: Non-None results of the last stage (in completion order).
+
+        Raises:
+            PipelineError: There are no stages.
+            Exception: First error raised by a stage function.
+        """
+        if not self.stages:
+            raise PipelineError('Pipeline has no stages.')
+        loop = asyncio.get_event_loop()
+        own_executor = executor is None
+        if own_executor:
+            threads = sum(stage.workers for stage in self.stages
+                          if not asyncio.iscoroutinefunction(stage.func))
+            executor = ThreadPoolExecutor(max_workers=max(threads, 1))
+
+        def caller(func):
+            if asyncio.iscoroutinefunction(func):
+                return func
+
+            async def call(item):
+                return await loop.run_in_executor(
+                    executor, functools.partial(func, item)
+                )
+            return call
+
+        queues = [asyncio.Queue(maxsize=self.queue_size)
+                  for _ in self.stages]
+        # running workers of every stage
+        finished = [stage.workers for stage in self.stages]
+        results = []
+        tasks = [asyncio.ensure_future(
+            self._feed(items, queues[0], self.stages[0].workers)
+        )]
+        for i, stage in enumerate(self.stages):
+            if i + 1 < len(self.stages):
+                target, target_workers = queues[i + 1], \
+                    self.stages[i + 1].workers
+            else:
+                target, target_workers = None, 0
+            call = caller(stage.func)
+            tasks.extend(
+                asyncio.ensure_future(self._work(
+                    i, call, queues[i], target, target_workers, finished,
+                    results
+                ))
+                for _ in range(stage.workers)
+            )
+        try:
+            done, pending = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+            return results
+        finally:
+            # cancel the rest on error or when the run itself is cancelled
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if own_executor:
+                executor.shutdown(wait=False)
+
+
+def history_pipeline(client, exchange_code, start_date, end_date, write,
+                     transform=None, period='d', fetch_workers=4,
+                     transform_workers=1, write_workers=1, queue_size=2):
+    """Build a pipeline that fetches, transforms and writes history of
+    symbols. Items of the pipeline are symbols, symbols without data are
+    skipped.
+
+    Args:
+        client (EodDataHttpClient): EodData client.
+        exchange_code (str): Exchange code.
+        start_date (datetime.date): First date.
+        end_date (datetime.date): Last date.
+        write (callable): Function or coroutine function of
+            (symbol, data frame).
+        transform (callable or None): Function or coroutine function of
+            (symbol, data frame) that returns a data frame.
+        period (str): Period code.
+        fetch_workers (int): Number of concurrent requests.
+        transform_workers (int): Number of concurrent transforms.
+        write_workers (int): Number of concurrent writes.
+        queue_size (int): Maximum number of items waiting for a stage.
+
+    Returns:
+        Pipeline: Pipeline to run with the symbols, for example
+            `loop.run_until_complete(pipeline.run(symbols))`.
+    """
+    def fetch(symbol):
+        try:
+            df = client.symbol_history_period_by_range(
+                exchange_code, symbol, start_date, end_date, period,
+                output_format='data-frame'
+            )
+        except NoDataAvailableError:
+            return None
+        return symbol, df
+
+    pipeline = Pipeline(queue_size=queue_size)
+    pipeline.add_stage('fetch', fetch, workers=fetch_workers)
+    if transform is not None:
+        pipeline.add_stage('transform', _unpacked(transform),
+                           workers=transform_workers)
+    pipeline.add_stage('write', _unpacked(write, keep_symbol=False),
+                       workers=write_workers)
+    return pipeline
+
+
+def _unpacked(func, keep_symbol=True):
+    """Wrap function of (symbol, data frame) as function of an item."""
+    def wrap(item, result):
+        if result is None or not keep_symbol:
+            return result
+        return item[0], result
+
+    if asyncio.iscoroutinefunction(func):
+        async def call(item):
+            return wrap(item, await func(*item))
+    else:
+        def call(item):
+            return wrap(item, func(*item))
+    return call
@@ -0,0 +1,149 @@
+"""
+Intraday polling of end of day quotes that emits only changed quotes.
+"""
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class QuotePoller(object):
+    """Polls quotes of an exchange (or specific symbols) and emits only
+    quotes that changed since the previous poll.
+
+    A quote is considered changed if its modification time, close price
+    or volume differ from the last seen values of its symbol.
+
+    Polls are scheduled on a fixed grid (start + n * interval), so the
+    schedule does not drift by the time spent on requests. Ticks missed
+    because a poll took longer than the interval are skipped.
+
+    Can be used with a callback:
+
+        poller = QuotePoller(client, 'nasdaq', interval=60)
+        poller.run(callback=lambda quotes: print(quotes))
+
+    or as an async iterator:
+
+        async for quotes in QuotePoller(client, 'nasdaq', interval=60):
+            print(quotes)
+
+    Attributes:
+        client (EodDataHttpClient): EodData client.
+        exchange_code (str): Exchange code.
+        symbols (list of str or None): Symbols to poll, the whole exchange
+            is polled if None.
+        interval (float): Poll interval in seconds.
+    """
+
+    def __init__(self, client, exchange_code, symbols=None, interval=60):
+        """
+        Args:
+            client (EodDataHttpClient): EodData client.
+            exchange_code (str): Exchange code.
+            symbols (list of str or None): Symbols to poll, the whole
+                exchange is polled if None.
+            interval (float): Poll interval in seconds.
+        """
+        self.client = client
+        self.exchange_code = exchange_code
+        self.symbols = symbols
+        self.interval = interval
+        self._last_seen = {}
+        self._start = None
+        self._ticks = 0
+
+    def fetch(self):
+        """Get current quotes.
+
+        Returns:
+            list of EodDataQuoteExtended
+        """
+        if self.symbols is None:
+            return self.client.quote_list(self.exchange_code)
+        return self.client.quote_list_specific(self.exchange_code,
+                                               self.symbols)
+
+    def changed(self, quotes):
+        """Filter quotes that changed since they were seen last time
+        and remember them.
+
+        Args:
+            quotes (list of EodDataQuoteExtended): Quotes.
+
+        Returns:
+            list of EodDataQuoteExtended
+        """
+        changed = []
+        last_seen = self._last_seen
+        for quote in quotes:
+            state = (quote.modified, quote.close, quote.volume)
+            if last_seen.get(quote.symbol) != state:
+                last_seen[quote.symbol] = state
+                changed.append(quote)
+        return changed
+
+    def poll(self):
+        """Fetch quotes once.
+
+        Returns:
+            list of EodDataQuoteExtended: Changed quotes.
+        """
+        return self.changed(self.fetch())
+
+    def reset(self):
+        """Forget seen quotes and schedule, next poll emits all quotes."""
+        self._last_seen = {}
+        self._start = None
+        self._ticks = 0
+
+    def _delay(self):
+        """Get delay in seconds until the next scheduled poll."""
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+            return 0
+        self._ticks += 1
+        next_time = self._start + self._ticks * self.interval
+        if next_time < now:
+            # skip missed ticks instead of polling in a burst
+            self._ticks = int((now - self._start) // self.interval) + 1
+            next_time = self._start + self._ticks * self.interval
+        return next_time - now
+
+    def run(self, callback, stop_event=None, max_polls=None):
+        """Poll quotes until stopped and pass changed quotes to callback.
+
+        Args:
+            callback: Function that accepts a list of changed quotes,
+                is not called if nothing changed.
+            stop_event (threading.Event or None): Polling stops when set.
+            max_polls (int or None): Maximum number of polls.
+        """
+        stop_event = stop_event or threading.Event()
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            if stop_event.wait(self._delay()):
+                break
+            polls += 1
+            try:
+                changed = self.poll()
+            except Exception:
+                logger.exception('Could not poll quotes of %s.',
+                                 self.exchange_code)
+                continue
+            if changed:
+                callback(changed)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            await asyncio.sleep(self._delay())
+            changed = await loop.run_in_executor(None, self.poll)
+            if changed:
+                return changed
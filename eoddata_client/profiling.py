@@ -0,0 +1,177 @@
+"""
+Opt-in profiling of client endpoints.
+
+Profiling is switched on with `profile_dir` option of the client or
+with `EODDATA_CLIENT_PROFILE_DIR` environment variable. Every endpoint
+call is run under cProfile, its profile is written to the directory
+(`<endpoint>-<time>-<pid>-<n>.prof`, readable with `pstats` or
+snakeviz) and a line with time split into network wait, parsing,
+conversion and wait for worker threads is appended to `summary.jsonl`.
+Only the calling thread is profiled, requests made by worker threads
+(batches of `quote_list_specific`) are counted as worker wait. When profiling is off an
+endpoint call costs one attribute check.
+"""
+import cProfile
+import datetime
+import itertools
+import json
+import os
+import threading
+import time
+
+from functools import wraps
+
+PROFILE_DIR_ENVIRONMENT_VARIABLE = 'EODDATA_CLIENT_PROFILE_DIR'
+
+SUMMARY_FILE = 'summary.jsonl'
+
+# (file name suffix, function name) of functions that wait for network
+NETWORK_FUNCTIONS = (
+    ('requests/api.py', 'request'),
+    ('requests/sessions.py', 'request'),
+)
+
+# functions that wait for results of worker threads
+WORKER_FUNCTIONS = (
+    ('concurrent/futures/_base.py', 'result'),
+    ('concurrent/futures/thread.py', 'shutdown'),
+)
+
+# functions that convert parsed entities to output format
+CONVERSION_FUNCTIONS = (
+    ('eoddata_client/business_entities.py', 'format'),
+    ('eoddata_client/columnar.py', 'format_columns'),
+)
+
+
+def _matches(key, functions):
+    filename, _, function_name = key
+    filename = filename.replace(os.sep, '/')
+    return any(filename.endswith(suffix) and function_name == name
+               for suffix, name in functions)
+
+
+class EndpointProfiler(object):
+    """Profiles endpoint calls and writes profiles to a directory.
+
+    Attributes:
+        directory (str): Output directory.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._counter = itertools.count()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls):
+        """Get profiler if profiling is switched on by environment variable.
+
+        Returns:
+            EndpointProfiler or None
+        """
+        directory = os.environ.get(PROFILE_DIR_ENVIRONMENT_VARIABLE)
+        if directory:
+            return cls(directory)
+
+    def call(self, endpoint, func, *args, **kwargs):
+        """Call endpoint function under profiler.
+
+        Nested calls (retries) are profiled as part of the outer call.
+        """
+        if getattr(self._local, 'active', False):
+            return func(*args, **kwargs)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # other profiler is active (Python 3.12+ allows only one
+            # at a time), record total time only
+            profile = None
+        self._local.active = True
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            total = time.perf_counter() - started
+            if profile is not None:
+                profile.disable()
+            self._local.active = False
+            self.dump(endpoint, total, profile)
+
+    def dump(self, endpoint, total, profile=None):
+        """Write profile and time split of an endpoint call."""
+        record = {
+            'endpoint': endpoint,
+            'time': datetime.datetime.now().isoformat(),
+            'total': total,
+        }
+        if profile is not None:
+            name = '{0}-{1:%Y%m%dT%H%M%S}-{2}-{3}.prof'.format(
+                endpoint, datetime.datetime.now(), os.getpid(),
+                next(self._counter)
+            )
+            path = os.path.join(self.directory, name)
+            profile.dump_stats(path)
+            profile.create_stats()
+            split = {'network': 0.0, 'conversion': 0.0, 'workers': 0.0}
+            categories = (('network', NETWORK_FUNCTIONS),
+                          ('conversion', CONVERSION_FUNCTIONS),
+                          ('workers', WORKER_FUNCTIONS))
+            for key, (_, _, _, cumulative, callers) in profile.stats.items():
+                for category, functions in categories:
+                    # only outermost calls, recursive ones are part of them
+                    if _matches(key, functions) \
+                            and not any(_matches(c, functions)
+                                        for c in callers):
+                        split[category] += cumulative
+                        break
+            record.update(split)
+            record.update({
+                'profile': name,
+                'parsing': max(total - sum(split.values()), 0.0),
+            })
+        with self._lock:
+            with open(os.path.join(self.directory, SUMMARY_FILE), 'a') as f:
+                f.write(json.dumps(record) + '\n')
+
+
+def profiled(func):
+    """Decorator that profiles client endpoint if client's profiler is set.
+
+    Returns:
+        Wrapped function.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self.profiler is None:
+            return func(self, *args, **kwargs)
+        return self.profiler.call(func.__name__, func, self, *args, **kwargs)
+    return wrapper
+
+
+def read_summary(directory):
+    """Aggregate time split of profiled calls by endpoint.
+
+    Args:
+        directory (str): Profile directory.
+
+    Returns:
+        dict: Endpoint to dict with `calls`, `total`, `network`, `parsing`,
+            `conversion` and `workers` seconds.
+    """
+    summary = {}
+    with open(os.path.join(directory, SUMMARY_FILE)) as f:
+        for line in f:
+            record = json.loads(line)
+            endpoint = summary.setdefault(record['endpoint'], {
+                'calls': 0, 'total': 0.0, 'network': 0.0, 'parsing': 0.0,
+                'conversion': 0.0, 'workers': 0.0
+            })
+            endpoint['calls'] += 1
+            for key in ('total', 'network', 'parsing', 'conversion',
+                        'workers'):
+                endpoint[key] += record.get(key, 0.0)
+    return summary
@@ -0,0 +1,173 @@
+"""
+Cache of quote details that is invalidated when an exchange has new data.
+"""
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class QuoteCache(object):
+    """LRU cache of `quote_detail` results.
+
+    Cached quotes of an exchange stay valid until the last trade time of
+    the exchange advances. The last trade time is checked with
+    `exchange_detail` at most once per `check_interval` seconds for every
+    exchange, a single thread checks an exchange while others are served
+    from the cache. Quotes are not cached until the last trade time of
+    their exchange is known. Exchange lists requested anyway (for example
+    by `MarketSnapshot`) can be passed to `update_exchanges` to save
+    checks.
+
+        cache = QuoteCache(client, max_size=1000, check_interval=30)
+        quote = cache.quote_detail('nasdaq', 'msft')
+
+    Attributes:
+        client (EodDataHttpClient): EodData client.
+        max_size (int): Maximum number of cached quotes.
+        check_interval (float): Minimum number of seconds between
+            checks of an exchange.
+        hits (int): Number of quotes served from the cache.
+        misses (int): Number of quotes requested from the web service.
+        invalidations (int): Number of times cached quotes of an exchange
+            were dropped because the exchange has new data.
+    """
+
+    def __init__(self, client, max_size=1024, check_interval=30,
+                 clock=time.monotonic):
+        """
+        Args:
+            client (EodDataHttpClient): EodData client.
+            max_size (int): Maximum number of cached quotes.
+            check_interval (float): Minimum number of seconds between
+                checks of an exchange.
+            clock: Function that returns current time in seconds.
+        """
+        self.client = client
+        self.max_size = max_size
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._clock = clock
+        self._quotes = OrderedDict()
+        self._last_trade_times = {}
+        self._checked = {}
+        # invalidation count of every exchange
+        self._generations = {}
+        self._lock = threading.Lock()
+        # check lock of every exchange
+        self._check_locks = {}
+
+    def update_exchange(self, exchange):
+        """Drop cached quotes of an exchange if its last trade time
+        advanced.
+
+        Args:
+            exchange (EodDataExchange): Current exchange details.
+        """
+        code = exchange.code.upper()
+        with self._lock:
+            self._checked[code] = self._clock()
+            known = self._last_trade_times.get(code)
+            self._last_trade_times[code] = exchange.last_trade_time
+            if known is None or known == exchange.last_trade_time:
+                return
+            stale = [key for key in self._quotes if key[0] == code]
+            for key in stale:
+                del self._quotes[key]
+            self._generations[code] = self._generations.get(code, 0) + 1
+            self.invalidations += 1
+        logger.debug('Exchange %s has new data, dropped %s cached quotes.',
+                     code, len(stale))
+
+    def update_exchanges(self, exchanges):
+        """Update several exchanges, see `update_exchange`.
+
+        Args:
+            exchanges (list of EodDataExchange): Current exchange details.
+        """
+        for exchange in exchanges:
+            self.update_exchange(exchange)
+
+    def check_exchange(self, exchange_code):
+        """Check the last trade time of an exchange if it was not checked
+        for `check_interval` seconds.
+
+        Args:
+            exchange_code (str): Exchange code.
+        """
+        code = exchange_code.upper()
+        checked = self._checked.get(code)
+        if checked is not None \
+                and self._clock() - checked < self.check_interval:
+            return
+        with self._lock:
+            check_lock = self._check_locks.setdefault(code,
+                                                      threading.Lock())
+        # one thread checks, the others keep using the cache meanwhile
+        if not check_lock.acquire(blocking=False):
+            return
+        try:
+            exchange = self.client.exchange_detail(code)
+        except Exception:
+            logger.exception('Could not check exchange %s.', code)
+            # do not retry the check on every read
+            self._checked[code] = self._clock()
+            return
+        finally:
+            check_lock.release()
+        if exchange is not None:
+            self.update_exchange(exchange)
+
+    def quote_detail(self, exchange_code, symbol):
+        """Get an end of day quote for a specific symbol.
+
+        Args:
+            exchange_code (str): Exchange code.
+            symbol (str): Symbol.
+
+        Returns:
+            EodDataQuoteExtended or None
+        """
+        self.check_exchange(exchange_code)
+        key = (exchange_code.upper(), symbol.upper())
+        with self._lock:
+            quote = self._quotes.get(key)
+            if quote is not None:
+                self._quotes.move_to_end(key)
+                self.hits += 1
+                return quote
+            self.misses += 1
+            generation = self._generations.get(key[0], 0)
+            # without a known last trade time the quote could not be
+            # invalidated when the exchange advances
+            cacheable = key[0] in self._last_trade_times
+        quote = self.client.quote_detail(exchange_code, symbol)
+        if quote is None or not cacheable:
+            return quote
+        with self._lock:
+            if self._generations.get(key[0], 0) != generation \
+                    or key[0] not in self._last_trade_times:
+                # exchange got new data (or the cache was cleared) while
+                # the quote was requested
+                return quote
+            self._quotes[key] = quote
+            self._quotes.move_to_end(key)
+            while len(self._quotes) > self.max_size:
+                self._quotes.popitem(last=False)
+        return quote
+
+    def clear(self):
+        """Drop all cached quotes and exchange details."""
+        with self._lock:
+            self._quotes.clear()
+            self._last_trade_times.clear()
+            self._checked.clear()
+            self._generations.clear()
+
+    def __len__(self):
+        return len(self._quotes)
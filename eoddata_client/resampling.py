@@ -0,0 +1,135 @@
+"""
+Local resampling of quotes to coarser periods.
+"""
+import pandas as pd
+
+from eoddata_client.business_entities import categorize_columns
+
+# pandas offset aliases of EodData periods
+PERIOD_RULES = {
+    '1': '1min',
+    '5': '5min',
+    '10': '10min',
+    '15': '15min',
+    '30': '30min',
+    'h': '60min',
+    'd': 'D',
+    'w': 'W-MON',
+    'm': 'MS',
+}
+
+OHLCV_AGGREGATION = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Volume': 'sum',
+}
+
+# EodData time zone names (Windows time zones) to IANA time zones
+TIMEZONES = {
+    'AUS Eastern Standard Time': 'Australia/Sydney',
+    'Central Europe Standard Time': 'Europe/Budapest',
+    'Central Standard Time': 'America/Chicago',
+    'China Standard Time': 'Asia/Shanghai',
+    'E. Africa Standard Time': 'Africa/Nairobi',
+    'Eastern Standard Time': 'America/New_York',
+    'GMT Standard Time': 'Europe/London',
+    'India Standard Time': 'Asia/Kolkata',
+    'Mountain Standard Time': 'America/Denver',
+    'New Zealand Standard Time': 'Pacific/Auckland',
+    'Pacific Standard Time': 'America/Los_Angeles',
+    'Romance Standard Time': 'Europe/Paris',
+    'Singapore Standard Time': 'Asia/Singapore',
+    'South Africa Standard Time': 'Africa/Johannesburg',
+    'Tokyo Standard Time': 'Asia/Tokyo',
+    'W. Europe Standard Time': 'Europe/Berlin',
+}
+
+
+class Error(Exception):
+    """Base error for this module."""
+
+
+class ResamplingError(Error):
+    """Quotes can not be resampled to a requested period."""
+
+
+def exchange_timezone(exchange_or_timezone):
+    """Get IANA time zone of an exchange.
+
+    Args:
+        exchange_or_timezone (EodDataExchange or str): Exchange, EodData
+            time zone name or IANA time zone name.
+
+    Returns:
+        str: IANA time zone name.
+    """
+    timezone = getattr(exchange_or_timezone, 'timezone', exchange_or_timezone)
+    return TIMEZONES.get(timezone, timezone)
+
+
+def resample_quotes(df, period, timezone=None):
+    """Resample quotes to a coarser period.
+
+    Datetimes of EodData quotes are in exchange local time, so naive
+    datetimes are resampled as is. Time zone aware datetimes are converted
+    to the exchange time zone first, so that daily, weekly and monthly bars
+    follow exchange sessions.
+
+    Args:
+        df (pandas.DataFrame): Quotes with datetime index and `Open`, `High`,
+            `Low`, `Close`, `Volume` columns (and optional `Symbol` column),
+            for example 1 minute quotes in 'data-frame' output format.
+        period (str): Period code, see `PERIODS`.
+        timezone (EodDataExchange or str or None): Exchange or its time zone.
+
+    Returns:
+        pandas.DataFrame: Resampled quotes, periods without quotes
+            are omitted. Bars are labeled by period start.
+
+    Raises:
+        ResamplingError
+    """
+    if period not in PERIOD_RULES:
+        raise ResamplingError('Unknown period: {0}'.format(period))
+    if not isinstance(df.index, pd.DatetimeIndex):
+        df = df.set_index(pd.DatetimeIndex(df.index))
+    if timezone is not None and df.index.tz is not None:
+        df = df.tz_convert(exchange_timezone(timezone))
+
+    aggregation = {column: function
+                   for column, function in OHLCV_AGGREGATION.items()
+                   if column in df.columns}
+    grouper = pd.Grouper(freq=PERIOD_RULES[period], closed='left',
+                         label='left')
+    if 'Symbol' in df.columns:
+        resampled = df.groupby([grouper, 'Symbol'], observed=True,
+                               sort=True).agg(aggregation)
+        resampled = resampled.reset_index(level='Symbol')
+    else:
+        resampled = df.groupby(grouper).agg(aggregation)
+    resampled = resampled.dropna(subset=[c for c in ('Open', 'Close')
+                                         if c in resampled.columns],
+                                 how='all')
+    resampled.index.name = df.index.name
+    columns = [c for c in df.columns if c in resampled.columns]
+    return categorize_columns(resampled[columns], ('Symbol',))
+
+
+def resample_all(df, periods=None, timezone=None):
+    """Resample quotes to several periods at once.
+
+    Args:
+        df (pandas.DataFrame): Quotes, see `resample_quotes`.
+        periods (iterable of str or None): Period codes, all periods
+            coarser than one minute if None.
+        timezone (EodDataExchange or str or None): Exchange or its time zone.
+
+    Returns:
+        dict: Period code to resampled quotes.
+    """
+    if periods is None:
+        periods = [period for period in PERIOD_RULES if period != '1']
+    return {period: resample_quotes(df, period, timezone=timezone)
+            for period in periods}
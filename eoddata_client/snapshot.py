@@ -0,0 +1,113 @@
+"""
+Concurrent end of day snapshots of several exchanges.
+"""
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+
+from eoddata_client.eoddata_client import Error as ClientError
+
+logger = logging.getLogger(__name__)
+
+
+class MarketSnapshot(object):
+    """End of day snapshot of all (or selected) exchanges.
+
+    Quote lists of the exchanges are requested concurrently. Exchanges whose
+    last trade time has not changed since the previous snapshot are not
+    requested again, quotes from the previous snapshot are reused instead.
+
+    Attributes:
+        client (EodDataHttpClient): EodData client.
+        exchange_codes (list of str or None): Exchanges to include,
+            all available exchanges if None.
+        max_workers (int): Maximum number of concurrent requests.
+        failures (dict): Exchange code to error of exchanges that could
+            not be requested by the last `take`, they keep their previous
+            quotes.
+    """
+
+    def __init__(self, client, exchange_codes=None, max_workers=8):
+        """
+        Args:
+            client (EodDataHttpClient): EodData client.
+            exchange_codes (list of str or None): Exchanges to include,
+                all available exchanges if None.
+            max_workers (int): Maximum number of concurrent requests.
+        """
+        self.client = client
+        self.exchange_codes = None
+        if exchange_codes is not None:
+            self.exchange_codes = [code.upper() for code in exchange_codes]
+        self.max_workers = max_workers
+        self.failures = {}
+        self._last_trade_times = {}
+        self._frames = {}
+
+    def stale_exchanges(self, exchanges):
+        """Get exchanges which have new data since the previous snapshot.
+
+        Args:
+            exchanges (list of EodDataExchange): Exchanges.
+
+        Returns:
+            list of EodDataExchange
+        """
+        stale = []
+        for exchange in exchanges:
+            code = exchange.code.upper()
+            if self.exchange_codes is not None \
+                    and code not in self.exchange_codes:
+                continue
+            if self._last_trade_times.get(code) != exchange.last_trade_time:
+                stale.append(exchange)
+        return stale
+
+    def _fetch(self, exchange):
+        return self.client.quote_list(exchange.code,
+                                      output_format='data-frame')
+
+    def take(self):
+        """Take a new snapshot.
+
+        Returns:
+            pandas.DataFrame: Quotes of all exchanges indexed
+                by (Exchange, Symbol).
+        """
+        exchanges = self.client.exchange_list()
+        stale = self.stale_exchanges(exchanges)
+        self.failures = {}
+        if stale:
+            workers = min(self.max_workers, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [(exchange, executor.submit(self._fetch, exchange))
+                           for exchange in stale]
+                for exchange, future in futures:
+                    code = exchange.code.upper()
+                    try:
+                        self._frames[code] = future.result()
+                    except (ClientError, requests.RequestException) as e:
+                        # keep previous quotes, exchange is retried next time
+                        logger.exception('Could not get quotes of %s.', code)
+                        self.failures[code] = e
+                        continue
+                    self._last_trade_times[code] = exchange.last_trade_time
+        return self.to_df()
+
+    def to_df(self):
+        """Get quotes of the latest snapshot.
+
+        Returns:
+            pandas.DataFrame: Quotes of all exchanges indexed
+                by (Exchange, Symbol).
+        """
+        codes = sorted(self._frames)
+        if self.exchange_codes is not None:
+            codes = [code for code in codes if code in self.exchange_codes]
+        if not codes:
+            return pd.DataFrame()
+        return pd.concat([self._frames[code] for code in codes], keys=codes,
+                         names=['Exchange', 'Symbol'])
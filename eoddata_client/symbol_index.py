@@ -0,0 +1,227 @@
+"""
+In-memory symbol index with exact, prefix and token lookup.
+"""
+import bisect
+import gzip
+import json
+import re
+
+from collections import namedtuple
+
+INDEX_VERSION = 1
+
+TOKEN_SEPARATOR = re.compile(r'[^0-9a-z]+')
+
+
+class SymbolMatch(namedtuple('SymbolMatch', 'exchange code name long_name')):
+    """Symbol found in the index.
+
+    Attributes:
+        exchange (str): Exchange code.
+        code (str): Symbol code.
+        name (str): Asset name.
+        long_name (str): Long name, empty for compact symbols.
+    """
+    __slots__ = ()
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens."""
+    return [token for token in TOKEN_SEPARATOR.split(text.lower()) if token]
+
+
+class SymbolIndex(object):
+    """Index of symbols of several exchanges.
+
+    Exact lookup of a code is a dictionary lookup, prefix search on codes
+    and on name tokens is a binary search in sorted arrays, so lookups do
+    not depend on the number of indexed symbols.
+
+    Example:
+
+        index = SymbolIndex.from_client(client, ['nasdaq', 'nyse'])
+        index.lookup('msft')
+        index.prefix('ms')
+        index.search('micro corp')
+    """
+
+    def __init__(self, exchanges, codes, names, long_names, tokens=None):
+        """
+        Args:
+            exchanges (list of str): Exchange code of every symbol.
+            codes (list of str): Symbol codes.
+            names (list of str): Asset names.
+            long_names (list of str): Long names.
+            tokens (dict or None): Name token to symbol ids,
+                built from names if None.
+        """
+        self._exchanges = exchanges
+        self._codes = codes
+        self._names = names
+        self._long_names = long_names
+
+        self._by_code = {}
+        for i, code in enumerate(codes):
+            self._by_code.setdefault(code.upper(), []).append(i)
+        self._sorted_codes = sorted(self._by_code)
+
+        if tokens is None:
+            tokens = {}
+            for i, (name, long_name) in enumerate(zip(names, long_names)):
+                for token in set(tokenize(name) + tokenize(long_name)):
+                    tokens.setdefault(token, []).append(i)
+        self._tokens = tokens
+        self._sorted_tokens = sorted(tokens)
+
+    @classmethod
+    def from_symbol_lists(cls, symbol_lists):
+        """Build index from symbol lists of exchanges.
+
+        Args:
+            symbol_lists (dict): Exchange code to a list of EodDataSymbol
+                or EodDataSymbolCompact, as returned by `symbol_list`
+                or `symbol_list_compact`.
+
+        Returns:
+            SymbolIndex
+        """
+        exchanges, codes, names, long_names = [], [], [], []
+        for exchange, symbols in sorted(symbol_lists.items()):
+            exchange = exchange.upper()
+            for symbol in symbols:
+                exchanges.append(exchange)
+                codes.append(symbol.code)
+                names.append(symbol.name)
+                long_names.append(getattr(symbol, 'long_name', ''))
+        return cls(exchanges, codes, names, long_names)
+
+    @classmethod
+    def from_client(cls, client, exchange_codes, compact=False):
+        """Build index from symbol lists requested from EodData.
+
+        Args:
+            client (EodDataHttpClient): EodData client.
+            exchange_codes (list of str): Exchange codes.
+            compact (bool): Use compact symbol lists (without long names).
+
+        Returns:
+            SymbolIndex
+        """
+        get_symbols = client.symbol_list_compact if compact \
+            else client.symbol_list
+        return cls.from_symbol_lists({exchange: get_symbols(exchange)
+                                      for exchange in exchange_codes})
+
+    def __len__(self):
+        return len(self._codes)
+
+    def _match(self, i):
+        return SymbolMatch(self._exchanges[i], self._codes[i], self._names[i],
+                           self._long_names[i])
+
+    def lookup(self, code, exchange=None):
+        """Find symbols by exact code.
+
+        Args:
+            code (str): Symbol code (case insensitive).
+            exchange (str or None): Exchange code, all exchanges if None.
+
+        Returns:
+            list of SymbolMatch
+        """
+        matches = [self._match(i) for i in self._by_code.get(code.upper(), ())]
+        if exchange is not None:
+            exchange = exchange.upper()
+            matches = [m for m in matches if m.exchange == exchange]
+        return matches
+
+    def prefix(self, prefix, limit=20):
+        """Find symbols whose code starts with prefix.
+
+        Args:
+            prefix (str): Code prefix (case insensitive).
+            limit (int): Maximum number of matches.
+
+        Returns:
+            list of SymbolMatch: Matches in code order.
+        """
+        prefix = prefix.upper()
+        matches = []
+        position = bisect.bisect_left(self._sorted_codes, prefix)
+        while position < len(self._sorted_codes) and len(matches) < limit:
+            code = self._sorted_codes[position]
+            if not code.startswith(prefix):
+                break
+            for i in self._by_code[code]:
+                matches.append(self._match(i))
+            position += 1
+        return matches[:limit]
+
+    def _token_ids(self, token):
+        """Get ids of symbols with a name token starting with token."""
+        ids = set()
+        position = bisect.bisect_left(self._sorted_tokens, token)
+        end = len(self._sorted_tokens)
+        while position < end:
+            candidate = self._sorted_tokens[position]
+            if not candidate.startswith(token):
+                break
+            ids.update(self._tokens[candidate])
+            position += 1
+        return ids
+
+    def search(self, text, limit=20):
+        """Find symbols by words of name or long name.
+
+        Every word of the text must be a prefix of some word of a symbol
+        name, so `micro corp` finds `Microsoft Corp`. Symbols whose code
+        is the text are found too.
+
+        Args:
+            text (str): Search text (case insensitive).
+            limit (int): Maximum number of matches.
+
+        Returns:
+            list of SymbolMatch: Matches, exact code match first.
+        """
+        exact = set(self._by_code.get(text.strip().upper(), ()))
+        query_tokens = sorted(tokenize(text), key=len, reverse=True)
+        ids = None
+        for token in query_tokens:
+            token_ids = self._token_ids(token)
+            ids = token_ids if ids is None else ids & token_ids
+            if not ids:
+                break
+        ids = (ids or set()) | exact
+        ordered = sorted(ids, key=lambda i: (i not in exact,
+                                             len(self._names[i]), i))
+        return [self._match(i) for i in ordered[:limit]]
+
+    def save(self, path):
+        """Write index to a gzip compressed JSON file."""
+        data = {
+            'version': INDEX_VERSION,
+            'exchanges': self._exchanges,
+            'codes': self._codes,
+            'names': self._names,
+            'long_names': self._long_names,
+            'tokens': self._tokens,
+        }
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        """Read index written by `save`.
+
+        Returns:
+            SymbolIndex
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError('Unsupported symbol index version: {0}'.format(
+                data.get('version')
+            ))
+        return cls(data['exchanges'], data['codes'], data['names'],
+                   data['long_names'], tokens=data['tokens'])
@@ -0,0 +1,166 @@
+"""
+Login token stores shared by several clients.
+
+A client with a token store takes a valid token from the store instead
+of logging in, and writes the token of every login back to the store.
+When a token is rejected, the client refreshes it under the store lock:
+if another client (thread or process) has already stored a newer token,
+that token is used and no login request is sent.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+class Error(Exception):
+    """Base error for this module."""
+
+
+class TokenStore(object):
+    """Interface of token stores.
+
+    Tokens are stored by key (username and service url), so one store
+    can be shared by clients of different accounts.
+    """
+
+    def get(self, key):
+        """Get stored token.
+
+        Args:
+            key (str): Token key.
+
+        Returns:
+            str or None: Token, None if there is no valid token.
+        """
+        raise NotImplementedError
+
+    def set(self, key, token):
+        """Store a token.
+
+        Args:
+            key (str): Token key.
+            token (str): Token.
+        """
+        raise NotImplementedError
+
+    def lock(self, key):
+        """Get a context manager that serializes token refreshes.
+
+        Args:
+            key (str): Token key.
+        """
+        raise NotImplementedError
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store shared by clients of one process."""
+
+    def __init__(self):
+        self._tokens = {}
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        return self._tokens.get(key)
+
+    def set(self, key, token):
+        self._tokens[key] = token
+
+    def lock(self, key):
+        return self._lock
+
+
+class FileTokenStore(TokenStore):
+    """Token store shared by processes of one host.
+
+    Tokens are kept in a JSON file readable only by its owner, refreshes
+    are serialized with an exclusive lock of `<path>.lock`.
+
+    Example:
+
+        store = FileTokenStore('~/.eoddata/tokens.json')
+        client = EodDataHttpClient(username, password, token_store=store)
+    """
+
+    def __init__(self, path, max_age=None):
+        """
+        Args:
+            path (str): Token file path.
+            max_age (float or None): Tokens older than this number of
+                seconds are not used.
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_age = max_age
+        self._thread_lock = threading.RLock()
+        directory = os.path.dirname(self.path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _read(self):
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def get(self, key):
+        entry = self._read().get(key)
+        if not entry:
+            return None
+        if self.max_age is not None \
+                and time.time() - entry.get('time', 0) > self.max_age:
+            return None
+        return entry.get('token')
+
+    def set(self, key, token):
+        with self.lock(key):
+            tokens = self._read()
+            tokens[key] = {'token': token, 'time': time.time()}
+            temp_path = '{0}.{1}.tmp'.format(self.path, os.getpid())
+            descriptor = os.open(temp_path,
+                                 os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(descriptor, 'w') as f:
+                json.dump(tokens, f)
+            os.replace(temp_path, self.path)
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        with self._thread_lock:
+            # re-entrant within a thread, the file lock is taken once
+            depth = getattr(self, '_depth', 0)
+            self._depth = depth + 1
+            try:
+                if depth:
+                    yield
+                    return
+                with open(self.path + '.lock', 'a+') as lock_file:
+                    _lock_file(lock_file)
+                    try:
+                        yield
+                    finally:
+                        _unlock_file(lock_file)
+            finally:
+                self._depth = depth
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:  # pragma: no cover - Windows
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,191 @@
+"""
+Trading calendars and detection of missing days in stored history.
+"""
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar, GoodFriday, Holiday, USLaborDay,
+    USMartinLutherKingJr, USMemorialDay, USPresidentsDay, USThanksgivingDay,
+    nearest_workday, sunday_to_monday
+)
+from pandas.tseries.offsets import CustomBusinessDay
+
+from eoddata_client.eoddata_client import NoDataAvailableError
+
+
+class NyseHolidayCalendar(AbstractHolidayCalendar):
+    """Regular holidays of US stock exchanges."""
+    rules = [
+        Holiday('New Years Day', month=1, day=1,
+                observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday('Juneteenth', month=6, day=19, start_date='2022-01-01',
+                observance=nearest_workday),
+        Holiday('Independence Day', month=7, day=4,
+                observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday('Christmas', month=12, day=25, observance=nearest_workday),
+    ]
+
+
+# exchange code to holiday calendar, exchanges not listed trade on weekdays
+EXCHANGE_CALENDARS = {
+    'AMEX': NyseHolidayCalendar,
+    'NASDAQ': NyseHolidayCalendar,
+    'NYSE': NyseHolidayCalendar,
+    'OTCBB': NyseHolidayCalendar,
+}
+
+
+def trading_day(exchange_code=None, holidays=None):
+    """Get business day offset of an exchange.
+
+    Args:
+        exchange_code (str or None): Exchange code.
+        holidays (list or None): Additional holidays (for example
+            unscheduled closures).
+
+    Returns:
+        pandas.tseries.offsets.CustomBusinessDay
+    """
+    calendar_class = EXCHANGE_CALENDARS.get((exchange_code or '').upper())
+    if calendar_class is None:
+        return CustomBusinessDay(holidays=holidays or [])
+    if holidays:
+        calendar_holidays = calendar_class().holidays(
+            datetime.date(1970, 1, 1), datetime.date(2100, 12, 31)
+        )
+        return CustomBusinessDay(
+            holidays=list(calendar_holidays) + list(holidays)
+        )
+    return CustomBusinessDay(calendar=calendar_class())
+
+
+def trading_days(start_date, end_date, exchange_code=None, holidays=None):
+    """Get trading days of an exchange in a date range (inclusive).
+
+    Returns:
+        pandas.DatetimeIndex
+    """
+    return pd.date_range(start_date, end_date,
+                         freq=trading_day(exchange_code, holidays))
+
+
+def missing_dates(dates, start_date, end_date, exchange_code=None,
+                  holidays=None):
+    """Get trading days without data.
+
+    Args:
+        dates (iterable): Dates or datetimes of stored quotes (intraday
+            quotes are reduced to their days).
+        start_date (datetime.date): First date.
+        end_date (datetime.date): Last date.
+        exchange_code (str or None): Exchange code.
+        holidays (list or None): Additional holidays.
+
+    Returns:
+        pandas.DatetimeIndex: Missing trading days.
+    """
+    expected = trading_days(start_date, end_date, exchange_code, holidays)
+    held = pd.DatetimeIndex(dates)
+    if held.tz is not None:
+        held = held.tz_localize(None)
+    held = held.normalize().unique()
+    return expected[~expected.isin(held)]
+
+
+def missing_ranges(dates, exchange_code=None, holidays=None):
+    """Group missing days into ranges of consecutive trading days.
+
+    Args:
+        dates (pandas.DatetimeIndex): Missing trading days (sorted).
+        exchange_code (str or None): Exchange code.
+        holidays (list or None): Additional holidays.
+
+    Returns:
+        list of (datetime.date, datetime.date): Inclusive date ranges.
+    """
+    if not len(dates):
+        return []
+    dates = pd.DatetimeIndex(dates)
+    # position of every day among trading days, a run continues while
+    # positions are consecutive
+    positions = trading_days(dates[0], dates[-1], exchange_code,
+                             holidays).get_indexer(dates)
+    breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+    starts = np.concatenate([[0], breaks])
+    ends = np.concatenate([breaks - 1, [len(dates) - 1]])
+    return [(dates[start].date(), dates[end].date())
+            for start, end in zip(starts, ends)]
+
+
+def fill_history_gaps(client, exchange_code, symbol, df, start_date,
+                      end_date, period='d', holidays=None):
+    """Fetch only missing days of a symbol history.
+
+    Missing trading days are requested with one ranged request per run
+    of consecutive missing days.
+
+    Args:
+        client (EodDataHttpClient): EodData client.
+        exchange_code (str): Exchange code.
+        symbol (str): Symbol.
+        df (pandas.DataFrame): Stored quotes with datetime index.
+        start_date (datetime.date): First date.
+        end_date (datetime.date): Last date.
+        period (str): Period code.
+        holidays (list or None): Additional holidays.
+
+    Returns:
+        pandas.DataFrame: Stored and fetched quotes, sorted by datetime.
+    """
+    gaps = missing_dates(df.index, start_date, end_date, exchange_code,
+                         holidays)
+    frames = [df]
+    for first, last in missing_ranges(gaps, exchange_code, holidays):
+        try:
+            frames.append(client.symbol_history_period_by_range(
+                exchange_code, symbol, first, last, period,
+                output_format='data-frame'
+            ))
+        except NoDataAvailableError:
+            continue
+    frames = [frame for frame in frames if len(frame)]
+    if len(frames) <= 1:
+        return df
+    return pd.concat(frames).sort_index(kind='mergesort')
+
+
+def fill_exchange_gaps(client, exchange_code, dates, start_date, end_date,
+                       holidays=None):
+    """Fetch quotes of an entire exchange for missing trading days only.
+
+    Args:
+        client (EodDataHttpClient): EodData client.
+        exchange_code (str): Exchange code.
+        dates (iterable): Dates already stored.
+        start_date (datetime.date): First date.
+        end_date (datetime.date): Last date.
+        holidays (list or None): Additional holidays.
+
+    Returns:
+        dict: Missing date to quotes data frame, days without data
+            (unscheduled closures) are omitted.
+    """
+    fetched = {}
+    for date in missing_dates(dates, start_date, end_date, exchange_code,
+                              holidays):
+        try:
+            fetched[date.date()] = client.quote_list_by_date(
+                exchange_code, date.date(), output_format='data-frame'
+            )
+        except NoDataAvailableError:
+            continue
+    return fetched
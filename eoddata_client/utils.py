@@ -1,5 +1,12 @@
 import datetime
 
+from urllib.parse import quote
+
+import pandas as pd
+
+# formats of datetimes in EodData responses
+DATETIME_FORMATS = ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f')
+
 
 class Error(Exception):
     """Base error for this module."""
@@ -72,3 +79,79 @@ def string_to_datetime(iso8601_datetime_string):
     except ValueError:
         return datetime.datetime.strptime(iso8601_datetime_string,
                                           '%Y-%m-%dT%H:%M:%S.%f')
+
+
+def strings_to_datetimes(values):
+    """Converts ISO 8601 datetime strings to pandas datetimes.
+
+    The formats of `string_to_datetime` are tried one after another with
+    explicit strptime formats, so that the result is the same on every
+    pandas version.
+
+    Args:
+        values (list or numpy.ndarray): ISO 8601 datetime strings
+            (None for missing values).
+
+    Returns:
+        pandas.DatetimeIndex: NaT for missing and invalid values.
+    """
+    strings = pd.Series(values, dtype=object)
+    datetimes = pd.to_datetime(strings, format=DATETIME_FORMATS[0],
+                               errors='coerce')
+    for datetime_format in DATETIME_FORMATS[1:]:
+        retry = datetimes.isnull() & strings.notnull()
+        if not retry.any():
+            break
+        datetimes[retry] = pd.to_datetime(strings[retry],
+                                          format=datetime_format,
+                                          errors='coerce')
+    return pd.DatetimeIndex(datetimes)
+
+
+def intern_string(value, string_pool=None):
+    """Get a shared copy of a string value.
+
+    Values repeated in a response (symbol, name, description) are stored
+    only once in the pool, so that entities parsed from the same response
+    refer to the same string object.
+
+    Args:
+        value (str): String value.
+        string_pool (dict or None): Strings seen so far, value is returned
+            as is if None.
+
+    Returns:
+        str
+    """
+    if string_pool is None:
+        return value
+    return string_pool.setdefault(value, value)
+
+
+def split_symbols(symbols, max_length):
+    """Split symbols into batches, so that url encoded comma separated
+    symbols of every batch are not longer than max length.
+
+    Args:
+        symbols (list of str): Symbols.
+        max_length (int): Maximum length of url encoded batch.
+
+    Returns:
+        list of lists of str
+    """
+    batches = []
+    batch = []
+    batch_length = 0
+    for symbol in symbols:
+        # separator is url encoded comma (%2C)
+        symbol_length = len(quote(symbol, safe='')) + (3 if batch else 0)
+        if batch and batch_length + symbol_length > max_length:
+            batches.append(batch)
+            batch = []
+            batch_length = 0
+            symbol_length -= 3
+        batch.append(symbol)
+        batch_length += symbol_length
+    if batch:
+        batches.append(batch)
+    return batches
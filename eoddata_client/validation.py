@@ -0,0 +1,290 @@
+"""
+Vectorized validation of quote responses.
+
+Attributes of all quote elements of a response are checked column by
+column at once, bad rows are dropped (or flagged) in bulk and problems
+are collected into one report per response, instead of logging
+a traceback for every bad element.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from eoddata_client.utils import strings_to_datetimes
+
+VALIDATION_KEEP = 'keep'
+VALIDATION_FLAG = 'flag'
+VALIDATION_DROP = 'drop'
+
+MISSING_ATTRIBUTE = 'missing attribute'
+NOT_NUMERIC = 'not numeric'
+INVALID_DATETIME = 'invalid datetime'
+INVALID_MODIFIED = 'invalid modified datetime'
+HIGH_BELOW_LOW = 'high below low'
+NEGATIVE_VOLUME = 'negative volume'
+DUPLICATE_DATETIME = 'duplicate datetime'
+
+# rows with these problems can not be converted to entities
+PARSE_PROBLEMS = (MISSING_ATTRIBUTE, NOT_NUMERIC, INVALID_DATETIME,
+                  INVALID_MODIFIED)
+
+
+class QuoteSchema(namedtuple('QuoteSchema', 'symbol datetime modified high '
+                                            'low volume numeric text')):
+    """XML attribute names of a quote element.
+
+    Attributes:
+        symbol (str): Symbol attribute.
+        datetime (str): Quote datetime attribute.
+        modified (str or None): Modification datetime attribute.
+        high (str): High price attribute.
+        low (str): Low price attribute.
+        volume (str): Volume attribute.
+        numeric (tuple of str): All numeric attributes.
+        text (tuple of str): Other required attributes.
+    """
+    __slots__ = ()
+
+
+QUOTE_EXTENDED_SCHEMA = QuoteSchema(
+    symbol='Symbol', datetime='DateTime', modified='Modified', high='High',
+    low='Low', volume='Volume',
+    numeric=('Open', 'High', 'Low', 'Close', 'Volume', 'OpenInterest',
+             'Previous', 'Change', 'Bid', 'Ask', 'PreviousClose', 'NextOpen'),
+    text=('Symbol', 'DateTime', 'Modified', 'Name', 'Description')
+)
+
+QUOTE_COMPACT_SCHEMA = QuoteSchema(
+    symbol='s', datetime='d', modified=None, high='h', low='l', volume='v',
+    numeric=('o', 'h', 'l', 'c', 'v', 'i', 'b', 'a'),
+    text=('s', 'd')
+)
+
+
+class ValidationReport(object):
+    """Aggregated problems of a response.
+
+    Attributes:
+        total (int): Number of rows in the response.
+        problems (dict): Problem to indices of returned rows (positions
+            in the returned list or data frame) that have it.
+        dropped (int): Number of dropped rows.
+        dropped_problems (dict): Problem to number of dropped rows that
+            have it.
+    """
+
+    def __init__(self, total):
+        self.total = total
+        self.problems = {}
+        self.dropped = 0
+        self.dropped_problems = {}
+        self._masks = {}
+
+    def add(self, problem, mask):
+        """Add rows of the response with a problem.
+
+        Args:
+            problem (str): Problem.
+            mask (numpy.ndarray): Boolean mask of response rows.
+        """
+        if mask.any():
+            self._masks[problem] = mask
+
+    def select(self, keep):
+        """Set returned rows of the response.
+
+        Args:
+            keep (numpy.ndarray): Boolean mask of returned response rows.
+        """
+        positions = np.cumsum(keep) - 1
+        self.problems = {}
+        self.dropped_problems = {}
+        for problem, mask in self._masks.items():
+            kept = mask & keep
+            if kept.any():
+                self.problems[problem] = positions[kept]
+            dropped = int((mask & ~keep).sum())
+            if dropped:
+                self.dropped_problems[problem] = dropped
+        self.dropped = int((~keep).sum())
+
+    def row_problems(self, count):
+        """Get problems of every returned row.
+
+        Args:
+            count (int): Number of returned rows.
+
+        Returns:
+            list of tuple of str: Sorted problems of every row, empty
+                tuple if a row has none.
+        """
+        rows = [[] for _ in range(count)]
+        for problem, indices in sorted(self.problems.items()):
+            for i in indices:
+                rows[i].append(problem)
+        return [tuple(problems) for problems in rows]
+
+    @classmethod
+    def merge(cls, parts):
+        """Combine reports of several responses.
+
+        Args:
+            parts (list): (ValidationReport, positions) pairs, positions
+                map returned rows of a report to positions in the combined
+                result (-1 if a row is not in the result).
+
+        Returns:
+            ValidationReport
+        """
+        report = cls(sum(part.total for part, _ in parts))
+        problems = {}
+        for part, positions in parts:
+            positions = np.asarray(positions, dtype=int)
+            report.dropped += part.dropped
+            for problem, count in part.dropped_problems.items():
+                report.dropped_problems[problem] = \
+                    report.dropped_problems.get(problem, 0) + count
+            for problem, indices in part.problems.items():
+                mapped = positions[indices]
+                problems.setdefault(problem, []).append(mapped[mapped >= 0])
+        for problem, indices in problems.items():
+            indices = np.sort(np.concatenate(indices))
+            if len(indices):
+                report.problems[problem] = indices
+        return report
+
+    def count(self, problem):
+        """Get number of rows (returned and dropped) with a problem."""
+        return len(self.problems.get(problem, ())) \
+            + self.dropped_problems.get(problem, 0)
+
+    @property
+    def ok(self):
+        """bool: True if there are no problems."""
+        return not self.problems and not self.dropped_problems
+
+    def summary(self):
+        """Get one line description of the problems."""
+        if self.ok:
+            return '{0} rows, no problems'.format(self.total)
+        problems = set(self.problems) | set(self.dropped_problems)
+        return '{0} rows, {1} dropped: {2}'.format(
+            self.total, self.dropped,
+            ', '.join('{0} ({1})'.format(problem, self.count(problem))
+                      for problem in sorted(problems))
+        )
+
+    def __repr__(self):
+        return 'ValidationReport({0})'.format(self.summary())
+
+
+def validate_quotes(elements, schema=QUOTE_EXTENDED_SCHEMA,
+                    mode=VALIDATION_KEEP):
+    """Validate quote elements of a response.
+
+    Args:
+        elements (list): Quote XML elements.
+        schema (QuoteSchema): Attribute names.
+        mode (str): 'keep', 'flag' or 'drop', see `validate_columns`.
+
+    Returns:
+        tuple of numpy.ndarray and ValidationReport: Mask of rows to keep
+            and report.
+    """
+    attributes = [element.attrib for element in elements]
+    names = set(schema.numeric) | set(schema.text) | {schema.datetime}
+    if schema.modified:
+        names.add(schema.modified)
+    columns = {name: [attrib.get(name) for attrib in attributes]
+               for name in names}
+    return validate_columns(columns, len(attributes), schema, mode)
+
+
+def validate_columns(columns, total, schema=QUOTE_EXTENDED_SCHEMA,
+                     mode=VALIDATION_KEEP):
+    """Validate quote attributes collected into columns.
+
+    Checks for missing attributes, non-numeric values, invalid quote
+    and modification datetimes, high price below low price, negative
+    volume and duplicate datetimes of a symbol (the first quote is kept).
+
+    Args:
+        columns (dict): Attribute name to list of raw values (None if
+            the attribute is missing), or to already converted float
+            array (NaN if not numeric) or DatetimeIndex (NaT if invalid).
+        total (int): Number of rows.
+        schema (QuoteSchema): Attribute names.
+        mode (str): 'keep' or 'flag' to drop only rows that can not be
+            parsed and keep the rest ('flag' also marks problems of kept
+            rows in the result), 'drop' to drop all rows with problems.
+
+    Returns:
+        tuple of numpy.ndarray and ValidationReport: Mask of rows to keep
+            and report.
+    """
+    report = ValidationReport(total)
+    if not total:
+        return np.ones(0, dtype=bool), report
+
+    def column(name):
+        values = columns.get(name)
+        return [None] * total if values is None else values
+
+    missing = np.zeros(total, dtype=bool)
+    not_numeric = np.zeros(total, dtype=bool)
+    numbers = {}
+    for name in schema.numeric:
+        raw = column(name)
+        if getattr(raw, 'dtype', None) == float:
+            values = raw
+            not_numeric |= np.isnan(values)
+        else:
+            raw = np.array(raw, dtype=object)
+            absent = pd.isnull(raw)
+            values = pd.to_numeric(raw, errors='coerce')
+            missing |= absent
+            not_numeric |= np.isnan(values.astype(float)) & ~absent
+        numbers[name] = values
+    for name in schema.text:
+        if not isinstance(column(name), pd.DatetimeIndex):
+            missing |= pd.isnull(np.array(column(name), dtype=object))
+
+    raw_datetimes = column(schema.datetime)
+    if isinstance(raw_datetimes, pd.DatetimeIndex):
+        datetimes = raw_datetimes
+        invalid_datetime = np.asarray(pd.isnull(datetimes))
+    else:
+        datetimes = strings_to_datetimes(raw_datetimes)
+        invalid_datetime = np.asarray(pd.isnull(datetimes)) \
+            & ~pd.isnull(np.array(raw_datetimes, dtype=object))
+
+    invalid_modified = np.zeros(total, dtype=bool)
+    if schema.modified:
+        raw_modified = column(schema.modified)
+        if not isinstance(raw_modified, pd.DatetimeIndex):
+            invalid_modified = \
+                np.asarray(pd.isnull(strings_to_datetimes(raw_modified))) \
+                & ~pd.isnull(np.array(raw_modified, dtype=object))
+
+    with np.errstate(invalid='ignore'):
+        high_below_low = numbers[schema.high] < numbers[schema.low]
+        negative_volume = numbers[schema.volume] < 0
+    symbols = column(schema.symbol)
+    duplicate = pd.DataFrame({'symbol': symbols, 'datetime': datetimes})\
+        .duplicated(keep='first').values & ~pd.isnull(datetimes)
+
+    report.add(MISSING_ATTRIBUTE, missing)
+    report.add(NOT_NUMERIC, not_numeric)
+    report.add(INVALID_DATETIME, invalid_datetime)
+    report.add(INVALID_MODIFIED, invalid_modified)
+    report.add(HIGH_BELOW_LOW, high_below_low)
+    report.add(NEGATIVE_VOLUME, negative_volume)
+    report.add(DUPLICATE_DATETIME, duplicate)
+
+    bad = missing | not_numeric | invalid_datetime | invalid_modified
+    if mode == VALIDATION_DROP:
+        bad |= high_below_low | negative_volume | duplicate
+    keep = ~bad
+    report.select(keep)
+    return keep, report
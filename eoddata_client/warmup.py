@@ -0,0 +1,175 @@
+"""
+Background prefetch of reference data.
+
+A client created with `warm_up` option logs in and requests reference
+data (exchanges, countries and optionally symbol lists) on background
+threads. A later call of the same endpoint waits for the in-flight
+request instead of sending a duplicate one. Each prefetched result is
+used once, afterwards endpoints request fresh data as usual.
+"""
+import inspect
+import logging
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+# reference data endpoints prefetched on warm-up
+WARM_UP_ENDPOINTS = ('exchange_list', 'country_list')
+
+
+def _key(endpoint, arguments):
+    return (endpoint,) + tuple(
+        value.upper() if isinstance(value, str) else value
+        for value in arguments
+    )
+
+
+class ReferencePrefetcher(object):
+    """Prefetches reference data of a client on background threads.
+
+    Attributes:
+        endpoints (tuple of str): Prefetched endpoints without arguments.
+        symbol_exchanges (tuple of str): Exchanges whose symbol lists
+            are prefetched.
+    """
+
+    def __init__(self, client, endpoints=WARM_UP_ENDPOINTS,
+                 symbol_exchanges=(), max_workers=4):
+        """
+        Args:
+            client (EodDataHttpClient): EodData client.
+            endpoints (iterable of str): Endpoints without arguments.
+            symbol_exchanges (iterable of str): Exchange codes.
+            max_workers (int): Maximum number of concurrent requests.
+        """
+        self.client = client
+        self.endpoints = tuple(endpoints)
+        self.symbol_exchanges = tuple(code.upper()
+                                      for code in symbol_exchanges)
+        self.max_workers = max_workers
+        self.logger = logging.getLogger('eoddata_client')
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def prefetching(self):
+        """bool: True in a thread running a prefetch request."""
+        return getattr(self._local, 'prefetching', False)
+
+    def _call(self, endpoint, arguments):
+        self._local.prefetching = True
+        try:
+            return getattr(self.client, endpoint)(*arguments)
+        finally:
+            self._local.prefetching = False
+
+    def start(self):
+        """Login and submit prefetch requests.
+
+        Returns:
+            ReferencePrefetcher: self
+        """
+        calls = [(endpoint, ()) for endpoint in self.endpoints]
+        calls.extend(('symbol_list', (code,))
+                     for code in self.symbol_exchanges)
+        if not calls:
+            return self
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(calls)))
+        )
+        # login once before the requests that would all need a token
+        login = executor.submit(self.client.ensure_token)
+        with self._lock:
+            for endpoint, arguments in calls:
+                self._futures[_key(endpoint, arguments)] = executor.submit(
+                    self._after_login, login, endpoint, arguments
+                )
+        # threads exit after the submitted requests are done
+        executor.shutdown(wait=False)
+        return self
+
+    def _after_login(self, login, endpoint, arguments):
+        login.result()
+        return self._call(endpoint, arguments)
+
+    def take(self, endpoint, arguments=()):
+        """Get prefetched (or in-flight) result of an endpoint call.
+
+        Args:
+            endpoint (str): Endpoint method name.
+            arguments (tuple): Endpoint arguments except output format.
+
+        Returns:
+            concurrent.futures.Future or None: Future of the result, None
+                if the call was not prefetched or its result was taken.
+        """
+        key = _key(endpoint, arguments)
+        with self._lock:
+            future = self._futures.get(key)
+        if future is not None:
+            # callers that come while the request is in flight share it,
+            # the result is dropped once it has been taken
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return future
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def wait(self, timeout=None):
+        """Wait for prefetch requests to finish.
+
+        Args:
+            timeout (float or None): Maximum number of seconds to wait.
+        """
+        with self._lock:
+            futures = list(self._futures.values())
+        for future in futures:
+            try:
+                future.exception(timeout=timeout)
+            except Exception:
+                pass
+
+
+def prefetched(format_result=None):
+    """Decorator that returns prefetched result of an endpoint call if
+    client's prefetcher has one.
+
+    Args:
+        format_result (callable or None): Function that converts
+            a prefetched entity list to `output_format` (keyword argument),
+            for example `EodDataExchange.format`.
+
+    Returns:
+        Decorator.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            prefetcher = self.prefetcher
+            if prefetcher is None or prefetcher.prefetching:
+                return func(self, *args, **kwargs)
+            arguments = signature.bind(self, *args, **kwargs)
+            arguments.apply_defaults()
+            values = dict(arguments.arguments)
+            values.pop('self')
+            output_format = values.pop('output_format', None)
+            future = prefetcher.take(func.__name__, tuple(values.values()))
+            if future is None:
+                return func(self, *args, **kwargs)
+            try:
+                result = future.result()
+            except Exception as e:
+                prefetcher.logger.debug('Prefetch of %s failed: %s',
+                                        func.__name__, e)
+                return func(self, *args, **kwargs)
+            if format_result is not None and output_format is not None:
+                return format_result(result, output_format=output_format)
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,124 @@
+"""
+XML parser backends.
+
+Responses are parsed by a backend: `stdlib` (`xml.etree.ElementTree`,
+default) or `lxml` (optional dependency). Both produce elements with the
+ElementTree API, so entities are built from either of them the same way.
+`auto` selects lxml when it is installed. The backend is set with
+`xml_backend` option of the client or with `EODDATA_CLIENT_XML_BACKEND`
+environment variable. Compare backends on your payloads with
+`benchmarks/xml_backends.py` before switching.
+"""
+import os
+import threading
+import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+XML_BACKEND_ENVIRONMENT_VARIABLE = 'EODDATA_CLIENT_XML_BACKEND'
+
+XML_BACKEND_AUTO = 'auto'
+XML_BACKEND_LXML = 'lxml'
+XML_BACKEND_STDLIB = 'stdlib'
+
+
+class Error(Exception):
+    """Base error for this module."""
+
+
+class XmlBackendError(Error):
+    """Unknown or unavailable XML parser backend."""
+
+
+class XmlBackend(object):
+    """Interface of XML parser backends."""
+
+    name = None
+
+    def fromstring(self, data):
+        """Parse XML document.
+
+        Args:
+            data (str or bytes): XML document.
+
+        Returns:
+            Root element.
+        """
+        raise NotImplementedError
+
+
+class StdlibXmlBackend(XmlBackend):
+    """Parser of the standard library (expat, C accelerated)."""
+
+    name = XML_BACKEND_STDLIB
+
+    def fromstring(self, data):
+        return ET.fromstring(data)
+
+
+class LxmlXmlBackend(XmlBackend):
+    """lxml (libxml2) parser.
+
+    Entities and network access are disabled, comments and processing
+    instructions are dropped so that elements are only data elements.
+    """
+
+    name = XML_BACKEND_LXML
+
+    def __init__(self):
+        if lxml_etree is None:
+            raise XmlBackendError('lxml is not installed.')
+        # lxml parsers must not be shared between threads
+        self._local = threading.local()
+
+    def _parser(self):
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = lxml_etree.XMLParser(
+                resolve_entities=False, no_network=True, huge_tree=True,
+                collect_ids=False, remove_comments=True, remove_pis=True
+            )
+            self._local.parser = parser
+        return parser
+
+    def fromstring(self, data):
+        if isinstance(data, str):
+            # lxml refuses text with encoding declaration
+            data = data.encode('utf-8')
+        return lxml_etree.fromstring(data, self._parser())
+
+
+XML_BACKENDS = {
+    XML_BACKEND_STDLIB: StdlibXmlBackend,
+    XML_BACKEND_LXML: LxmlXmlBackend,
+}
+
+
+def get_xml_backend(name=None):
+    """Get XML parser backend.
+
+    Args:
+        name (str or None): 'stdlib', 'lxml' or 'auto' (lxml if it is
+            installed), value of `EODDATA_CLIENT_XML_BACKEND` environment
+            variable or 'stdlib' if None.
+
+    Returns:
+        XmlBackend
+
+    Raises:
+        XmlBackendError
+    """
+    if name is None:
+        name = os.environ.get(XML_BACKEND_ENVIRONMENT_VARIABLE) \
+            or XML_BACKEND_STDLIB
+    name = name.lower()
+    if name == XML_BACKEND_AUTO:
+        name = XML_BACKEND_STDLIB if lxml_etree is None else XML_BACKEND_LXML
+    try:
+        backend_class = XML_BACKENDS[name]
+    except KeyError:
+        raise XmlBackendError('Unknown XML backend: {0}'.format(name))
+    return backend_class()
@@ -54,4 +54,13 @@ setup(
         'Programming Language :: Python :: 3.6',
     ],
     install_requires=['requests', 'pandas'],
+    extras_require={
+        'lxml': ['lxml'],
+        'parquet': ['pyarrow'],
+    },
+    entry_points={
+        'console_scripts': [
+            'eoddata-client = eoddata_client.cli:main',
+        ],
+    },
 )
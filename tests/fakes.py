@@ -0,0 +1,69 @@
+"""Fakes of the EodData web service shared by the tests."""
+import threading
+
+from urllib.parse import urlparse
+
+from eoddata_client import EodDataExchange
+
+RESPONSE = '<?xml version="1.0" encoding="utf-8"?>' \
+           '<RESPONSE Source="Data Access Web Service" Message="{message}" ' \
+           'xmlns="http://ws.eoddata.com/Data"{token}>{body}</RESPONSE>'
+
+QUOTE = '<QUOTE Symbol="{0}" Description="{0} Inc" Name="{0} Inc" ' \
+        'DateTime="2017-09-26T00:00:00" Open="1" High="2" Low="0.5" ' \
+        'Close="{1}" Volume="100" OpenInterest="0" Previous="1" Change="0" ' \
+        'Bid="0" Ask="0" PreviousClose="1" NextOpen="0" ' \
+        'Modified="2017-09-26T16:00:00" />'
+
+
+def quotes_response(symbols, close=1.5):
+    body = '<QUOTES>{0}</QUOTES>'.format(
+        ''.join(QUOTE.format(symbol, close) for symbol in symbols)
+    )
+    return RESPONSE.format(message='Success', token='', body=body)
+
+
+def make_exchange(code, last_trade_time, advances=10, declines=5):
+    return EodDataExchange(
+        code=code, name=code, last_trade_time=last_trade_time,
+        country_code='US', currency='USD', advances=advances,
+        declines=declines, timezone='Eastern Standard Time'
+    )
+
+
+class FakeResponse(object):
+
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.status_code = status_code
+
+
+class FakeService(object):
+    """Transport of the client answering requests with `handler`.
+
+    Args:
+        handler: Callable taking the endpoint name and the request
+            parameters and returning the response text.
+        token (str): Token returned on login.
+    """
+
+    def __init__(self, handler=None, token='T'):
+        self.handler = handler
+        self.token = token
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, **kwargs):
+        endpoint = urlparse(url).path.rsplit('/', 1)[-1]
+        with self.lock:
+            self.calls.append((endpoint, dict(params or {})))
+        return FakeResponse(self.handler(endpoint, params or {}))
+
+    def post(self, url, data=None, **kwargs):
+        with self.lock:
+            self.calls.append(('Login', dict(data or {})))
+        return FakeResponse(RESPONSE.format(
+            message='Login Successful',
+            token=' Token="{0}"'.format(self.token), body=''
+        ))
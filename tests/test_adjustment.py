@@ -0,0 +1,72 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eoddata_client import EodDataSplit
+from eoddata_client.adjustment import adjust_arrays, adjust_for_splits
+
+
+def split(symbol, date, ratio):
+    return EodDataSplit('NASDAQ', symbol, datetime.datetime(*date), ratio)
+
+
+class TestAdjustment(object):
+
+    def test_factor(self):
+        assert split('MSFT', (2003, 2, 18), '2-1').factor == 2
+        assert split('MSFT', (2003, 2, 18), '1-4').factor == 0.25
+
+    def test_invalid_ratio(self, caplog):
+        assert np.isnan(split('MSFT', (2003, 2, 18), '').factor)
+        assert np.isnan(split('MSFT', (2003, 2, 18), '2-0').factor)
+        df = EodDataSplit.format([split('MSFT', (2003, 2, 18), 'n/a')],
+                                 output_format='data-frame')
+        assert np.isnan(df['Factor'].iloc[0])
+        assert 'Invalid split ratio' in caplog.text
+        # splits with invalid ratios are not applied
+        quotes = pd.DataFrame({'Close': [48.0, 24.0]}, index=pd.to_datetime(
+            ['2003-02-14', '2003-02-18']))
+        adjust_for_splits(quotes, df)
+        assert quotes['Close'].tolist() == [48.0, 24.0]
+
+    def test_adjust_arrays(self):
+        datetimes = np.array(['2003-02-14', '2003-02-18', '2003-02-19'],
+                             dtype='datetime64[ns]')
+        prices = np.array([[48.3, 48.0], [24.9, 24.8], [25.1, 24.7]])
+        volumes = np.array([100, 300, 300])
+        adjust_arrays(datetimes, prices, volumes,
+                      np.array(['2003-02-18'], dtype='datetime64[ns]'),
+                      np.array([2.0]))
+        assert prices[0].tolist() == [24.15, 24.0]
+        assert prices[1].tolist() == [24.9, 24.8]
+        assert volumes.tolist() == [200, 300, 300]
+
+    def test_adjust_data_frame(self):
+        index = pd.to_datetime(['1999-03-26', '1999-03-29', '2003-02-14',
+                                '2003-02-18'] * 2)
+        df = pd.DataFrame({
+            'Symbol': ['MSFT'] * 4 + ['AAPL'] * 4,
+            'Close': [180.0, 90.0, 48.0, 24.0] * 2,
+            'Volume': [10, 20, 40, 80] * 2,
+        }, index=index)
+        splits = [split('MSFT', (1999, 3, 29), '2-1'),
+                  split('MSFT', (2003, 2, 18), '2-1')]
+        result = adjust_for_splits(df, EodDataSplit.format(
+            splits, output_format='data-frame'))
+        assert result is df
+        assert df['Close'].tolist() == [45.0, 45.0, 24.0, 24.0,
+                                        180.0, 90.0, 48.0, 24.0]
+        assert df['Volume'].tolist() == [40, 40, 80, 80, 10, 20, 40, 80]
+
+    def test_single_symbol_with_exchange_splits(self):
+        splits = [split('MSFT', (2003, 2, 18), '2-1'),
+                  split('AAPL', (2003, 2, 18), '4-1')]
+        quotes = pd.DataFrame({'Close': [48.0, 24.0]}, index=pd.to_datetime(
+            ['2003-02-14', '2003-02-18']))
+        with pytest.raises(ValueError):
+            adjust_for_splits(quotes, splits)
+        adjust_for_splits(quotes, EodDataSplit.format(
+            splits, output_format='data-frame'), symbol='msft')
+        assert quotes['Close'].tolist() == [24.0, 24.0]
@@ -0,0 +1,33 @@
+import xml.etree.ElementTree as ET
+
+from eoddata_client import EodDataQuoteExtended
+
+QUOTE_XML = '<QUOTE Symbol="MSFT" Description="Microsoft Corp" ' \
+            'Name="Microsoft Corp" DateTime="2017-09-2{0}T00:00:00" ' \
+            'Open="75.35" High="75.55" Low="74.31" Close="74.94" ' \
+            'Volume="21587800" OpenInterest="0" Previous="0" Change="0" ' \
+            'Bid="0" Ask="0" PreviousClose="0" NextOpen="0" ' \
+            'Modified="2017-09-2{0}T00:00:00" />'
+
+
+class TestEodDataQuoteExtended(object):
+
+    def test_repeated_strings_are_shared(self):
+        string_pool = {}
+        quotes = [
+            EodDataQuoteExtended.from_xml(ET.fromstring(QUOTE_XML.format(i)),
+                                          string_pool)
+            for i in range(2)
+        ]
+        assert quotes[0].symbol is quotes[1].symbol
+        assert quotes[0].name is quotes[1].name
+        assert quotes[0].description is quotes[1].description
+
+    def test_data_frame_categories(self):
+        quotes = [
+            EodDataQuoteExtended.from_xml(ET.fromstring(QUOTE_XML.format(i)))
+            for i in range(2)
+        ]
+        df = EodDataQuoteExtended.format(quotes, output_format='data-frame')
+        assert df['Symbol'].dtype == 'category'
+        assert list(df['Close']) == [74.94, 74.94]
@@ -0,0 +1,83 @@
+"""Tests of recording and replaying responses."""
+import gzip
+import time
+
+import pytest
+
+from eoddata_client import EodDataHttpClient
+from eoddata_client.cassettes import Cassette, CassetteError, \
+    RecordingTransport, ReplayTransport
+from fakes import FakeService, QUOTE, RESPONSE
+
+
+def slow_quote(endpoint, params):
+    time.sleep(0.05)
+    body = QUOTE.format(params['Symbol'], 1.5).replace(
+        'Name="{0} Inc"'.format(params['Symbol']), 'Name="Nestlé"'
+    )
+    return RESPONSE.format(message='Success', token='', body=body)
+
+
+@pytest.fixture
+def cassette_path(tmpdir):
+    path = str(tmpdir.join('cassette.json.gz'))
+    service = FakeService(slow_quote, token='SECRET')
+    with RecordingTransport(path, metadata={'test_date': '2017-09-26'},
+                            transport=service) as transport:
+        client = EodDataHttpClient('user', 'hunter2', transport=transport)
+        assert client.quote_detail('nasdaq', 'msft').name == 'Nestlé'
+        assert client.quote_detail('nasdaq', 'aapl').name == 'Nestlé'
+    assert len(service.calls) == 3
+    return path
+
+
+class TestRecording(object):
+
+    def test_secrets_scrubbed(self, cassette_path):
+        with gzip.open(cassette_path, 'rt', encoding='utf-8') as f:
+            data = f.read()
+        for secret in ('SECRET', 'hunter2', '"user"'):
+            assert secret not in data
+
+    def test_cassette(self, cassette_path):
+        cassette = Cassette.load(cassette_path)
+        assert cassette.metadata == {'test_date': '2017-09-26'}
+        assert [(i['method'], i['endpoint'])
+                for i in cassette.interactions] == [
+            ('POST', 'Login'), ('GET', 'QuoteGet'), ('GET', 'QuoteGet')
+        ]
+        assert cassette.interactions[1]['elapsed'] >= 0.05
+
+
+class TestReplay(object):
+
+    def test_replay(self, cassette_path):
+        client = EodDataHttpClient('other', 'password',
+                                   transport=ReplayTransport(cassette_path))
+        started = time.perf_counter()
+        quote = client.quote_detail('nasdaq', 'aapl')
+        assert time.perf_counter() - started < 0.05
+        assert quote.symbol == 'AAPL'
+        assert quote.name == 'Nestlé'
+        assert client._token == 'SCRUBBED'
+
+    def test_recorded_latency(self, cassette_path):
+        client = EodDataHttpClient(
+            'user', 'password',
+            transport=ReplayTransport(cassette_path, latency=True)
+        )
+        started = time.perf_counter()
+        client.quote_detail('nasdaq', 'msft')
+        assert time.perf_counter() - started >= 0.05
+
+    def test_repeated_requests(self, cassette_path):
+        client = EodDataHttpClient('user', 'password',
+                                   transport=ReplayTransport(cassette_path))
+        for _ in range(3):
+            assert client.quote_detail('nasdaq', 'msft').symbol == 'MSFT'
+
+    def test_unknown_request(self, cassette_path):
+        client = EodDataHttpClient('user', 'password',
+                                   transport=ReplayTransport(cassette_path))
+        with pytest.raises(CassetteError):
+            client.quote_detail('nasdaq', 'goog')
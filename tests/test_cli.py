@@ -0,0 +1,133 @@
+import datetime
+import os
+
+import pandas as pd
+import pytest
+
+from eoddata_client import EodDataExchange, EodDataSymbol
+from eoddata_client.cli import main, download, WorkUnit, EXIT_OK, \
+    EXIT_PARTIAL_FAILURE, EXIT_LOGIN_FAILED, EXIT_USAGE
+from eoddata_client.eoddata_client import InvalidCredentialsError, \
+    InvalidExchangeCodeError, InvalidSymbolCodeError, NoDataAvailableError
+
+
+class FakeClient(object):
+
+    def __init__(self, login_error=None):
+        self.login_error = login_error
+        self.dates = []
+        self.last_trade_time = datetime.datetime(2017, 9, 25, 16)
+
+    def login(self):
+        if self.login_error:
+            raise self.login_error
+
+    def symbol_list(self, exchange_code, output_format='entity-list'):
+        if exchange_code == 'NONE':
+            raise InvalidExchangeCodeError
+        symbols = [EodDataSymbol('MSFT', 'Microsoft', 'Microsoft Corp'),
+                   EodDataSymbol('AAPL', 'Apple', 'Apple Inc')]
+        return EodDataSymbol.format(symbols, output_format=output_format)
+
+    def symbol_history(self, exchange_code, symbol, start_date,
+                       output_format='entity-list'):
+        if symbol == 'NONE':
+            raise InvalidSymbolCodeError
+        return pd.DataFrame({'Close': [1.0, 2.0]})
+
+    def exchange_list(self):
+        return [EodDataExchange('NASDAQ', 'Nasdaq', self.last_trade_time,
+                                'US', 'USD', 10, 5, 'Eastern Standard Time')]
+
+    def quote_list_by_date(self, exchange_code, date,
+                           output_format='entity-list'):
+        self.dates.append(date)
+        return pd.DataFrame({'Close': [1.0]})
+
+
+class TestCli(object):
+
+    def test_history_all_symbols(self, tmpdir):
+        status = main(['-q', '-o', str(tmpdir), 'history', 'nasdaq',
+                       '--all-symbols'], client=FakeClient())
+        assert status == EXIT_OK
+        assert sorted(os.listdir(str(tmpdir))) == ['NASDAQ_AAPL.csv',
+                                                   'NASDAQ_MSFT.csv']
+
+    def test_quotes_skip_weekends(self, tmpdir):
+        client = FakeClient()
+        status = main(['-q', '-o', str(tmpdir), '-w', '2', 'quotes', 'nasdaq',
+                       '--start', '2017-09-22', '--end', '2017-09-25'],
+                      client=client)
+        assert status == EXIT_OK
+        assert sorted(client.dates) == [datetime.date(2017, 9, 22),
+                                        datetime.date(2017, 9, 25)]
+
+    def test_quotes_state(self, tmpdir):
+        client = FakeClient()
+        args = ['-q', '-o', str(tmpdir), 'quotes', 'nasdaq', '--start',
+                '2017-09-25', '--state', str(tmpdir.join('state.json'))]
+        assert main(args, client=client) == EXIT_OK
+        assert main(args, client=client) == EXIT_OK
+        assert len(client.dates) == 1
+        assert os.path.exists(str(tmpdir.join('NASDAQ_20170925.csv')))
+        client.last_trade_time = datetime.datetime(2017, 9, 26, 16)
+        assert main(args, client=client) == EXIT_OK
+        assert len(client.dates) == 2
+
+    def test_quotes_state_next_day(self, tmpdir):
+        client = FakeClient()
+        state = str(tmpdir.join('state.json'))
+        for start in ('2017-09-25', '2017-09-26'):
+            assert main(['-q', '-o', str(tmpdir), 'quotes', 'nasdaq',
+                         '--start', start, '--state', state],
+                        client=client) == EXIT_OK
+        # the exchange has no data after the synced day
+        assert client.dates == [datetime.date(2017, 9, 25)]
+        assert not os.path.exists(str(tmpdir.join('NASDAQ_20170926.csv')))
+
+    def test_exit_status(self, tmpdir):
+        assert main(['-q', '-o', str(tmpdir), 'history', 'nasdaq', 'msft',
+                     'none'], client=FakeClient()) == EXIT_PARTIAL_FAILURE
+        assert main(['-q', 'symbols', 'nasdaq'], client=FakeClient(
+            InvalidCredentialsError())) == EXIT_LOGIN_FAILED
+        assert main([]) == EXIT_USAGE
+
+    def test_planning_error(self, tmpdir):
+        assert main(['-q', '-o', str(tmpdir), 'history', 'none',
+                     '--all-symbols'], client=FakeClient()) == EXIT_USAGE
+
+    def test_interrupt_cancels_pending_units(self, tmpdir):
+        fetched = []
+
+        def interrupt():
+            raise KeyboardInterrupt
+
+        def fetch():
+            fetched.append(True)
+            return pd.DataFrame({'Close': [1.0]})
+
+        units = [WorkUnit('first', interrupt)] + \
+            [WorkUnit('unit{0}'.format(i), fetch) for i in range(10)]
+        with pytest.raises(KeyboardInterrupt):
+            download(units, str(tmpdir), workers=1)
+        assert len(fetched) < 10
+
+    def test_run_missing_manifest(self, tmpdir):
+        path = str(tmpdir.join('missing.json'))
+        assert main(['-q', '-o', str(tmpdir), 'run', path, '--shard', '0',
+                     '--shards', '1'],
+                    client=FakeClient()) == EXIT_USAGE
+
+    def test_export_reports_skipped_days(self, tmpdir, capsys):
+        class ExportClient(FakeClient):
+            def quote_list_by_date(self, exchange_code, date):
+                if date == datetime.date(2017, 9, 26):
+                    raise NoDataAvailableError
+                return []
+
+        assert main(['-o', str(tmpdir), 'export', 'nasdaq', '--start',
+                     '2017-09-25', '--end', '2017-09-26', '--prefetch', '0'],
+                    client=ExportClient()) == EXIT_OK
+        assert 'NASDAQ: no data for 1 days: 2017-09-26' \
+            in capsys.readouterr().err
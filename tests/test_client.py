@@ -14,11 +14,23 @@ from eoddata_client import EodDataHttpClient, EodDataExchange, \
                            EodDataSymbol, EodDataSymbolCompact
 from eoddata_client.eoddata_client import TestEnvironmentNotSet as \
     EnvironmentNotSet, PERIODS, EodDataInternalServerError
+from eoddata_client.cassettes import Cassette, RecordingTransport, \
+    ReplayTransport
 
 BUSINESS_DAY_US = CustomBusinessDay(calendar=USFederalHolidayCalendar())
 
-# get last but one business day in the USA (take into consideration US holidays)
-TEST_DATE = datetime.date.today() - BUSINESS_DAY_US * 2
+# cassette to record responses to (EOD_DATA_RECORD=1) or to replay offline
+CASSETTE = os.environ.get('EOD_DATA_CASSETTE')
+RECORD = os.environ.get('EOD_DATA_RECORD') == '1'
+
+if CASSETTE and not RECORD:
+    # replay with the date of the recording
+    TEST_DATE = datetime.datetime.strptime(
+        Cassette.load(CASSETTE).metadata['test_date'], '%Y-%m-%d'
+    )
+else:
+    # get last but one business day in the USA (take into consideration US holidays)
+    TEST_DATE = datetime.date.today() - BUSINESS_DAY_US * 2
 
 # exclude month and weeks not to cause an error on small periods
 TEST_PERIODS = [p[0] for p in PERIODS if p[0] not in ['m', 'w']]
@@ -53,16 +65,30 @@ class TestClient(object):
 
     @pytest.fixture(scope='class')
     def client(self):
+        transport = None
+        if CASSETTE and not RECORD:
+            transport = ReplayTransport(CASSETTE)
+        elif CASSETTE:
+            transport = RecordingTransport(
+                CASSETTE, metadata={'test_date': TEST_DATE.strftime('%Y-%m-%d')}
+            )
         try:
-            client = EodDataHttpClient(os.environ['EOD_DATA_LOGIN'],
-                                       os.environ['EOD_DATA_PASSWORD'])
+            if isinstance(transport, ReplayTransport):
+                client = EodDataHttpClient('user', 'password',
+                                           transport=transport)
+            else:
+                client = EodDataHttpClient(os.environ['EOD_DATA_LOGIN'],
+                                           os.environ['EOD_DATA_PASSWORD'],
+                                           transport=transport)
         except KeyError:
             raise EnvironmentNotSet('Environment test variables not set. '
                                     'You should set `EOD_DATA_LOGIN` and '
                                     '`EOD_DATA_PASSWORD` to your EodData '
                                     'username and password accordingly.')
         client.login()
-        return client
+        yield client
+        if isinstance(transport, RecordingTransport):
+            transport.save()
     
     def test_country_list(self, client):
         client.country_list()
@@ -88,9 +114,10 @@ class TestClient(object):
     def test_exchange_months(self, client):
         client.exchange_months()
 
-    @pytest.mark.skip(reason="not implemented yet")
     def test_fundamental_list(self, client):
-        client.fundamental_list()
+        df = client.fundamental_list(TEST_EXCHANGE,
+                                     output_format='data-frame')
+        assert len(df) > 0
 
     @pytest.mark.skip(reason="not implemented yet")
     def test_news_list(self, client):
@@ -193,6 +220,11 @@ class TestClient(object):
         df = EodDataQuoteExtended.format(quotes, output_format='data-frame')
         assert len(quotes) == len(df)
 
+    def test_technical_list(self, client):
+        df = client.technical_list(TEST_EXCHANGE,
+                                   output_format='data-frame')
+        assert len(df) > 0
+
     def test_symbol_list(self, client):
         symbols = client.symbol_list(TEST_EXCHANGE)
         df = EodDataSymbol.format(symbols, output_format='data-frame')
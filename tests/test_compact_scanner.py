@@ -0,0 +1,70 @@
+import datetime
+import xml.etree.ElementTree as ET
+
+import pandas as pd
+import pytest
+
+from eoddata_client.business_entities import EodDataQuoteCompact
+from eoddata_client.compact_scanner import QUOTE_COMPACT_ATTRIBUTES, \
+    SYMBOL_COMPACT_ATTRIBUTES, ScanError, compact_quotes, compact_symbols, \
+    scan_compact
+
+RESPONSE = '<?xml version="1.0" encoding="utf-8"?>' \
+           '<RESPONSE Source="Data Access Web Service" Message="{0}" ' \
+           'xmlns="http://ws.eoddata.com/Data">{1}</RESPONSE>'
+
+QUOTE2 = '<QUOTE2 s="{0}" d="2017-09-26T00:00:00" o="73.67" h="73.81" ' \
+         'l="72.99" c="{1}" v="18019500" i="0" b="0" a="0" />'
+
+
+def quotes_payload(*quotes, message='Success'):
+    body = '<QUOTES2>{0}</QUOTES2>'.format(
+        '\n'.join(QUOTE2.format(symbol, close) for symbol, close in quotes)
+    )
+    return RESPONSE.format(message, body).encode('utf-8')
+
+
+class TestScanCompact(object):
+
+    def test_quotes_match_xml_parser(self):
+        payload = quotes_payload(('MSFT', 73.26), ('AAPL', 153.14))
+        columns = scan_compact(payload, 'QUOTES2', QUOTE_COMPACT_ATTRIBUTES,
+                               text=('s',), datetimes=('d',))
+        assert columns['s'] == ['MSFT', 'AAPL']
+        root = ET.fromstring(payload)
+        expected = [EodDataQuoteCompact.from_xml(el) for el in root[0]]
+        quotes = compact_quotes(columns)
+        assert [vars(q) for q in quotes] == [vars(q) for q in expected]
+        pd.testing.assert_frame_equal(
+            compact_quotes(columns, output_format='data-frame'),
+            EodDataQuoteCompact.format(expected, output_format='data-frame',
+                                       df_index='Symbol')
+        )
+
+    def test_symbols(self):
+        payload = RESPONSE.format(
+            'Success', '<SYMBOLS2><SYMBOL2 n="AT&amp;T Inc" c="T" />'
+                       '<SYMBOL2 n="Microsoft" c="MSFT" /></SYMBOLS2>'
+        )
+        columns = scan_compact(payload, 'SYMBOLS2', SYMBOL_COMPACT_ATTRIBUTES)
+        assert [(s.code, s.name) for s in compact_symbols(columns)] \
+            == [('T', 'AT&T Inc'), ('MSFT', 'Microsoft')]
+
+    def test_empty(self):
+        payload = RESPONSE.format('Success', '<QUOTES2 />')
+        columns = scan_compact(payload, 'QUOTES2', QUOTE_COMPACT_ATTRIBUTES,
+                               text=('s',), datetimes=('d',))
+        assert compact_quotes(columns) == []
+
+    @pytest.mark.parametrize('payload', [
+        quotes_payload(('MSFT', 1), message='Invalid Token'),
+        quotes_payload(('MSFT', 1)).replace(b'<QUOTE2 s="MSFT" d',
+                                            b'<QUOTE2 d="x" s="MSFT" z'),
+        quotes_payload(('MSFT', 1), ('AAPL', 2)).replace(b'\n',
+                                                         b'<!-- x -->'),
+        quotes_payload(('A&#38;B', 1)),
+        quotes_payload(('MSFT', 1)).replace(b'utf-8', b'windows-1252'),
+    ])
+    def test_unexpected(self, payload):
+        with pytest.raises(ScanError):
+            scan_compact(payload, 'QUOTES2', QUOTE_COMPACT_ATTRIBUTES)
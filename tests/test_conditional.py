@@ -0,0 +1,104 @@
+import datetime
+
+import pytest
+
+from eoddata_client.conditional import ConditionalFetcher, ExchangeState, \
+    SyncRecord, SyncState, SyncStateError
+from fakes import make_exchange
+
+DATE = datetime.date(2017, 9, 26)
+
+
+class FakeClient(object):
+
+    def __init__(self):
+        self.exchanges = [
+            make_exchange('NASDAQ', datetime.datetime(2017, 9, 26, 16)),
+            make_exchange('NYSE', datetime.datetime(2017, 9, 26, 16, 0, 1,
+                                                    500)),
+        ]
+        self.downloads = []
+
+    def exchange_list(self):
+        return self.exchanges
+
+    def quote_list_by_date(self, exchange_code, date,
+                           output_format='entity-list'):
+        self.downloads.append((exchange_code, date))
+        return ['quotes']
+
+
+class TestConditionalFetcher(object):
+
+    def sync(self, client, path, exchange_code='nasdaq', load=None,
+             date=DATE):
+        fetcher = ConditionalFetcher(client, path)
+        quotes = fetcher.quote_list_by_date(exchange_code, date, load=load)
+        if quotes is not None:
+            fetcher.mark_synced(exchange_code, date)
+        return quotes
+
+    def test_skip_unchanged(self, tmpdir):
+        path = str(tmpdir.join('state.json'))
+        client = FakeClient()
+        assert self.sync(client, path) == ['quotes']
+        assert self.sync(client, path) is None
+        assert self.sync(client, path, load=lambda: ['stored']) == ['stored']
+        assert client.downloads == [('nasdaq', DATE)]
+
+    def test_download_when_changed(self, tmpdir):
+        path = str(tmpdir.join('state.json'))
+        client = FakeClient()
+        self.sync(client, path)
+        client.exchanges[0] = make_exchange(
+            'NASDAQ', datetime.datetime(2017, 9, 26, 16), advances=11
+        )
+        assert self.sync(client, path) == ['quotes']
+        assert len(client.downloads) == 2
+
+    def test_skip_next_day_when_unchanged(self, tmpdir):
+        path = str(tmpdir.join('state.json'))
+        client = FakeClient()
+        next_day = DATE + datetime.timedelta(days=1)
+        self.sync(client, path)
+        assert self.sync(client, path, date=next_day) is None
+        client.exchanges[0] = make_exchange(
+            'NASDAQ', datetime.datetime(2017, 9, 27, 16)
+        )
+        assert self.sync(client, path, date=next_day) == ['quotes']
+        assert client.downloads == [('nasdaq', DATE), ('nasdaq', next_day)]
+
+    def test_backfill_is_not_skipped(self, tmpdir):
+        path = str(tmpdir.join('state.json'))
+        client = FakeClient()
+        previous_day = DATE - datetime.timedelta(days=1)
+        # synced quotes are older than the last trade
+        self.sync(client, path, date=previous_day - datetime.timedelta(1))
+        assert self.sync(client, path, date=previous_day) == ['quotes']
+        self.sync(client, path)
+        assert self.sync(client, path, date=previous_day) == ['quotes']
+        assert len(client.downloads) == 4
+        # the latest synced date is kept
+        assert self.sync(client, path) is None
+
+    def test_not_synced_without_mark(self, tmpdir):
+        path = str(tmpdir.join('state.json'))
+        client = FakeClient()
+        fetcher = ConditionalFetcher(client, path)
+        fetcher.quote_list_by_date('nyse', DATE)
+        assert self.sync(client, path, exchange_code='nyse') == ['quotes']
+        assert self.sync(client, path, exchange_code='nyse') is None
+
+    def test_state_round_trip(self, tmpdir):
+        path = str(tmpdir.join('state.json'))
+        record = SyncRecord(DATE, ExchangeState(
+            datetime.datetime(2017, 9, 26, 16, 0, 1, 500), 10, 5
+        ))
+        SyncState(path).set('NYSE', record)
+        assert SyncState(path).get('NYSE') == record
+
+    def test_invalid_state(self, tmpdir):
+        path = tmpdir.join('state.json')
+        path.write('{"NYSE": {}}')
+        with pytest.raises(SyncStateError):
+            SyncState(str(path))
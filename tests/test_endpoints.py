@@ -0,0 +1,425 @@
+"""Endpoint tests against canned EodData web service responses."""
+import datetime
+import time
+
+import pandas as pd
+import pytest
+
+from eoddata_client import EodDataHttpClient, EodDataQuoteExtended
+from eoddata_client import eoddata_client as client_module
+from eoddata_client.eoddata_client import InvalidSymbolCodeError
+from eoddata_client.profiling import read_summary
+from eoddata_client.token_store import FileTokenStore
+from eoddata_client.validation import HIGH_BELOW_LOW, VALIDATION_DROP, \
+    VALIDATION_FLAG
+from fakes import FakeResponse, FakeService, QUOTE, RESPONSE, \
+    quotes_response
+
+
+@pytest.fixture
+def service():
+    return FakeService()
+
+
+@pytest.fixture
+def client(service):
+    return EodDataHttpClient('user', 'password', transport=service)
+
+
+class TestQuoteListSpecific(object):
+
+    def handler(self, endpoint, params):
+        symbols = [s for s in params['Symbols'].split(',') if s != 'NONE']
+        return quotes_response(reversed(symbols))
+
+    def test_single_request(self, client, service):
+        service.handler = self.handler
+        quotes = client.quote_list_specific('nasdaq',
+                                            ['msft', 'none', 'aapl', 'MSFT'])
+        assert [q.symbol for q in quotes] == ['MSFT', 'AAPL']
+        assert client.last_missing_symbols == ['NONE']
+        assert [call[0] for call in service.calls] == ['Login', 'QuoteList2']
+
+    def test_batches(self, client, service, monkeypatch):
+        service.handler = self.handler
+        monkeypatch.setattr(client_module, 'MAX_SYMBOLS_PARAM_LENGTH', 20)
+        symbols = ['S{0}'.format(i) for i in range(50)]
+        df = client.quote_list_specific('nasdaq', symbols,
+                                        output_format='data-frame')
+        assert list(df.index) == symbols
+        batch_calls = [c for c in service.calls if c[0] == 'QuoteList2']
+        assert len(batch_calls) > 1
+        assert all(len(c[1]['Symbols']) <= 20 for c in batch_calls)
+        assert [c[0] for c in service.calls].count('Login') == 1
+
+    def test_batch_reports_are_merged(self, service, monkeypatch):
+        def handler(endpoint, params):
+            symbols = params['Symbols'].split(',')
+            body = ''.join(QUOTE.format(symbol, 1.5) for symbol in symbols)
+            body = body.replace('"S7" Description="S7 Inc" '
+                                'Name="S7 Inc" DateTime="2017-09-26T00:00:00" '
+                                'Open="1" High="2"',
+                                '"S7" Description="S7 Inc" '
+                                'Name="S7 Inc" DateTime="2017-09-26T00:00:00" '
+                                'Open="1" High="0.1"')
+            return RESPONSE.format(message='Success', token='',
+                                   body='<QUOTES>{0}</QUOTES>'.format(body))
+
+        service.handler = handler
+        monkeypatch.setattr(client_module, 'MAX_SYMBOLS_PARAM_LENGTH', 20)
+        client = EodDataHttpClient('user', 'password', transport=service,
+                                   validation_mode=VALIDATION_FLAG)
+        symbols = ['S{0}'.format(i) for i in range(20)]
+        df = client.quote_list_specific('nasdaq', symbols,
+                                        output_format='data-frame')
+        report = client.last_validation_report
+        assert report.total == 20
+        assert report.problems[HIGH_BELOW_LOW].tolist() == [7]
+        assert df['Problems'].iloc[7] == HIGH_BELOW_LOW
+        assert df['Problems'].iloc[6] == ''
+
+
+class TestQuoteList(object):
+
+    def test_data_frame_dtypes(self, client, service):
+        service.handler = lambda endpoint, params: quotes_response(
+            ['MSFT', 'AAPL']
+        )
+        df = client.quote_list('nasdaq', output_format='data-frame')
+        assert list(df.index) == ['MSFT', 'AAPL']
+        assert list(df.columns) == ['Datetime', 'Open', 'High', 'Low',
+                                    'Close', 'Volume']
+        assert pd.api.types.is_datetime64_any_dtype(df['Datetime'])
+        assert all(df[column].dtype == float
+                   for column in ('Open', 'High', 'Low', 'Close'))
+        assert pd.api.types.is_integer_dtype(df['Volume'])
+        # symbols are the index, history frames have categorical symbols
+        df = EodDataQuoteExtended.format(
+            client.quote_list('nasdaq'), output_format='data-frame',
+            df_index='Datetime'
+        )
+        assert df['Symbol'].dtype == 'category'
+
+
+class TestSplitList(object):
+
+    def handler(self, endpoint, params):
+        body = '<SPLITS><SPLIT Exchange="NASDAQ" Symbol="MSFT" ' \
+               'DateTime="2003-02-18T00:00:00" Ratio="2-1" /></SPLITS>'
+        return RESPONSE.format(message='Success', token='', body=body)
+
+    def test_split_list_by_symbol(self, client, service):
+        service.handler = self.handler
+        df = client.split_list_by_symbol('nasdaq', 'msft',
+                                         output_format='data-frame')
+        assert df['Factor'].tolist() == [2.0]
+        assert service.calls[-1] == ('SplitListBySymbol',
+                                     {'Token': 'T', 'Exchange': 'NASDAQ',
+                                      'Symbol': 'MSFT'})
+
+    def test_split_list_by_exchange(self, client, service):
+        service.handler = self.handler
+        splits = client.split_list_by_exchange('nasdaq')
+        assert [s.ratio for s in splits] == ['2-1']
+
+
+class TestFundamentalList(object):
+
+    def handler(self, endpoint, params):
+        body = '<FUNDAMENTALS>' \
+               '<FUNDAMENTAL Symbol="AAPL" Name="Apple Inc" ' \
+               'DateTime="2017-09-26T00:00:00" Sector="Technology" ' \
+               'MarketCap="789000000000" PE="17.4" DividendDate="" ' \
+               'Rating="1A" />' \
+               '<FUNDAMENTAL Symbol="MSFT" Name="Microsoft Corp" ' \
+               'DateTime="2017-09-26T00:00:00" Sector="Technology" ' \
+               'MarketCap="574000000000" PE="n/a" ' \
+               'DividendDate="2017-11-15T00:00:00" />' \
+               '</FUNDAMENTALS>'
+        return RESPONSE.format(message='Success', token='', body=body)
+
+    def test_data_frame(self, client, service):
+        service.handler = self.handler
+        df = client.fundamental_list('nasdaq', output_format='data-frame')
+        assert list(df.index) == ['AAPL', 'MSFT']
+        assert df['MarketCap'].dtype.kind in 'if'
+        assert df.loc['AAPL', 'PE'] == 17.4
+        assert df['PE'].isnull().tolist() == [False, True]
+        assert df['DividendDate'].isnull().tolist() == [True, False]
+        assert df.loc['MSFT', 'Sector'] == 'Technology'
+        # unknown attributes are kept as strings
+        assert df.loc['AAPL', 'Rating'] == '1A'
+
+    def test_entity_list(self, client, service):
+        service.handler = self.handler
+        fundamentals = client.fundamental_list('nasdaq')
+        assert [f.symbol for f in fundamentals] == ['AAPL', 'MSFT']
+        assert fundamentals[0].pe == 17.4
+        assert fundamentals[0].dividend_date is None
+        assert fundamentals[1].dividend_date == datetime.datetime(2017, 11,
+                                                                   15)
+        assert fundamentals[1].datetime == datetime.datetime(2017, 9, 26)
+        assert fundamentals[0].shares is None
+
+    def test_columns(self, client, service):
+        service.handler = self.handler
+        columns = client.fundamental_list('nasdaq', output_format='columns')
+        assert columns['MarketCap'].tolist() == [789e9, 574e9]
+        assert service.calls[-1][0] == 'FundamentalList'
+
+    def test_technical_list(self, client, service):
+        def handler(endpoint, params):
+            body = '<TECHNICALS><TECHNICAL Symbol="AAPL" MA5="153.2" ' \
+                   'RSI14="48.1" /></TECHNICALS>'
+            return RESPONSE.format(message='Success', token='', body=body)
+
+        service.handler = handler
+        df = client.technical_list('nasdaq', output_format='data-frame')
+        assert df.loc['AAPL', 'RSI14'] == 48.1
+        assert client.technical_list('nasdaq')[0].ma5 == 153.2
+        assert service.calls[-1][0] == 'TechnicalList'
+
+
+class TestQuoteValidation(object):
+
+    def test_bad_quotes_are_reported_once(self, client, service, caplog):
+        def handler(endpoint, params):
+            body = '<QUOTES>{0}{1}{2}</QUOTES>'.format(
+                QUOTE.format('MSFT', 75.0), QUOTE.format('AAPL', 'n/a'),
+                QUOTE.format('MSFT', 75.0)
+            )
+            return RESPONSE.format(message='Success', token='', body=body)
+
+        service.handler = handler
+        quotes = client.quote_list('nasdaq')
+        # the duplicate is kept by default
+        assert [q.symbol for q in quotes] == ['MSFT', 'MSFT']
+        assert quotes[1].problems is None
+        report = client.last_validation_report
+        assert report.dropped == 1
+        assert report.problems['duplicate datetime'].tolist() == [1]
+        warnings = [r for r in caplog.records if r.levelname == 'WARNING']
+        errors = [r for r in caplog.records if r.levelname == 'ERROR']
+        assert len(warnings) == 1 and not errors
+
+    def handler(self, endpoint, params):
+        body = '<QUOTES>{0}{1}{2}</QUOTES>'.format(
+            QUOTE.format('MSFT', 75.0), QUOTE.format('AAPL', 'n/a'),
+            QUOTE.format('MSFT', 75.0)
+        )
+        return RESPONSE.format(message='Success', token='', body=body)
+
+    def test_invalid_modified_is_not_logged_per_row(self, client,
+                                                    service, caplog):
+        def handler(endpoint, params):
+            body = '<QUOTES>{0}{1}</QUOTES>'.format(
+                QUOTE.format('MSFT', 75.0),
+                QUOTE.format('AAPL', 150.0).replace('2017-09-26T16:00:00',
+                                                    'n/a')
+            )
+            return RESPONSE.format(message='Success', token='', body=body)
+
+        service.handler = handler
+        quotes = client.quote_list('nasdaq')
+        assert [q.symbol for q in quotes] == ['MSFT']
+        assert client.last_validation_report.dropped == 1
+        assert not [r for r in caplog.records if r.levelname == 'ERROR']
+
+    def test_flag(self, service):
+        service.handler = self.handler
+        client = EodDataHttpClient('user', 'password', transport=service,
+                                   validation_mode=VALIDATION_FLAG)
+        quotes = client.quote_list('nasdaq')
+        assert [q.problems for q in quotes] == [(), ('duplicate datetime',)]
+        assert client.last_validation_report.problems[
+            'duplicate datetime'].tolist() == [1]
+        df = client.quote_list('nasdaq', output_format='data-frame')
+        assert df['Problems'].tolist() == ['', 'duplicate datetime']
+
+    def test_drop(self, service):
+        service.handler = self.handler
+        client = EodDataHttpClient('user', 'password', transport=service,
+                                   validation_mode=VALIDATION_DROP)
+        quotes = client.quote_list('nasdaq')
+        assert [q.symbol for q in quotes] == ['MSFT']
+        assert client.last_validation_report.dropped == 2
+
+
+class TestProfiling(object):
+
+    def test_profile_dir(self, service, monkeypatch, tmpdir):
+        monkeypatch.setenv('EODDATA_CLIENT_PROFILE_DIR', str(tmpdir))
+        client = EodDataHttpClient('user', 'password', transport=service)
+        service.handler = lambda endpoint, params: quotes_response(['MSFT'])
+        client.quote_list('nasdaq', output_format='data-frame')
+        client.quote_list('nasdaq')
+        summary = read_summary(str(tmpdir))
+        assert summary['quote_list']['calls'] == 2
+        assert summary['quote_list']['conversion'] > 0
+        assert len(tmpdir.listdir(lambda p: p.ext == '.prof')) == 2
+
+    def test_worker_threads(self, service, monkeypatch, tmpdir):
+        def handler(endpoint, params):
+            time.sleep(0.05)
+            return quotes_response(params['Symbols'].split(','))
+
+        service.handler = handler
+        monkeypatch.setattr(client_module, 'MAX_SYMBOLS_PARAM_LENGTH', 20)
+        client = EodDataHttpClient('user', 'password', transport=service,
+                                   profile_dir=str(tmpdir))
+        client.quote_list_specific('nasdaq',
+                                   ['S{0}'.format(i) for i in range(20)])
+        summary = read_summary(str(tmpdir))['quote_list_specific']
+        # requests of worker threads are not parsing time of the caller
+        assert summary['workers'] >= 0.05
+        assert summary['parsing'] < summary['workers']
+
+    def test_off_by_default(self, client):
+        assert client.profiler is None
+
+
+class TestTokenStore(object):
+
+    def handler(self, endpoint, params):
+        if params['Token'] != 'T':
+            return RESPONSE.format(message='Invalid Token', token='', body='')
+        return quotes_response(['MSFT'])
+
+    def test_token_is_reused(self, service, tmpdir):
+        service.handler = self.handler
+        store = FileTokenStore(str(tmpdir.join('tokens.json')))
+        EodDataHttpClient('user', 'password', transport=service,
+                          token_store=store, login_on_init=True)
+        assert [c[0] for c in service.calls] == ['Login']
+        client = EodDataHttpClient('user', 'password', transport=service,
+                                   token_store=store)
+        client.quote_list('nasdaq')
+        assert [c[0] for c in service.calls] == ['Login', 'QuoteList']
+
+    def test_cooperative_refresh(self, service, tmpdir):
+        service.handler = self.handler
+        store = FileTokenStore(str(tmpdir.join('tokens.json')))
+        store.set('user@http://ws.eoddata.com/data.asmx/', 'EXPIRED')
+        first = EodDataHttpClient('user', 'password', transport=service,
+                                  token_store=store)
+        second = EodDataHttpClient('user', 'password', transport=service,
+                                   token_store=store)
+        first.quote_list('nasdaq')
+        second.quote_list('nasdaq')
+        assert [c[0] for c in service.calls].count('Login') == 1
+        assert second.get_params()['Token'] == 'T'
+        other = EodDataHttpClient('other', 'password', transport=service,
+                                  token_store=store)
+        assert other.get_params()['Token'] == 'T'
+        assert [c[0] for c in service.calls].count('Login') == 2
+
+
+class TestWarmUp(object):
+
+    def handler(self, endpoint, params):
+        time.sleep(0.05)
+        if endpoint == 'ExchangeList':
+            body = '<EXCHANGES><EXCHANGE Code="NASDAQ" Name="NASDAQ Stock ' \
+                   'Exchange" LastTradeDateTime="2017-09-26T16:00:00" ' \
+                   'Country="US" Currency="USD" Advances="1" Declines="2" ' \
+                   'Suffix="" TimeZone="Eastern Standard Time" ' \
+                   'IsIntraday="true" IntradayStartDate="2008-01-01T00:00:00" ' \
+                   'HasIntradayProduct="true" /></EXCHANGES>'
+        elif endpoint == 'CountryList':
+            body = '<COUNTRIES><CountryBase Code="US" ' \
+                   'Name="United States" /></COUNTRIES>'
+        else:
+            body = '<SYMBOLS><SYMBOL Code="MSFT" Name="Microsoft Corp" ' \
+                   'LongName="Microsoft Corporation" ' \
+                   'DateTime="2017-09-26T00:00:00" /></SYMBOLS>'
+        return RESPONSE.format(message='Success', token='', body=body)
+
+    def test_calls_wait_for_prefetch(self, service):
+        service.handler = self.handler
+        client = EodDataHttpClient('user', 'password', transport=service,
+                                   warm_up=['nasdaq'])
+        df = client.exchange_list(output_format='data-frame')
+        assert list(df.index) == ['NASDAQ']
+        assert client.country_list() == [('US', 'United States')]
+        assert [s.code for s in client.symbol_list('Nasdaq')] == ['MSFT']
+        endpoints = [c[0] for c in service.calls]
+        assert sorted(endpoints) == ['CountryList', 'ExchangeList', 'Login',
+                                     'SymbolList']
+        assert endpoints[0] == 'Login'
+        # prefetched results are used once
+        client.exchange_list()
+        assert [c[0] for c in service.calls].count('ExchangeList') == 2
+
+
+class TestCompactScanner(object):
+
+    def handler(self, endpoint, params):
+        if params['Token'] != 'T':
+            return RESPONSE.format(message='Invalid Token', token='', body='')
+        body = '<QUOTES2><QUOTE2 s="MSFT" d="2017-09-26T00:00:00" o="73.67" ' \
+               'h="73.81" l="72.99" c="73.26" v="18019500" i="0" b="0" ' \
+               'a="0" /><QUOTE2 s="AAPL" d="2017-09-26T00:00:00" o="1" ' \
+               'h="1" l="2" c="1" v="1" i="0" b="0" a="0" /></QUOTES2>'
+        return RESPONSE.format(message='Success', token='', body=body)
+
+    def test_quote_list_by_date_compact(self, client, service):
+        service.handler = self.handler
+        client._token = 'EXPIRED'
+        df = client.quote_list_by_date_compact(
+            'nasdaq', datetime.date(2017, 9, 26), output_format='data-frame'
+        )
+        assert list(df.index) == ['MSFT', 'AAPL']
+        assert df.loc['MSFT', 'Close'] == 73.26
+        assert client.last_validation_report.dropped == 0
+        assert [c[0] for c in service.calls] == [
+            'QuoteListByDate2', 'Login', 'QuoteListByDate2'
+        ]
+
+    def test_flagged_compact_quotes(self, service):
+        service.handler = self.handler
+        client = EodDataHttpClient('user', 'password', transport=service,
+                                   validation_mode=VALIDATION_FLAG)
+        quotes = client.quote_list_by_date_compact(
+            'nasdaq', datetime.date(2017, 9, 26)
+        )
+        assert [q.problems for q in quotes] == [(), (HIGH_BELOW_LOW,)]
+        client = EodDataHttpClient('user', 'password', transport=service,
+                                   validation_mode=VALIDATION_DROP)
+        df = client.quote_list_by_date_compact(
+            'nasdaq', datetime.date(2017, 9, 26), output_format='data-frame'
+        )
+        assert list(df.index) == ['MSFT']
+        assert 'Problems' not in df.columns
+
+
+class TestParseXml(object):
+
+    def test_encoding_from_xml_declaration(self, client):
+        response = FakeResponse(quotes_response(['NESN']).replace(
+            'NESN Inc', 'Nestlé'
+        ))
+        # text of a `text/xml` response without charset is decoded
+        # as ISO-8859-1 by requests
+        response.text = response.content.decode('iso-8859-1')
+        root = client.parse_xml(response)
+        assert root[0][0].attrib['Name'] == 'Nestlé'
+
+    def test_document_is_released_on_failure(self, client):
+        responses = [
+            FakeResponse(RESPONSE.format(message='Invalid Token', token='',
+                                         body='')),
+            FakeResponse(RESPONSE.format(message='Login Successful',
+                                         token=' Token="T"', body='')),
+            FakeResponse(RESPONSE.format(message='Invalid Symbol Code',
+                                         token='', body='')),
+        ]
+        for response in responses:
+            try:
+                client.process_response(response)
+            except InvalidSymbolCodeError:
+                pass
+            assert getattr(client._local, 'parsed', None) is None
+        # a successful response is parsed once for the endpoint
+        response = FakeResponse(quotes_response(['MSFT']))
+        assert client.process_response(response)
+        assert client._local.parsed[0] is response
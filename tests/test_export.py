@@ -0,0 +1,77 @@
+import datetime
+import threading
+
+import pandas as pd
+import pytest
+
+from eoddata_client import EodDataQuoteExtended
+from eoddata_client.eoddata_client import NoDataAvailableError, \
+    EodDataInternalServerError
+from eoddata_client.export import export_quotes, export_quotes_by_date
+
+
+def make_quotes(date, count=3):
+    return [EodDataQuoteExtended(
+        symbol='S{0}'.format(i), quote_datetime=datetime.datetime(
+            date.year, date.month, date.day),
+        open=1, high=2, low=0.5, close=1.5, volume=100, open_interest=0,
+        previous=1, change=0.5, bid=0, ask=0, modified=None
+    ) for i in range(count)]
+
+
+class FakeClient(object):
+
+    def __init__(self, holidays=()):
+        self.holidays = holidays
+        self.dates = []
+
+    def quote_list_by_date(self, exchange_code, date):
+        self.dates.append(date)
+        if date in self.holidays:
+            raise NoDataAvailableError
+        return make_quotes(date)
+
+
+class TestExport(object):
+
+    def test_csv(self, tmpdir):
+        path = str(tmpdir.join('quotes.csv'))
+        closure = datetime.date(2017, 9, 12)
+        client = FakeClient([closure])
+        stats = export_quotes_by_date(client, 'nasdaq',
+                                      datetime.date(2017, 9, 1),
+                                      datetime.date(2017, 9, 30), path,
+                                      chunk_rows=4)
+        # Labor Day is not requested
+        assert datetime.date(2017, 9, 4) not in client.dates
+        assert stats.skipped == [closure]
+        assert stats.responses == 19
+        df = pd.read_csv(path)
+        assert stats.rows == len(df) == 57
+        assert df['Datetime'].iloc[0] == '2017-09-01 00:00:00'
+        assert df['Datetime'].is_monotonic_increasing
+
+    def test_sequential(self, tmpdir):
+        path = str(tmpdir.join('quotes.csv'))
+        stats = export_quotes(make_quotes, [datetime.date(2017, 9, 1)], path,
+                              prefetch=0)
+        assert stats.rows == 3
+
+    def test_error_propagation(self, tmpdir):
+        def fetch(date):
+            if date.day == 3:
+                raise EodDataInternalServerError
+            return make_quotes(date)
+
+        dates = [datetime.date(2017, 9, day) for day in range(1, 10)]
+        threads = threading.active_count()
+        with pytest.raises(EodDataInternalServerError):
+            export_quotes(fetch, dates, str(tmpdir.join('quotes.csv')))
+        assert threading.active_count() == threads
+
+    def test_parquet(self, tmpdir):
+        pytest.importorskip('pyarrow')
+        path = str(tmpdir.join('quotes.parquet'))
+        export_quotes(make_quotes, [datetime.date(2017, 9, 1)], path,
+                      output_format='parquet', chunk_rows=2)
+        assert len(pd.read_parquet(path)) == 3
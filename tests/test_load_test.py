@@ -0,0 +1,33 @@
+import importlib.util
+import os
+
+import pytest
+
+LOAD_TEST_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                              'benchmarks', 'load_test.py')
+
+
+@pytest.fixture
+def load_test():
+    spec = importlib.util.spec_from_file_location('load_test',
+                                                  LOAD_TEST_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestLoadTest(object):
+
+    def test_smoke(self, load_test):
+        service = load_test.StubService().start()
+        try:
+            first = load_test.run_load(service, callers=4, duration=0.2)
+            second = load_test.run_load(service, callers=4, duration=0.2)
+        finally:
+            service.stop()
+        assert first['calls'] > 0 and not first['failed calls']
+        assert first['logins'] == 1
+        # counters of the second run do not include the first one
+        for report in (first, second):
+            assert sum(report['requests'].values()) == report['calls']
+            assert sum(report['responses'].values()) == report['calls']
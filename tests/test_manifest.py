@@ -0,0 +1,75 @@
+import datetime
+import os
+
+import pandas as pd
+
+from eoddata_client.cli import main, EXIT_OK, EXIT_PARTIAL_FAILURE
+from eoddata_client.manifest import Manifest, WorkItem, plan_quotes
+
+
+class FakeClient(object):
+
+    def login(self):
+        pass
+
+    def quote_list_by_date(self, exchange_code, date,
+                           output_format='entity-list'):
+        return pd.DataFrame({'Close': [1.0, 2.0]},
+                            index=pd.Index(['MSFT', 'AAPL'], name='Symbol'))
+
+    def symbol_history_period_by_range(self, exchange_code, symbol,
+                                       start_date, end_date, period,
+                                       output_format='entity-list'):
+        self.history_range = (start_date, end_date, period)
+        return pd.DataFrame({'Close': [1.0]})
+
+
+class TestManifest(object):
+
+    def test_shards_are_deterministic_and_complete(self):
+        manifest = plan_quotes(['nasdaq', 'nyse'], datetime.date(2017, 1, 1),
+                               datetime.date(2017, 12, 31))
+        # weekdays without 9 exchange holidays
+        assert len(manifest) == 2 * 251
+        shards = [manifest.shard(i, 4) for i in range(4)]
+        assert sorted(sum(shards, [])) == sorted(manifest.items)
+        assert all(shard for shard in shards)
+        assert plan_quotes(['nasdaq', 'nyse'], datetime.date(2017, 1, 1),
+                           datetime.date(2017, 12, 31)).shard(1, 4) == \
+            shards[1]
+
+    def test_intraday_history_without_end_date(self):
+        client = FakeClient()
+        item = WorkItem('history', 'NASDAQ', 'MSFT', '5')
+        item.fetch(client, start_date=datetime.date(2017, 9, 1))
+        assert client.history_range == (datetime.date(2017, 9, 1),
+                                        datetime.date.today(), '5')
+
+    def test_save_and_load(self, tmpdir):
+        path = str(tmpdir.join('manifest.json'))
+        manifest = Manifest([WorkItem('history', 'NASDAQ', 'MSFT', None)],
+                            start_date=datetime.date(1990, 1, 1))
+        manifest.save(path)
+        loaded = Manifest.load(path)
+        assert loaded.items == manifest.items
+        assert loaded.start_date == manifest.start_date
+        assert loaded.items[0].name == 'NASDAQ_MSFT'
+
+    def test_run_shards_and_merge(self, tmpdir):
+        path = str(tmpdir.join('manifest.json'))
+        plan_quotes(['nasdaq'], datetime.date(2017, 9, 18),
+                    datetime.date(2017, 9, 29)).save(path)
+        shard_dirs = []
+        for shard in range(3):
+            shard_dir = str(tmpdir.join('shard{0}'.format(shard)))
+            shard_dirs.append(shard_dir)
+            assert main(['-q', '-o', shard_dir, 'run', path, '--shard',
+                         str(shard), '--shards', '3'],
+                        client=FakeClient()) == EXIT_OK
+        merged = str(tmpdir.join('merged'))
+        assert main(['-o', merged, 'merge', path] + shard_dirs) == EXIT_OK
+        df = pd.read_csv(os.path.join(merged, 'NASDAQ.csv'), index_col=0)
+        assert len(df) == 20
+        assert df['Key'].iloc[0] == '2017-09-18'
+        assert main(['-o', merged, 'merge', path] + shard_dirs[:2]) == \
+            EXIT_PARTIAL_FAILURE
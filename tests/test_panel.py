@@ -0,0 +1,75 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from eoddata_client.eoddata_client import NoDataAvailableError
+from eoddata_client.panel import build_panel, fetch_panel
+
+
+def history(dates, closes):
+    return pd.DataFrame({'Close': closes, 'Volume': [100] * len(closes)},
+                        index=pd.to_datetime(dates))
+
+
+FRAMES = {
+    'MSFT': history(['2017-09-25', '2017-09-26', '2017-09-27'],
+                    [73.3, 73.3, 73.9]),
+    'AAPL': history(['2017-09-25', '2017-09-27'], [150.6, 154.2]),
+}
+
+
+class FakeClient(object):
+
+    def symbol_history_period_by_range(self, exchange_code, symbol,
+                                       start_date, end_date, period,
+                                       output_format='entity-list'):
+        if symbol not in FRAMES:
+            raise NoDataAvailableError
+        return FRAMES[symbol]
+
+
+class TestPanel(object):
+
+    def test_build_panel(self):
+        df = build_panel(FRAMES)
+        assert list(df.columns) == ['MSFT', 'AAPL']
+        assert len(df) == 3
+        assert np.isnan(df.loc['2017-09-26', 'AAPL'])
+        assert df.loc['2017-09-27', 'AAPL'] == 154.2
+
+    def test_fill(self):
+        df = build_panel(FRAMES, fill='ffill')
+        assert df.loc['2017-09-26', 'AAPL'] == 150.6
+        volume = build_panel(FRAMES, field='Volume', fill=0)
+        assert volume['AAPL'].tolist() == [100, 0, 100]
+
+    def test_dates_and_symbols(self):
+        dates, symbols, panel = build_panel(
+            FRAMES, symbols=['AAPL', 'IBM'],
+            dates=pd.bdate_range('2017-09-22', '2017-09-27'),
+            start_date=datetime.date(2017, 9, 25), output_format='array'
+        )
+        assert list(symbols) == ['AAPL', 'IBM']
+        assert panel.shape == (3, 2)
+        assert np.isnan(panel[:, 1]).all()
+
+    def test_long_frame(self):
+        long_df = pd.concat([FRAMES['MSFT'].assign(Symbol='MSFT'),
+                             FRAMES['AAPL'].assign(Symbol='AAPL')])
+        assert build_panel(long_df).equals(build_panel(FRAMES))
+
+    def test_fetch_panel(self):
+        df = fetch_panel(FakeClient(), 'nasdaq', ['aapl', 'msft'],
+                         datetime.date(2017, 9, 25),
+                         datetime.date(2017, 9, 27))
+        assert list(df.columns) == ['AAPL', 'MSFT']
+        assert df.shape == (3, 2)
+
+    def test_fetch_panel_symbol_without_data(self):
+        df = fetch_panel(FakeClient(), 'nasdaq', ['aapl', 'none', 'msft'],
+                         datetime.date(2017, 9, 25),
+                         datetime.date(2017, 9, 27))
+        assert list(df.columns) == ['AAPL', 'NONE', 'MSFT']
+        assert df['NONE'].isnull().all()
+        assert df['MSFT'].notnull().all()
@@ -0,0 +1,89 @@
+import asyncio
+import datetime
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from eoddata_client.pipeline import Pipeline, PipelineError, \
+    history_pipeline
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class FakeClient(object):
+
+    def __init__(self):
+        self.fetched = 0
+
+    def symbol_history_period_by_range(self, exchange_code, symbol,
+                                       start_date, end_date, period,
+                                       output_format='entity-list'):
+        self.fetched += 1
+        return pd.DataFrame({'Close': [1.0, 2.0]})
+
+
+class TestPipeline(object):
+
+    def test_stages(self):
+        async def double(item):
+            return item * 2
+
+        pipeline = Pipeline(queue_size=1)
+        pipeline.add_stage('square', lambda item: item * item, workers=3)
+        pipeline.add_stage('double', double, workers=2)
+        pipeline.add_stage('odd', lambda item: item if item % 4 else None)
+        assert sorted(run(pipeline.run(range(6)))) == [2, 18, 50]
+
+    def test_backpressure(self):
+        client = FakeClient()
+        written = []
+        in_flight = []
+
+        def write(symbol, df):
+            in_flight.append(client.fetched - len(written))
+            time.sleep(0.01)
+            written.append(symbol)
+
+        pipeline = history_pipeline(
+            client, 'nasdaq', datetime.date(2017, 1, 1),
+            datetime.date(2017, 2, 1), write,
+            transform=lambda symbol, df: df * 2, fetch_workers=4,
+            queue_size=2
+        )
+        run(pipeline.run(['S{0}'.format(i) for i in range(20)]))
+        assert len(written) == 20
+        # fetch workers + queued items + transform + write
+        assert max(in_flight) <= 4 + 2 + 1 + 2 + 1
+
+    def test_error_cancels_pipeline(self):
+        processed = []
+        lock = threading.Lock()
+
+        def fail(item):
+            if item == 3:
+                raise ValueError(item)
+            with lock:
+                processed.append(item)
+            return item
+
+        async def slow(item):
+            await asyncio.sleep(0.01)
+            return item
+
+        pipeline = Pipeline().add_stage('fail', fail, workers=2)\
+            .add_stage('slow', slow)
+        with pytest.raises(ValueError):
+            run(pipeline.run(range(1000)))
+        assert len(processed) < 20
+
+    def test_no_stages(self):
+        with pytest.raises(PipelineError):
+            run(Pipeline().run([1]))
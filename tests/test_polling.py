@@ -0,0 +1,66 @@
+import asyncio
+import datetime
+
+from eoddata_client import EodDataQuoteExtended, QuotePoller
+
+
+def make_quote(symbol, close, volume):
+    return EodDataQuoteExtended(
+        symbol=symbol, quote_datetime=datetime.datetime(2017, 9, 26),
+        open=1, high=2, low=0.5, close=close, volume=volume, open_interest=0,
+        previous=1, change=0, bid=0, ask=0,
+        modified=datetime.datetime(2017, 9, 26, 16)
+    )
+
+
+class FakeClient(object):
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def quote_list(self, exchange_code):
+        return self.responses.pop(0)
+
+    def quote_list_specific(self, exchange_code, symbols):
+        return [q for q in self.responses.pop(0) if q.symbol in symbols]
+
+
+RESPONSES = [
+    [make_quote('MSFT', 74.9, 100), make_quote('AAPL', 150.1, 200)],
+    [make_quote('MSFT', 74.9, 100), make_quote('AAPL', 150.1, 200)],
+    [make_quote('MSFT', 75.0, 150), make_quote('AAPL', 150.1, 200)],
+]
+
+
+class TestQuotePoller(object):
+
+    def test_run_emits_changed_quotes(self):
+        emitted = []
+        poller = QuotePoller(FakeClient(RESPONSES), 'nasdaq', interval=0.01)
+        poller.run(emitted.append, max_polls=3)
+        assert [[q.symbol for q in quotes] for quotes in emitted] == \
+            [['MSFT', 'AAPL'], ['MSFT']]
+
+    def test_specific_symbols(self):
+        poller = QuotePoller(FakeClient(RESPONSES), 'nasdaq',
+                             symbols=['AAPL'])
+        assert [q.symbol for q in poller.poll()] == ['AAPL']
+        assert poller.poll() == []
+
+    def test_async_iterator(self):
+        poller = QuotePoller(FakeClient(RESPONSES), 'nasdaq', interval=0.01)
+
+        async def collect():
+            result = []
+            async for quotes in poller:
+                result.append([q.symbol for q in quotes])
+                if len(result) == 2:
+                    break
+            return result
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(collect()) == [['MSFT', 'AAPL'],
+                                                          ['MSFT']]
+        finally:
+            loop.close()
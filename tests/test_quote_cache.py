@@ -0,0 +1,128 @@
+import datetime
+import threading
+
+from eoddata_client import QuoteCache
+from fakes import make_exchange
+
+
+class FakeClient(object):
+
+    def __init__(self):
+        self.last_trade_time = datetime.datetime(2017, 9, 26, 16)
+        self.exchange_calls = 0
+        self.quote_calls = 0
+
+    def exchange_detail(self, exchange_code):
+        self.exchange_calls += 1
+        return make_exchange(exchange_code, self.last_trade_time)
+
+    def quote_detail(self, exchange_code, symbol):
+        self.quote_calls += 1
+        return (exchange_code, symbol, self.quote_calls)
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestQuoteCache(object):
+
+    def setup_method(self, method):
+        self.client = FakeClient()
+        self.clock = Clock()
+        self.cache = QuoteCache(self.client, max_size=2, check_interval=30,
+                                clock=self.clock)
+
+    def test_repeated_reads_are_cached(self):
+        first = self.cache.quote_detail('nasdaq', 'msft')
+        assert self.cache.quote_detail('NASDAQ', 'MSFT') is first
+        assert self.client.quote_calls == 1
+        assert self.client.exchange_calls == 1
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+    def test_exchange_check_is_rate_limited(self):
+        self.cache.quote_detail('nasdaq', 'msft')
+        self.clock.now = 29
+        self.cache.quote_detail('nasdaq', 'msft')
+        assert self.client.exchange_calls == 1
+        self.clock.now = 30
+        self.cache.quote_detail('nasdaq', 'msft')
+        assert self.client.exchange_calls == 2
+        assert self.client.quote_calls == 1
+
+    def test_invalidated_when_exchange_advances(self):
+        self.cache.quote_detail('nasdaq', 'msft')
+        self.cache.quote_detail('nyse', 'ibm')
+        self.client.last_trade_time += datetime.timedelta(minutes=1)
+        self.clock.now = 30
+        self.cache.quote_detail('nasdaq', 'msft')
+        assert self.client.quote_calls == 3
+        assert self.cache.invalidations == 1
+        # other exchanges keep their quotes until checked
+        self.cache.update_exchange(
+            make_exchange('NYSE', datetime.datetime(2017, 9, 26, 16))
+        )
+        self.cache.quote_detail('nyse', 'ibm')
+        assert self.client.quote_calls == 3
+
+    def test_least_recently_used_evicted(self):
+        self.cache.quote_detail('nasdaq', 'msft')
+        self.cache.quote_detail('nasdaq', 'aapl')
+        self.cache.quote_detail('nasdaq', 'msft')
+        self.cache.quote_detail('nasdaq', 'amzn')
+        assert len(self.cache) == 2
+        self.cache.quote_detail('nasdaq', 'msft')
+        assert self.client.quote_calls == 3
+        self.cache.quote_detail('nasdaq', 'aapl')
+        assert self.client.quote_calls == 4
+
+    def test_failed_check_keeps_cache(self):
+        self.cache.quote_detail('nasdaq', 'msft')
+
+        def fail(exchange_code):
+            raise RuntimeError('down')
+
+        self.client.exchange_detail = fail
+        self.clock.now = 30
+        self.cache.quote_detail('nasdaq', 'msft')
+        assert self.client.quote_calls == 1
+
+    def test_not_cached_without_last_trade_time(self):
+        check = self.client.exchange_detail
+
+        def fail(exchange_code):
+            raise RuntimeError('down')
+
+        self.client.exchange_detail = fail
+        self.cache.quote_detail('nasdaq', 'msft')
+        self.cache.quote_detail('nasdaq', 'msft')
+        assert self.client.quote_calls == 2
+        assert len(self.cache) == 0
+        # the first successful check is the baseline
+        self.client.exchange_detail = check
+        self.clock.now = 30
+        self.cache.quote_detail('nasdaq', 'msft')
+        self.cache.quote_detail('nasdaq', 'msft')
+        assert self.client.quote_calls == 3
+        self.client.last_trade_time += datetime.timedelta(minutes=1)
+        self.clock.now = 60
+        self.cache.quote_detail('nasdaq', 'msft')
+        assert self.client.quote_calls == 4
+        assert self.cache.invalidations == 1
+
+    def test_exchanges_are_checked_independently(self):
+        self.cache.update_exchange(
+            make_exchange('NYSE', datetime.datetime(2017, 9, 26, 16))
+        )
+        # a check of another exchange is in progress
+        with self.cache._check_locks.setdefault('NYSE',
+                                                threading.Lock()):
+            self.cache.quote_detail('nasdaq', 'msft')
+        assert self.client.exchange_calls == 1
+        self.cache.quote_detail('nasdaq', 'msft')
+        assert self.client.quote_calls == 1
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eoddata_client import EodDataExchange
+from eoddata_client.resampling import resample_all, resample_quotes, \
+    ResamplingError
+
+
+def minute_quotes(symbols=('MSFT',)):
+    index = pd.date_range('2017-09-25 09:30', '2017-09-26 15:59', freq='min')
+    index = index[(index.time >= pd.Timestamp('09:30').time()) &
+                  (index.time < pd.Timestamp('16:00').time())]
+    frames = []
+    for symbol in symbols:
+        close = np.arange(len(index), dtype=float)
+        frames.append(pd.DataFrame({
+            'Symbol': symbol, 'Open': close, 'High': close + 1,
+            'Low': close - 1, 'Close': close, 'Volume': 10
+        }, index=index))
+    return pd.concat(frames).sort_index()
+
+
+class TestResampling(object):
+
+    def test_five_minutes(self):
+        df = resample_quotes(minute_quotes(), '5')
+        first = df.iloc[0]
+        assert df.index[0] == pd.Timestamp('2017-09-25 09:30')
+        assert (first['Open'], first['High'], first['Low'], first['Close'],
+                first['Volume']) == (0, 5, -1, 4, 50)
+        assert len(df) == 2 * 78
+
+    def test_daily_multiple_symbols(self):
+        df = resample_quotes(minute_quotes(('MSFT', 'AAPL')), 'd')
+        assert len(df) == 4
+        assert set(df['Symbol']) == {'MSFT', 'AAPL'}
+        day = df[df['Symbol'] == 'MSFT'].iloc[1]
+        assert day['Open'] == 390 and day['Close'] == 779
+        assert day['Volume'] == 3900
+
+    def test_exchange_timezone(self):
+        quotes = minute_quotes()
+        quotes.index = quotes.index.tz_localize('America/New_York')\
+            .tz_convert('UTC')
+        exchange = EodDataExchange('NASDAQ', 'NASDAQ', None, 'US', 'USD',
+                                   0, 0, 'Eastern Standard Time')
+        df = resample_quotes(quotes, 'd', timezone=exchange)
+        assert len(df) == 2
+        assert str(df.index.tz) == 'America/New_York'
+
+    def test_all_periods(self):
+        resampled = resample_all(minute_quotes())
+        assert sorted(resampled) == sorted(['5', '10', '15', '30', 'h', 'd',
+                                            'w', 'm'])
+        assert len(resampled['w']) == 1
+        assert resampled['m'].iloc[0]['Volume'] == 7800
+
+    def test_unknown_period(self):
+        with pytest.raises(ResamplingError):
+            resample_quotes(minute_quotes(), 'y')
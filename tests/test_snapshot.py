@@ -0,0 +1,77 @@
+import datetime
+
+import pandas as pd
+import requests
+
+from eoddata_client import MarketSnapshot
+from eoddata_client.eoddata_client import NoDataAvailableError
+from fakes import make_exchange
+
+
+class FakeClient(object):
+
+    def __init__(self, exchanges, failing=(), timing_out=()):
+        self.exchanges = exchanges
+        self.failing = failing
+        self.timing_out = timing_out
+        self.requested = []
+
+    def exchange_list(self):
+        return self.exchanges
+
+    def quote_list(self, exchange_code, output_format='entity-list'):
+        self.requested.append(exchange_code)
+        if exchange_code in self.failing:
+            raise NoDataAvailableError
+        if exchange_code in self.timing_out:
+            raise requests.Timeout
+        return pd.DataFrame({'Close': [1.0, 2.0]},
+                            index=pd.Index(['A', 'B'], name='Symbol'))
+
+
+class TestMarketSnapshot(object):
+
+    def test_take(self):
+        now = datetime.datetime(2017, 9, 26, 16)
+        client = FakeClient([make_exchange('NASDAQ', now),
+                             make_exchange('NYSE', now)])
+        df = MarketSnapshot(client).take()
+        assert sorted(client.requested) == ['NASDAQ', 'NYSE']
+        assert list(df.index.names) == ['Exchange', 'Symbol']
+        assert df.loc[('NYSE', 'B'), 'Close'] == 2.0
+
+    def test_unchanged_exchanges_are_skipped(self):
+        now = datetime.datetime(2017, 9, 26, 16)
+        client = FakeClient([make_exchange('NASDAQ', now),
+                             make_exchange('NYSE', now)])
+        snapshot = MarketSnapshot(client)
+        snapshot.take()
+        client.requested = []
+        client.exchanges[1] = make_exchange('NYSE', now.replace(hour=17))
+        df = snapshot.take()
+        assert client.requested == ['NYSE']
+        assert len(df) == 4
+
+    def test_selected_exchanges_and_failures(self):
+        now = datetime.datetime(2017, 9, 26, 16)
+        client = FakeClient([make_exchange('NASDAQ', now),
+                             make_exchange('NYSE', now),
+                             make_exchange('AMEX', now)], failing=['AMEX'])
+        snapshot = MarketSnapshot(client, exchange_codes=['nyse', 'amex'])
+        df = snapshot.take()
+        assert sorted(client.requested) == ['AMEX', 'NYSE']
+        assert set(df.index.get_level_values('Exchange')) == {'NYSE'}
+        client.requested = []
+        snapshot.take()
+        assert client.requested == ['AMEX']
+
+    def test_request_errors(self):
+        now = datetime.datetime(2017, 9, 26, 16)
+        client = FakeClient([make_exchange('NASDAQ', now),
+                             make_exchange('NYSE', now)],
+                            timing_out=['NYSE'])
+        snapshot = MarketSnapshot(client)
+        df = snapshot.take()
+        assert set(df.index.get_level_values('Exchange')) == {'NASDAQ'}
+        assert list(snapshot.failures) == ['NYSE']
+        assert isinstance(snapshot.failures['NYSE'], requests.Timeout)
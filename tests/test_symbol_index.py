@@ -0,0 +1,55 @@
+from eoddata_client import EodDataSymbol, EodDataSymbolCompact
+from eoddata_client.symbol_index import SymbolIndex
+
+SYMBOL_LISTS = {
+    'nasdaq': [EodDataSymbol('MSFT', 'Microsoft Corp', 'Microsoft Corporation'),
+               EodDataSymbol('MSTR', 'Microstrategy', 'MicroStrategy Inc'),
+               EodDataSymbol('AAPL', 'Apple Inc', 'Apple Inc.')],
+    'nyse': [EodDataSymbolCompact('IBM', 'International Business Machines'),
+             EodDataSymbolCompact('MS', 'Morgan Stanley')],
+}
+
+
+class TestSymbolIndex(object):
+
+    def test_lookup(self):
+        index = SymbolIndex.from_symbol_lists(SYMBOL_LISTS)
+        assert len(index) == 5
+        match, = index.lookup('msft')
+        assert (match.exchange, match.name) == ('NASDAQ', 'Microsoft Corp')
+        assert index.lookup('msft', exchange='nyse') == []
+        assert index.lookup('XXX') == []
+
+    def test_prefix(self):
+        index = SymbolIndex.from_symbol_lists(SYMBOL_LISTS)
+        assert [m.code for m in index.prefix('ms')] == ['MS', 'MSFT', 'MSTR']
+        assert [m.code for m in index.prefix('ms', limit=1)] == ['MS']
+
+    def test_search(self):
+        index = SymbolIndex.from_symbol_lists(SYMBOL_LISTS)
+        assert [m.code for m in index.search('micro')] == ['MSTR', 'MSFT']
+        assert [m.code for m in index.search('Micro Corp')] == ['MSFT']
+        assert [m.code for m in index.search('business mach')] == ['IBM']
+        assert index.search('nothing') == []
+
+    def test_search_code(self):
+        index = SymbolIndex.from_symbol_lists(SYMBOL_LISTS)
+        # code matches that are not name matches
+        assert [m.code for m in index.search('ibm')] == ['IBM']
+        assert [m.code for m in index.search('ms')] == ['MS']
+
+    def test_search_many_tokens(self):
+        symbols = [EodDataSymbolCompact('S{0}'.format(i),
+                                        'Alpha{0:03d} Corp'.format(i))
+                   for i in range(100)]
+        symbols.append(EodDataSymbolCompact('Z', 'Alpha999 Zeta'))
+        index = SymbolIndex.from_symbol_lists({'nyse': symbols})
+        assert [m.code for m in index.search('alpha zeta')] == ['Z']
+        assert len(index.search('alpha', limit=200)) == 101
+
+    def test_save_and_load(self, tmpdir):
+        path = str(tmpdir.join('symbols.json.gz'))
+        SymbolIndex.from_symbol_lists(SYMBOL_LISTS).save(path)
+        index = SymbolIndex.load(path)
+        assert [m.code for m in index.search('stanley')] == ['MS']
+        assert index.lookup('aapl')[0].long_name == 'Apple Inc.'
@@ -0,0 +1,62 @@
+import datetime
+
+import pandas as pd
+
+from eoddata_client.trading_calendar import fill_history_gaps, \
+    missing_dates, missing_ranges, trading_days
+
+
+class FakeClient(object):
+
+    def __init__(self):
+        self.ranges = []
+
+    def symbol_history_period_by_range(self, exchange_code, symbol,
+                                       start_date, end_date, period,
+                                       output_format='entity-list'):
+        self.ranges.append((start_date, end_date))
+        index = trading_days(start_date, end_date, exchange_code)
+        return pd.DataFrame({'Close': 1.0}, index=index)
+
+
+class TestTradingCalendar(object):
+
+    def test_trading_days(self):
+        days = trading_days(datetime.date(2017, 12, 22),
+                            datetime.date(2018, 1, 3), 'nasdaq')
+        assert [d.day for d in days] == [22, 26, 27, 28, 29, 2, 3]
+        # Good Friday is an exchange holiday
+        assert pd.Timestamp('2017-04-14') not in trading_days(
+            datetime.date(2017, 4, 10), datetime.date(2017, 4, 17), 'nyse')
+        # other exchanges trade on weekdays
+        assert len(trading_days(datetime.date(2017, 12, 22),
+                                datetime.date(2018, 1, 3), 'lse')) == 9
+
+    def test_missing_dates_and_ranges(self):
+        held = pd.to_datetime(['2017-09-05 09:30', '2017-09-05 09:31',
+                               '2017-09-06 00:00', '2017-09-11 00:00',
+                               '2017-09-14 16:00'])
+        missing = missing_dates(held, datetime.date(2017, 9, 1),
+                                datetime.date(2017, 9, 15), 'nasdaq')
+        # Labor Day (2017-09-04) is not missing
+        assert [d.day for d in missing] == [1, 7, 8, 12, 13, 15]
+        assert missing_ranges(missing, 'nasdaq') == [
+            (datetime.date(2017, 9, 1), datetime.date(2017, 9, 1)),
+            (datetime.date(2017, 9, 7), datetime.date(2017, 9, 8)),
+            (datetime.date(2017, 9, 12), datetime.date(2017, 9, 13)),
+            (datetime.date(2017, 9, 15), datetime.date(2017, 9, 15)),
+        ]
+
+    def test_fill_history_gaps(self):
+        client = FakeClient()
+        held = trading_days(datetime.date(2017, 8, 28),
+                            datetime.date(2017, 9, 29), 'nasdaq')
+        df = pd.DataFrame({'Close': 1.0}, index=held.delete([5, 6, 12]))
+        filled = fill_history_gaps(client, 'nasdaq', 'msft', df,
+                                   datetime.date(2017, 8, 28),
+                                   datetime.date(2017, 9, 29))
+        assert client.ranges == [
+            (datetime.date(2017, 9, 5), datetime.date(2017, 9, 6)),
+            (datetime.date(2017, 9, 14), datetime.date(2017, 9, 14)),
+        ]
+        assert filled.index.equals(held)
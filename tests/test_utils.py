@@ -0,0 +1,11 @@
+from eoddata_client.utils import split_symbols
+
+
+def test_split_symbols():
+    symbols = ['MSFT', 'AMZN', 'AAPL', 'BRK.A']
+    assert split_symbols(symbols, 1500) == [symbols]
+    # MSFT%2CAMZN is 11 characters long
+    assert split_symbols(symbols, 11) == [['MSFT', 'AMZN'], ['AAPL'],
+                                          ['BRK.A']]
+    assert split_symbols(symbols, 1) == [[s] for s in symbols]
+    assert split_symbols([], 10) == []
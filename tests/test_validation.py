@@ -0,0 +1,96 @@
+import xml.etree.ElementTree as ET
+
+from eoddata_client.validation import validate_quotes, \
+    QUOTE_COMPACT_SCHEMA, VALIDATION_DROP, VALIDATION_FLAG, VALIDATION_KEEP, \
+    INVALID_MODIFIED, \
+    MISSING_ATTRIBUTE, NOT_NUMERIC, INVALID_DATETIME, HIGH_BELOW_LOW, \
+    NEGATIVE_VOLUME, DUPLICATE_DATETIME, ValidationReport
+
+QUOTES = [
+    '<q s="A" d="2017-09-25T00:00:00" o="1" h="2" l="1" c="1" v="5" i="0" '
+    'b="0" a="0" />',
+    # duplicate datetime of A
+    '<q s="A" d="2017-09-25T00:00:00" o="1" h="2" l="1" c="1" v="5" i="0" '
+    'b="0" a="0" />',
+    # missing close
+    '<q s="B" d="2017-09-25T00:00:00" o="1" h="2" l="1" v="5" i="0" '
+    'b="0" a="0" />',
+    # not numeric open
+    '<q s="C" d="2017-09-25T00:00:00" o="n/a" h="2" l="1" c="1" v="5" '
+    'i="0" b="0" a="0" />',
+    # high below low and negative volume
+    '<q s="D" d="2017-09-25T00:00:00" o="1" h="1" l="2" c="1" v="-5" '
+    'i="0" b="0" a="0" />',
+    # invalid datetime
+    '<q s="E" d="yesterday" o="1" h="2" l="1" c="1" v="5" i="0" b="0" '
+    'a="0" />',
+]
+
+
+class TestValidateQuotes(object):
+
+    def test_drop(self):
+        elements = [ET.fromstring(quote) for quote in QUOTES]
+        keep, report = validate_quotes(elements, QUOTE_COMPACT_SCHEMA,
+                                       mode=VALIDATION_DROP)
+        assert keep.tolist() == [True, False, False, False, False, False]
+        assert report.dropped == 5
+        assert report.problems == {}
+        assert report.dropped_problems == {
+            DUPLICATE_DATETIME: 1, MISSING_ATTRIBUTE: 1, NOT_NUMERIC: 1,
+            HIGH_BELOW_LOW: 1, NEGATIVE_VOLUME: 1, INVALID_DATETIME: 1,
+        }
+
+    def test_keep_by_default(self):
+        elements = [ET.fromstring(quote) for quote in QUOTES]
+        keep, report = validate_quotes(elements, QUOTE_COMPACT_SCHEMA)
+        assert keep.tolist() == [True, True, False, False, True, False]
+        assert report.dropped == 3
+        # indices of returned rows
+        assert {problem: rows.tolist()
+                for problem, rows in report.problems.items()} == {
+            DUPLICATE_DATETIME: [1], HIGH_BELOW_LOW: [2],
+            NEGATIVE_VOLUME: [2],
+        }
+        assert report.row_problems(3) == [
+            (), (DUPLICATE_DATETIME,), (HIGH_BELOW_LOW, NEGATIVE_VOLUME)
+        ]
+
+    def test_flag(self):
+        elements = [ET.fromstring(quote) for quote in QUOTES]
+        keep, report = validate_quotes(elements, QUOTE_COMPACT_SCHEMA,
+                                       mode=VALIDATION_FLAG)
+        assert keep.tolist() == [True, True, False, False, True, False]
+        assert report.dropped == 3
+        assert report.count(NEGATIVE_VOLUME) == 1
+
+    def test_merge(self):
+        elements = [ET.fromstring(quote) for quote in QUOTES]
+        _, first = validate_quotes(elements, QUOTE_COMPACT_SCHEMA)
+        _, second = validate_quotes(elements[4:5], QUOTE_COMPACT_SCHEMA)
+        # returned rows of the first report are shifted, the duplicate
+        # is not in the combined result
+        report = ValidationReport.merge([(first, [1, -1, 2]),
+                                         (second, [0])])
+        assert report.total == 7 and report.dropped == 3
+        assert report.problems[NEGATIVE_VOLUME].tolist() == [0, 2]
+        assert DUPLICATE_DATETIME not in report.problems
+        assert report.count(MISSING_ATTRIBUTE) == 1
+
+    def test_empty(self):
+        keep, report = validate_quotes([])
+        assert len(keep) == 0 and report.ok
+
+    def test_modified(self):
+        quote = '<QUOTE Symbol="{0}" Description="" Name="" ' \
+                'DateTime="2017-09-26T00:00:00" Open="1" High="2" ' \
+                'Low="0.5" Close="1" Volume="100" OpenInterest="0" ' \
+                'Previous="1" Change="0" Bid="0" Ask="0" PreviousClose="1" ' \
+                'NextOpen="0" Modified="{1}" />'
+        elements = [ET.fromstring(quote.format('A', '2017-09-26T16:00:00')),
+                    ET.fromstring(quote.format('B', 'n/a'))]
+        # rows with invalid modification datetime can not be parsed
+        for mode in (VALIDATION_KEEP, VALIDATION_FLAG, VALIDATION_DROP):
+            keep, report = validate_quotes(elements, mode=mode)
+            assert keep.tolist() == [True, False]
+            assert report.dropped_problems == {INVALID_MODIFIED: 1}
@@ -0,0 +1,42 @@
+import pytest
+
+from eoddata_client import EodDataHttpClient
+from eoddata_client.business_entities import EodDataQuoteExtended
+from eoddata_client.xml_parsing import StdlibXmlBackend, XmlBackendError, \
+    get_xml_backend, lxml_etree
+
+RESPONSE = '<?xml version="1.0" encoding="utf-8"?>' \
+           '<RESPONSE Message="Success" xmlns="http://ws.eoddata.com/Data">' \
+           '<!-- comment --><QUOTES><QUOTE Symbol="MSFT" Name="Microsoft" ' \
+           'Description="Microsoft Corp" DateTime="2017-09-26T00:00:00" ' \
+           'Open="73.67" High="73.81" Low="72.99" Close="73.26" ' \
+           'Volume="18019500" OpenInterest="0" Previous="73.26" Change="0" ' \
+           'Bid="0" Ask="0" PreviousClose="73.26" NextOpen="0" ' \
+           'Modified="2017-09-26T16:00:00" /></QUOTES></RESPONSE>'
+
+
+class TestXmlBackends(object):
+
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv('EODDATA_CLIENT_XML_BACKEND', raising=False)
+        assert isinstance(get_xml_backend(), StdlibXmlBackend)
+        monkeypatch.setenv('EODDATA_CLIENT_XML_BACKEND', 'auto')
+        expected = 'stdlib' if lxml_etree is None else 'lxml'
+        assert get_xml_backend().name == expected
+        assert EodDataHttpClient('user', 'password').xml_backend.name \
+            == expected
+
+    def test_unknown(self):
+        with pytest.raises(XmlBackendError):
+            get_xml_backend('sax')
+
+    @pytest.mark.parametrize('name', ['stdlib', 'lxml'])
+    def test_entities(self, name):
+        if name == 'lxml':
+            pytest.importorskip('lxml')
+        root = get_xml_backend(name).fromstring(RESPONSE)
+        assert root.attrib['Message'] == 'Success'
+        quotes_xml = [el for el in list(root) if el.tag.endswith('QUOTES')][0]
+        quote = EodDataQuoteExtended.from_xml(list(quotes_xml)[0])
+        assert (quote.symbol, quote.close, quote.volume) \
+            == ('MSFT', 73.26, 18019500)